@@ -0,0 +1,77 @@
+"""
+Benchmark de la caché de disponibilidad
+---------------------------------------
+Simula la navegación repetida de un calendario: se consulta la
+disponibilidad de E espacios durante D días varias veces, con y sin caché,
+sobre un archivo con N reservaciones. Entre recorridos se agrega una
+reservación, que invalida solo su espacio y fecha; solo se mide el tiempo
+de las consultas.
+
+Uso:
+    python benchmarks/cache_disponibilidad.py [N] [ESPACIOS] [DIAS]
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelo.Espacios import Salon
+from modelo.GestorReservaciones1 import GestorReservaciones
+from modelo.Horarios import Horario
+from modelo.Reservaciones import Reservacion
+from modelo.Usuarios import Profesor
+from parseo_horarios import crear_registros
+
+RECORRIDOS = 10
+
+
+def medir(n: int, num_espacios: int, dias: int, capacidad: int) -> None:
+    # Cada medición parte de su propio archivo: las reservaciones agregadas se guardan
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo = os.path.join(directorio, "reservas.json")
+        with open(archivo, 'w', encoding='utf-8') as f:
+            json.dump(crear_registros(n), f, ensure_ascii=False)
+        gestor = GestorReservaciones(archivo, capacidad_cache_disponibilidad=capacidad)
+        _recorrer(gestor, num_espacios, dias, capacidad)
+
+
+def _recorrer(gestor, num_espacios: int, dias: int, capacidad: int) -> None:
+    espacios = [Salon(f"S{i:03d}", 30) for i in range(num_espacios)]
+    fechas = [(date(2025, 3, 3) + timedelta(days=d)).strftime("%Y-%m-%d") for d in range(dias)]
+    profesor = Profesor("Profesor calendario", "Facultad de Ingeniería")
+
+    duracion = 0.0
+    for recorrido in range(RECORRIDOS):
+        inicio = perf_counter()
+        for espacio in espacios:
+            for fecha in fechas:
+                gestor.obtener_disponibilidad(espacio, fecha)
+        duracion += perf_counter() - inicio
+        # Franja libre en los datos generados (terminan a las 21:00)
+        with contextlib.redirect_stdout(io.StringIO()):
+            gestor.agregar_reservacion(Reservacion(
+                profesor, espacios[recorrido % num_espacios],
+                Horario(fechas[recorrido % dias], "21:00", "21:30"), "clase"
+            ))
+
+    consultas = RECORRIDOS * num_espacios * dias
+    estadisticas = gestor.estadisticas_cache_disponibilidad()
+    etiqueta = f"caché {capacidad}" if capacidad else "sin caché"
+    print(f"{etiqueta:>12}: {duracion * 1e6 / consultas:.2f} us/consulta, "
+          f"aciertos {estadisticas['aciertos']}, fallos {estadisticas['fallos']}, "
+          f"invalidaciones {estadisticas['invalidaciones']}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_espacios = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    dias = int(sys.argv[3]) if len(sys.argv) > 3 else 30
+    medir(n, num_espacios, dias, 0)
+    medir(n, num_espacios, dias, 4096)
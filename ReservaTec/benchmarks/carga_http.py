@@ -0,0 +1,198 @@
+"""
+Generador de carga HTTP
+-----------------------
+Envía solicitudes al servicio HTTP/JSON (servicio/servidor_http.py) desde
+varias conexiones persistentes concurrentes y reporta solicitudes por
+segundo y la latencia p50/p90/p99.
+
+La mezcla por defecto es de solo lectura (disponibilidad y búsqueda de
+espacios). Con --usuario y --crear una fracción de las solicitudes crea
+reservaciones como ese usuario (modifica los datos del servidor).
+
+Uso:
+    python benchmarks/carga_http.py [--host H] [--puerto P] [--conexiones C]
+                                    [--solicitudes N] [--usuario ID --crear 0.1]
+    python benchmarks/carga_http.py --iniciar   # levanta un servidor local en otro hilo
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+from datetime import date, timedelta
+from time import perf_counter
+from urllib.parse import urlencode
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class Conexion:
+    """Conexión HTTP/1.1 persistente mínima"""
+
+    def __init__(self, host: str, puerto: int):
+        self.host = host
+        self.puerto = puerto
+        self.lector = None
+        self.escritor = None
+
+    async def abrir(self) -> None:
+        self.lector, self.escritor = await asyncio.open_connection(self.host, self.puerto)
+
+    async def solicitar(self, metodo: str, ruta: str, datos=None, token: str = None) -> tuple:
+        """
+        Returns:
+            tuple: (estado HTTP, datos JSON de la respuesta)
+        """
+        cuerpo = json.dumps(datos).encode("utf-8") if datos is not None else b""
+        encabezados = [f"{metodo} {ruta} HTTP/1.1", f"Host: {self.host}", f"Content-Length: {len(cuerpo)}"]
+        if datos is not None:
+            encabezados.append("Content-Type: application/json")
+        if token:
+            encabezados.append(f"Authorization: Bearer {token}")
+        self.escritor.write(("\r\n".join(encabezados) + "\r\n\r\n").encode("latin-1") + cuerpo)
+        await self.escritor.drain()
+
+        estado = int((await self.lector.readline()).split()[1])
+        longitud = 0
+        while True:
+            linea = await self.lector.readline()
+            if linea in (b"\r\n", b""):
+                break
+            nombre, _, valor = linea.decode("latin-1").partition(":")
+            if nombre.strip().lower() == "content-length":
+                longitud = int(valor)
+        respuesta = await self.lector.readexactly(longitud)
+        return estado, json.loads(respuesta) if respuesta else None
+
+    def cerrar(self) -> None:
+        if self.escritor is not None:
+            self.escritor.close()
+
+
+def percentil(valores: list, p: float) -> float:
+    if not valores:
+        return 0.0
+    return valores[min(len(valores) - 1, int(len(valores) * p / 100))]
+
+
+async def generar_carga(host: str, puerto: int, conexiones: int, solicitudes: int,
+                        usuario: str = None, fraccion_crear: float = 0.0) -> dict:
+    descubrimiento = Conexion(host, puerto)
+    await descubrimiento.abrir()
+    _, espacios = await descubrimiento.solicitar("GET", "/espacios")
+    token = None
+    if usuario and fraccion_crear > 0:
+        estado, respuesta = await descubrimiento.solicitar("POST", "/sesiones", {"id_usuario": usuario})
+        if estado != 201:
+            raise SystemExit(f"No se pudo iniciar sesión como {usuario}: {respuesta}")
+        token = respuesta["token"]
+    descubrimiento.cerrar()
+    nombres = [e["nombre"] for e in espacios] or ["A101"]
+
+    hoy = date.today()
+    latencias = []
+    estados = {}
+    restantes = [solicitudes]
+
+    def siguiente_solicitud(aleatorio: random.Random) -> tuple:
+        fecha = (hoy + timedelta(days=aleatorio.randrange(1, 180))).strftime("%Y-%m-%d")
+        hora = aleatorio.randrange(7, 20)
+        if token and aleatorio.random() < fraccion_crear:
+            return "POST", "/reservaciones", {
+                "espacio": aleatorio.choice(nombres), "fecha": fecha,
+                "hora_inicio": f"{hora:02d}:00", "hora_fin": f"{hora + 1:02d}:00",
+                "tipo_evento": "reunión", "descripcion": "carga",
+            }
+        if aleatorio.random() < 0.5:
+            return "GET", "/disponibilidad?" + urlencode({"espacio": aleatorio.choice(nombres), "fecha": fecha}), None
+        return "GET", "/espacios?" + urlencode({
+            "capacidad": aleatorio.choice((0, 10, 30)), "fecha": fecha,
+            "hora_inicio": f"{hora:02d}:00", "hora_fin": f"{hora + 1:02d}:00",
+        }), None
+
+    async def cliente(numero: int) -> None:
+        aleatorio = random.Random(numero)
+        conexion = Conexion(host, puerto)
+        await conexion.abrir()
+        try:
+            while restantes[0] > 0:
+                restantes[0] -= 1
+                metodo, ruta, datos = siguiente_solicitud(aleatorio)
+                inicio = perf_counter()
+                try:
+                    estado, _ = await conexion.solicitar(metodo, ruta, datos, token)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    estado = "conexión"
+                    conexion.cerrar()
+                    conexion = Conexion(host, puerto)
+                    await conexion.abrir()
+                latencias.append(perf_counter() - inicio)
+                estados[estado] = estados.get(estado, 0) + 1
+        finally:
+            conexion.cerrar()
+
+    inicio = perf_counter()
+    await asyncio.gather(*(cliente(i) for i in range(conexiones)))
+    duracion = perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "solicitudes": len(latencias),
+        "duracion_s": duracion,
+        "solicitudes_por_segundo": len(latencias) / duracion,
+        "p50_ms": percentil(latencias, 50) * 1000,
+        "p90_ms": percentil(latencias, 90) * 1000,
+        "p99_ms": percentil(latencias, 99) * 1000,
+        "max_ms": latencias[-1] * 1000 if latencias else 0.0,
+        "estados": estados,
+    }
+
+
+def iniciar_servidor_local(hilos: int) -> tuple:
+    """Levanta el servicio en un hilo con su propio ciclo de eventos; devuelve (host, puerto)"""
+    from controlador.controlador_tec import ControladorTec
+    from servicio.servidor_http import ServidorReservaciones
+
+    servidor = ServidorReservaciones(ControladorTec(concurrente=True), "127.0.0.1", 0, hilos)
+    listo = threading.Event()
+
+    async def ejecutar():
+        await servidor.iniciar()
+        listo.set()
+        await servidor.servir()
+
+    threading.Thread(target=lambda: asyncio.run(ejecutar()), daemon=True).start()
+    listo.wait()
+    return servidor.host, servidor.puerto
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generador de carga del servicio ReservaTec")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8080)
+    parser.add_argument("--conexiones", type=int, default=16)
+    parser.add_argument("--solicitudes", type=int, default=5000)
+    parser.add_argument("--usuario", help="ID del usuario con el que se crean reservaciones")
+    parser.add_argument("--crear", type=float, default=0.0, help="Fracción de solicitudes de creación")
+    parser.add_argument("--iniciar", action="store_true", help="Levantar un servidor local en este proceso")
+    parser.add_argument("--hilos", type=int, default=8, help="Hilos del servidor local")
+    argumentos = parser.parse_args()
+
+    host, puerto = argumentos.host, argumentos.puerto
+    if argumentos.iniciar:
+        host, puerto = iniciar_servidor_local(argumentos.hilos)
+
+    resultado = asyncio.run(generar_carga(host, puerto, argumentos.conexiones, argumentos.solicitudes,
+                                          argumentos.usuario, argumentos.crear))
+    print(f"{resultado['solicitudes']} solicitudes en {resultado['duracion_s']:.2f} s "
+          f"con {argumentos.conexiones} conexiones: {resultado['solicitudes_por_segundo']:.0f} solicitudes/s")
+    print(f"latencia p50 {resultado['p50_ms']:.2f} ms, p90 {resultado['p90_ms']:.2f} ms, "
+          f"p99 {resultado['p99_ms']:.2f} ms, máx. {resultado['max_ms']:.2f} ms")
+    print("estados:", ", ".join(f"{estado}: {n}" for estado, n in sorted(resultado["estados"].items(), key=str)))
+
+
+if __name__ == "__main__":
+    main()
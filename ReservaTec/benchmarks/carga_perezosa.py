@@ -0,0 +1,53 @@
+"""
+Benchmark de carga perezosa
+---------------------------
+Mide el tiempo de arranque del gestor con N reservaciones en el archivo JSON
+y el costo de hidratar después todas las reservaciones (lo que antes se
+hacía siempre al arrancar).
+
+Uso:
+    python benchmarks/carga_perezosa.py [N ...]
+"""
+
+import json
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelo.GestorReservaciones1 import GestorReservaciones
+from parseo_horarios import crear_registros
+
+
+def medir(n: int) -> None:
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo = os.path.join(directorio, "reservas.json")
+        with open(archivo, 'w', encoding='utf-8') as f:
+            json.dump(crear_registros(n), f, ensure_ascii=False)
+        tamano = os.path.getsize(archivo) / 2 ** 20
+
+        inicio = perf_counter()
+        with open(archivo, 'r', encoding='utf-8') as f:
+            json.load(f)
+        lectura = perf_counter() - inicio
+
+        inicio = perf_counter()
+        gestor = GestorReservaciones(archivo)
+        arranque = perf_counter() - inicio
+        estadisticas = gestor.estadisticas_hidratacion()
+
+        inicio = perf_counter()
+        for _ in gestor.reservaciones:
+            pass
+        hidratacion = perf_counter() - inicio
+
+        print(f"{n:>9} reservaciones ({tamano:.1f} MiB): json.load {lectura:.2f} s, "
+              f"arranque {arranque:.2f} s ({estadisticas['hidratadas']} hidratadas), "
+              f"hidratar todas {hidratacion:.2f} s")
+
+
+if __name__ == "__main__":
+    for n in [int(n) for n in sys.argv[1:]] or [100_000]:
+        medir(n)
@@ -0,0 +1,96 @@
+"""
+Benchmark de agrupación de solicitudes
+--------------------------------------
+Simula la apertura de un periodo de registro: H hilos crean reservaciones al
+mismo tiempo en unos pocos laboratorios, sobre un archivo JSON con N
+reservaciones. Compara llamar directamente a agregar_reservacion (una
+verificación y una escritura completa por solicitud) con la cola que agrupa
+las solicitudes en lotes.
+
+Uso:
+    python benchmarks/coalescencia.py [N] [SOLICITUDES] [HILOS]
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+from datetime import date, timedelta
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelo.Coalescencia import ColaReservaciones
+from modelo.Espacios import Laboratorio
+from modelo.GestorReservaciones1 import GestorReservaciones
+from modelo.Horarios import Horario
+from modelo.Reservaciones import Reservacion
+from modelo.Usuarios import Profesor
+from parseo_horarios import crear_registros
+
+LABORATORIOS = [Laboratorio(f"LAB-{i}", 25) for i in range(4)]
+
+
+def crear_solicitudes(n: int) -> list:
+    """Solicitudes sobre pocos laboratorios; aproximadamente la mitad choca con otra"""
+    inicio = date(2026, 2, 2)
+    solicitudes = []
+    for i in range(n):
+        profesor = Profesor(f"Profesor {i}", "Facultad de Ingeniería")
+        hora = 7 + (i // 2) % 14
+        horario = Horario((inicio + timedelta(days=(i // 112) % 90)).strftime("%Y-%m-%d"),
+                          f"{hora:02d}:00", f"{hora + 1:02d}:00")
+        solicitudes.append(Reservacion(profesor, LABORATORIOS[(i // 28) % 4], horario, "práctica"))
+    return solicitudes
+
+
+def medir(n: int, total: int, hilos: int, agrupar: bool) -> None:
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo = os.path.join(directorio, "reservas.json")
+        with open(archivo, 'w', encoding='utf-8') as f:
+            json.dump(crear_registros(n), f, ensure_ascii=False)
+        gestor = GestorReservaciones(archivo, concurrente=True)
+        cola = ColaReservaciones(gestor) if agrupar else None
+        solicitudes = crear_solicitudes(total)
+        aceptadas = []
+
+        def trabajar(parte):
+            for reservacion in parte:
+                if cola is not None:
+                    exito, _ = cola.agregar(reservacion)
+                else:
+                    exito = gestor.agregar_reservacion(reservacion)
+                aceptadas.append(exito)
+
+        partes = [solicitudes[i::hilos] for i in range(hilos)]
+        inicio = perf_counter()
+        # agregar_reservacion informa cada conflicto con print
+        with contextlib.redirect_stdout(io.StringIO()):
+            trabajadores = [threading.Thread(target=trabajar, args=(p,)) for p in partes]
+            for t in trabajadores:
+                t.start()
+            for t in trabajadores:
+                t.join()
+        duracion = perf_counter() - inicio
+
+        with open(archivo, 'r', encoding='utf-8') as f:
+            en_disco = len(json.load(f)) - n
+        detalle = ""
+        if cola is not None:
+            estadisticas = cola.estadisticas()
+            detalle = (f", {estadisticas['lotes']} lotes (promedio {estadisticas['promedio_lote']:.1f}, "
+                       f"máximo {estadisticas['lote_maximo']})")
+        print(f"{'agrupadas' if agrupar else 'directas ':>9}: {total / duracion:>8.0f} solicitudes/s, "
+              f"{sum(aceptadas)} aceptadas, {en_disco} en disco{detalle}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    total = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    for hilos in [int(sys.argv[3])] if len(sys.argv) > 3 else [8, 32]:
+        print(f"{hilos} hilos, {total} solicitudes, {n} reservaciones existentes")
+        medir(n, total, hilos, agrupar=False)
+        medir(n, total, hilos, agrupar=True)
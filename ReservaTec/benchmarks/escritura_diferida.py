@@ -0,0 +1,82 @@
+"""
+Benchmark de escritura diferida
+-------------------------------
+Simula una ráfaga de solicitudes (p. ej. al abrir un periodo de registro)
+sobre un archivo con N reservaciones y compara la escritura inmediata con
+la escritura diferida para varias políticas de volcado (intervalo en ms y
+máximo de mutaciones).
+
+Uso:
+    python benchmarks/escritura_diferida.py [N] [SOLICITUDES]
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelo.Almacenamiento import crear_almacenamiento
+from modelo.Espacios import Salon
+from modelo.GestorReservaciones1 import GestorReservaciones
+from modelo.Horarios import Horario
+from modelo.Reservaciones import Reservacion
+from modelo.Usuarios import Profesor
+from parseo_horarios import crear_registros
+
+POLITICAS = [(10, 50), (50, 200), (200, 1000)]
+
+
+def crear_solicitudes(n: int) -> list:
+    profesor = Profesor("Profesor ráfaga", "Facultad de Ingeniería")
+    espacio = Salon("RAFAGA", 30)
+    inicio = date(2026, 1, 1)
+    solicitudes = []
+    for i in range(n):
+        hora = 7 + i % 14
+        horario = Horario((inicio + timedelta(days=i // 14)).strftime("%Y-%m-%d"),
+                          f"{hora:02d}:00", f"{hora + 1:02d}:00")
+        solicitudes.append(Reservacion(profesor, espacio, horario, "clase"))
+    return solicitudes
+
+
+def medir(modo: str, n: int, solicitudes: int, politica=None) -> None:
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo = os.path.join(directorio, "reservas.json")
+        with open(archivo, 'w', encoding='utf-8') as f:
+            json.dump(crear_registros(n), f, ensure_ascii=False)
+        gestor = GestorReservaciones(archivo, crear_almacenamiento(modo, archivo))
+        if politica:
+            gestor.activar_escritura_diferida(*politica)
+
+        inicio = perf_counter()
+        for reservacion in crear_solicitudes(solicitudes):
+            gestor.agregar_reservacion(reservacion)
+        respuesta = perf_counter() - inicio
+        gestor.esperar_persistencia()
+        durable = perf_counter() - inicio
+
+        estadisticas = gestor.estadisticas_escritura()
+        gestor.desactivar_escritura_diferida()
+        if estadisticas is None:
+            print(f"{modo:>7} inmediata        : {solicitudes / respuesta:>9.0f} solicitudes/s, "
+                  f"{solicitudes} escrituras")
+        else:
+            print(f"{modo:>7} diferida {politica[0]:>4} ms/{politica[1]:<5}: "
+                  f"{solicitudes / respuesta:>9.0f} solicitudes/s "
+                  f"(todo durable en {durable:.2f} s), {estadisticas['volcados']} volcados, "
+                  f"{estadisticas['mutaciones_por_volcado']:.0f} mutaciones/volcado, "
+                  f"volcado {estadisticas['latencia_promedio_ms']:.1f} ms, "
+                  f"espera máx. {estadisticas['espera_maxima_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    solicitudes = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    for modo in ("json", "diario"):
+        medir(modo, n, solicitudes)
+        for politica in POLITICAS:
+            medir(modo, n, solicitudes, politica)
@@ -0,0 +1,103 @@
+"""
+Benchmark de memoria
+--------------------
+Mide los bytes por reservación en memoria al crear N reservaciones que
+comparten un catálogo pequeño de usuarios y espacios (como ocurre al cargar
+con el mapa de identidad). Compara la representación compacta actual
+(``__slots__``, minutos y ordinales) con una referencia de la
+representación original: atributos en el ``__dict__`` de cada instancia,
+fecha y horas como objetos date/time y la fecha de creación como texto.
+
+Uso:
+    python benchmarks/memoria_reservaciones.py [N ...]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+from datetime import date, datetime, time, timedelta
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelo.Usuarios import Profesor
+from modelo.Espacios import Salon
+from modelo.Horarios import Horario
+from modelo.Reservaciones import Reservacion
+
+
+class _HorarioOriginal:
+    """Referencia: Horario con date y time por instancia"""
+
+    def __init__(self, fecha: str, hora_inicio: str, hora_fin: str):
+        self._fecha = date.fromisoformat(fecha)
+        self._hora_inicio = time.fromisoformat(hora_inicio)
+        self._hora_fin = time.fromisoformat(hora_fin)
+
+
+class _ReservacionOriginal:
+    """Referencia: los 12 campos de Reservacion en el __dict__ de la instancia"""
+
+    def __init__(self, usuario, espacio, horario, tipo_evento, descripcion=""):
+        self.__id = str(uuid4())
+        self.__usuario = usuario
+        self.__espacio = espacio
+        self.__horario = horario
+        self.__fecha_creacion = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.__estado = "pendiente"
+        self.__tipo_evento = tipo_evento
+        self.__descripcion = descripcion
+        self.__unidad_academica = usuario.unidad_academica
+        self.__aprobada_por = None
+        self.__motivo_rechazo = None
+        self.__fecha_actualizacion = None
+
+
+REPRESENTACIONES = {
+    "original": (_ReservacionOriginal, _HorarioOriginal),
+    "compacta": (Reservacion, Horario),
+}
+
+
+def crear_catalogo(num_usuarios=300, num_espacios=100):
+    usuarios = []
+    for i in range(num_usuarios):
+        usuario = Profesor(f"Profesor {i}", "Facultad de Ingeniería")
+        usuario.id = f"PROF{i:04d}"
+        usuarios.append(usuario)
+    espacios = [Salon(f"S{i:03d}", 30) for i in range(num_espacios)]
+    return usuarios, espacios
+
+
+def medir(n: int, usuarios, espacios, representacion: str = "compacta") -> float:
+    """Bytes asignados por reservación al crear n reservaciones"""
+    clase_reservacion, clase_horario = REPRESENTACIONES[representacion]
+    inicio = date(2025, 1, 1)
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+
+    reservaciones = []
+    for i in range(n):
+        hora = 7 + i % 14
+        horario = clase_horario((inicio + timedelta(days=i % 365)).strftime("%Y-%m-%d"),
+                                f"{hora:02d}:00", f"{hora + 1:02d}:00")
+        reservaciones.append(clase_reservacion(usuarios[i % len(usuarios)], espacios[i % len(espacios)],
+                                               horario, "clase"))
+
+    gc.collect()
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del reservaciones
+    return (despues - antes) / n
+
+
+if __name__ == "__main__":
+    tamanos = [int(n) for n in sys.argv[1:]] or [100_000, 1_000_000]
+    usuarios, espacios = crear_catalogo()
+    for n in tamanos:
+        original = medir(n, usuarios, espacios, "original")
+        compacta = medir(n, usuarios, espacios, "compacta")
+        print(f"{n:>9} reservaciones: original {original:7.1f}, compacta {compacta:7.1f} "
+              f"bytes/reservación ({1 - compacta / original:.0%} menos)")
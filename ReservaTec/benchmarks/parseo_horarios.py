@@ -0,0 +1,89 @@
+"""
+Benchmark de interpretación de horarios
+---------------------------------------
+Compara el intérprete rápido y memorizado de Horario con la interpretación
+mediante datetime.strptime en dos escenarios:
+
+- carga: deserializar N registros de reservación como lo hace el gestor
+- conflictos: construir el Horario de N solicitudes y verificar si el
+  espacio está disponible
+
+Uso:
+    python benchmarks/parseo_horarios.py [N]
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import modelo.Horarios as Horarios
+from modelo.GestorReservaciones1 import GestorReservaciones
+from modelo.Horarios import Horario
+
+
+def _fecha_strptime(texto: str) -> int:
+    return datetime.strptime(texto, "%Y-%m-%d").toordinal()
+
+
+def _hora_strptime(texto: str) -> int:
+    hora = datetime.strptime(texto, "%H:%M")
+    return hora.hour * 60 + hora.minute
+
+
+def crear_registros(n: int) -> list:
+    inicio = date(2025, 1, 1)
+    registros = []
+    for i in range(n):
+        hora = 7 + i % 14
+        registros.append({
+            "id": f"R{i:07d}",
+            "usuario": {"id": f"PROF{i % 300:04d}", "nombre": f"Profesor {i % 300}", "rol": "profesor",
+                        "unidad_academica": "Facultad de Ingeniería"},
+            "espacio": {"nombre": f"S{i % 100:03d}", "tipo": "salon", "capacidad": 30},
+            "horario": {"fecha": (inicio + timedelta(days=i % 365)).strftime("%Y-%m-%d"),
+                        "hora_inicio": f"{hora:02d}:00", "hora_fin": f"{hora + 1:02d}:00"},
+            "estado": "aprobada",
+            "tipo_evento": "clase",
+            "descripcion": "",
+        })
+    return registros
+
+
+def medir_carga(gestor, registros) -> float:
+    inicio = perf_counter()
+    for datos in registros:
+        gestor._deserializar_reservacion(datos)
+    return perf_counter() - inicio
+
+
+def medir_conflictos(gestor, registros) -> float:
+    inicio = perf_counter()
+    for datos in registros:
+        horario = datos["horario"]
+        gestor.esta_disponible(datos["espacio"]["nombre"],
+                               Horario(horario["fecha"], horario["hora_inicio"], horario["hora_fin"]))
+    return perf_counter() - inicio
+
+
+def ejecutar(n: int) -> None:
+    registros = crear_registros(n)
+    with tempfile.TemporaryDirectory() as directorio:
+        gestor = GestorReservaciones(os.path.join(directorio, "reservas.json"))
+        gestor.agregar_lote([gestor._deserializar_reservacion(d) for d in registros[::2]])
+
+        rapido = Horarios._parsear_fecha, Horarios._parsear_hora
+        for nombre, medir in (("carga", medir_carga), ("conflictos", medir_conflictos)):
+            Horarios._parsear_fecha, Horarios._parsear_hora = _fecha_strptime, _hora_strptime
+            referencia = medir(gestor, registros)
+            Horarios._parsear_fecha, Horarios._parsear_hora = rapido
+            actual = medir(gestor, registros)
+            print(f"{nombre:>10}: strptime {referencia * 1e6 / n:6.2f} µs/registro, "
+                  f"rápido {actual * 1e6 / n:6.2f} µs/registro ({referencia / actual:.1f}x)")
+
+
+if __name__ == "__main__":
+    ejecutar(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -1,2 +1,2 @@
-from .controlador_tec import ControladorTec
-__all__ = ['ControladorTec']
+from .controlador_tec import ControladorTec
+__all__ = ['ControladorTec']
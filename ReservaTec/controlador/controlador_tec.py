@@ -1,517 +1,861 @@
-import os
-import json
-from datetime import datetime
-from modelo.Usuarios import Usuario, Estudiante, Profesor, Administrativo, ResponsableArea
-from modelo.Espacios import Salon, Laboratorio, SalaJuntas, Auditorio
-from modelo.Horarios import Horario
-from modelo.Reservaciones import Reservacion
-from modelo.GestorReservaciones1 import GestorReservaciones
-
-class ControladorTec:
-    def __init__(self, ruta_reservaciones="datos/reservas.json"):
-        """
-        Inicializa el controlador del sistema
-        Args:
-            ruta_reservaciones: Ruta al archivo JSON de reservaciones
-        """
-        # Obtener la ruta absoluta del directorio actual del script
-        directorio_base = os.path.dirname(os.path.abspath(__file__))
-
-        # Construir las rutas absolutas para los archivos
-        self.directorio_datos = os.path.join(directorio_base, "..", "datos")
-        self.ruta_usuarios = os.path.join(self.directorio_datos, "usuarios.json")
-        self.ruta_espacios = os.path.join(self.directorio_datos, "espacios.json")
-        ruta_reservaciones = os.path.join(self.directorio_datos, "reservas.json")
-
-        print(f"Rutas de archivos:")
-        print(f"Usuarios: {self.ruta_usuarios}")
-        print(f"Espacios: {self.ruta_espacios}")
-        print(f"Reservaciones: {ruta_reservaciones}")
-
-        # Verificar que los archivos existen
-        if not os.path.exists(self.ruta_usuarios):
-            raise FileNotFoundError(f"No se encontró el archivo de usuarios en: {self.ruta_usuarios}")
-        if not os.path.exists(self.ruta_espacios):
-            raise FileNotFoundError(f"No se encontró el archivo de espacios en: {self.ruta_espacios}")
-        if not os.path.exists(ruta_reservaciones):
-            raise FileNotFoundError(f"No se encontró el archivo de reservaciones en: {ruta_reservaciones}")
-
-        self.gestor = GestorReservaciones(ruta_reservaciones)
-        self.usuario_actual = None
-        self.espacios = self._cargar_espacios()
-        self.usuarios = self._cargar_usuarios()
-
-    def _cargar_usuarios(self):
-        """
-        Carga los usuarios desde el archivo JSON
-        Returns:
-            list: Lista de usuarios
-        """
-        try:
-            with open(self.ruta_usuarios, 'r', encoding='utf-8') as f:
-                datos_usuarios = json.load(f)
-
-            usuarios = []
-            for datos in datos_usuarios:
-                rol = datos.get('rol')
-                usuario = None
-
-                if rol == "estudiante":
-                    usuario = Estudiante(
-                        datos['nombre'],
-                        datos.get('unidad_academica'),
-                        datos.get('email'),
-                        datos.get('carrera'),
-                        datos.get('semestre')
-                    )
-                elif rol == "profesor":
-                    usuario = Profesor(
-                        datos['nombre'],
-                        datos.get('unidad_academica'),
-                        datos.get('email'),
-                        datos.get('departamento')
-                    )
-                elif rol == "administrativo":
-                    usuario = Administrativo(
-                        datos['nombre'],
-                        datos.get('unidad_academica'),
-                        datos.get('email'),
-                        datos.get('cargo'),
-                        datos.get('departamento')
-                    )
-                elif rol == "responsable_area":
-                    usuario = ResponsableArea(
-                        datos['nombre'],
-                        datos.get('unidad_academica'),
-                        datos.get('email'),
-                        datos.get('areas_responsable', [])
-                    )
-
-                if usuario:
-                    usuario.id = datos['id']
-                    usuarios.append(usuario)
-
-            return usuarios
-        except Exception as e:
-            print(f"Error al cargar usuarios: {str(e)}")
-            return []
-
-    def _cargar_espacios(self):
-        """
-        Carga los espacios desde el archivo JSON
-        Returns:
-            dict: Diccionario de espacios
-        """
-        try:
-            with open(self.ruta_espacios, 'r', encoding='utf-8') as f:
-                datos_espacios = json.load(f)
-
-            espacios = {}
-            for datos in datos_espacios:
-                nombre = datos['nombre']
-                tipo = datos['tipo'].lower()
-                capacidad = datos['capacidad']
-                responsable = datos.get('responsable', {})
-
-                if tipo == "salon":
-                    espacio = Salon(nombre, capacidad)
-                elif tipo == "laboratorio":
-                    espacio = Laboratorio(nombre, capacidad)
-                elif tipo == "salajuntas":
-                    espacio = SalaJuntas(nombre, capacidad)
-                elif tipo == "auditorio":
-                    espacio = Auditorio(nombre, capacidad)
-                else:
-                    continue
-
-                espacios[nombre] = espacio
-
-            return espacios
-        except Exception as e:
-            print(f"Error al cargar espacios: {str(e)}")
-            return {}
-
-    def obtener_usuarios(self):
-        """
-        Obtiene todos los usuarios del sistema
-        Returns:
-            list: Lista de usuarios
-        """
-        return self.usuarios
-
-    def obtener_espacios(self):
-        """
-        Obtiene todos los espacios disponibles
-        Returns:
-            list: Lista de espacios
-        """
-        return list(self.espacios.values())
-
-    def obtener_reservaciones(self):
-        """
-        Obtiene todas las reservaciones del sistema
-        Returns:
-            list: Lista de reservaciones
-        """
-        return self.gestor.reservaciones
-
-    def iniciar_sesion(self, id_usuario: str, tipo_usuario: str = None) -> tuple:
-        """
-        Inicia sesión de un usuario en el sistema
-        Args:
-            id_usuario: Identificador del usuario
-            tipo_usuario: Tipo de usuario (opcional)
-        Returns:
-            tuple: (éxito, mensaje)
-        """
-        try:
-            usuario = next((u for u in self.usuarios if u.id == id_usuario), None)
-
-            if usuario:
-                if tipo_usuario and usuario.rol != tipo_usuario:
-                    return False, "El tipo de usuario no coincide"
-                self.usuario_actual = usuario
-                return True, f"Sesión iniciada como {usuario.rol}: {usuario.nombre}"
-            return False, "Usuario no encontrado"
-        except Exception as e:
-            return False, f"Error al iniciar sesión: {str(e)}"
-
-    def cerrar_sesion(self):
-        """Cierra la sesión actual"""
-        self.usuario_actual = None
-
-    def crear_usuario(self, id, nombre, tipo, **kwargs):
-        """
-        Crea un nuevo usuario y lo guarda en el archivo JSON
-        Args:
-            id: Identificador del usuario
-            nombre: Nombre del usuario
-            tipo: Tipo de usuario (estudiante, profesor, administrativo, responsable_area)
-            **kwargs: Atributos adicionales según el tipo
-        Returns:
-            Usuario: Objeto usuario creado o None si hay error
-        """
-        # Verificar si el ID ya existe
-        if any(u.id == id for u in self.usuarios):
-            print("Error: ID de usuario ya existe")
-            return None
-
-        nuevo_usuario = None
-        datos_usuario = {
-            "id": id,
-            "nombre": nombre,
-            "rol": tipo,
-            "unidad_academica": kwargs.get('unidad_academica'),
-            "email": kwargs.get('email')
-        }
-
-        try:
-            if tipo == "estudiante":
-                nuevo_usuario = Estudiante(
-                    nombre,
-                    kwargs.get('unidad_academica'),
-                    kwargs.get('email'),
-                    kwargs.get('carrera'),
-                    kwargs.get('semestre')
-                )
-                datos_usuario.update({
-                    "carrera": kwargs.get('carrera'),
-                    "semestre": kwargs.get('semestre')
-                })
-            elif tipo == "profesor":
-                nuevo_usuario = Profesor(
-                    nombre,
-                    kwargs.get('unidad_academica'),
-                    kwargs.get('email'),
-                    kwargs.get('departamento')
-                )
-                datos_usuario["departamento"] = kwargs.get('departamento')
-            elif tipo == "administrativo":
-                nuevo_usuario = Administrativo(
-                    nombre,
-                    kwargs.get('unidad_academica'),
-                    kwargs.get('email'),
-                    kwargs.get('cargo'),
-                    kwargs.get('departamento')
-                )
-                datos_usuario.update({
-                    "cargo": kwargs.get('cargo'),
-                    "departamento": kwargs.get('departamento')
-                })
-            elif tipo == "responsable_area":
-                nuevo_usuario = ResponsableArea(
-                    nombre,
-                    kwargs.get('unidad_academica'),
-                    kwargs.get('email'),
-                    kwargs.get('areas_responsable', [])
-                )
-                datos_usuario["areas_responsable"] = kwargs.get('areas_responsable', [])
-
-            if nuevo_usuario:
-                nuevo_usuario.id = id
-                self.usuarios.append(nuevo_usuario)
-
-                # Actualizar archivo JSON
-                with open(self.ruta_usuarios, 'r', encoding='utf-8') as f:
-                    usuarios_actuales = json.load(f)
-                usuarios_actuales.append(datos_usuario)
-                with open(self.ruta_usuarios, 'w', encoding='utf-8') as f:
-                    json.dump(usuarios_actuales, f, indent=4, ensure_ascii=False)
-                return nuevo_usuario
-
-        except Exception as e:
-            print(f"Error al crear usuario: {e}")
-        return None
-
-    def crear_espacio(self, nombre, tipo, capacidad, responsable_id):
-        """
-        Crea un nuevo espacio y lo guarda en el archivo JSON
-        Args:
-            nombre: Nombre del espacio
-            tipo: Tipo de espacio (salon, laboratorio, salajuntas, auditorio)
-            capacidad: Capacidad del espacio
-            responsable_id: ID del responsable del espacio
-        Returns:
-            bool: True si se creó exitosamente, False en caso contrario
-        """
-        try:
-            # Verificar si el espacio ya existe
-            if nombre in self.espacios:
-                return False
-
-            # Buscar al responsable
-            responsable = next((u for u in self.usuarios if u.id == responsable_id), None)
-            if not responsable:
-                return False
-
-            # Crear el espacio según el tipo
-            nuevo_espacio = None
-            if tipo.lower() == "salon":
-                nuevo_espacio = Salon(nombre, capacidad)
-            elif tipo.lower() == "laboratorio":
-                nuevo_espacio = Laboratorio(nombre, capacidad)
-            elif tipo.lower() == "salajuntas":
-                nuevo_espacio = SalaJuntas(nombre, capacidad)
-            elif tipo.lower() == "auditorio":
-                nuevo_espacio = Auditorio(nombre, capacidad)
-
-            if nuevo_espacio:
-                # Agregar a la lista en memoria
-                self.espacios[nombre] = nuevo_espacio
-
-                # Actualizar archivo JSON
-                with open(self.ruta_espacios, 'r', encoding='utf-8') as f:
-                    espacios_actuales = json.load(f)
-
-                espacios_actuales.append({
-                    "nombre": nombre,
-                    "tipo": tipo.lower(),
-                    "capacidad": capacidad,
-                    "responsable": {
-                        "id": responsable.id,
-                        "nombre": responsable.nombre
-                    }
-                })
-
-                with open(self.ruta_espacios, 'w', encoding='utf-8') as f:
-                    json.dump(espacios_actuales, f, indent=4, ensure_ascii=False)
-
-                return True
-
-        except Exception as e:
-            print(f"Error al crear espacio: {e}")
-        return False
-
-    def eliminar_usuario(self, id_usuario):
-        """
-        Elimina un usuario del sistema y actualiza el archivo JSON
-        Args:
-            id_usuario: ID del usuario a eliminar
-        Returns:
-            bool: True si se eliminó exitosamente
-        """
-        try:
-            # Verificar si hay reservaciones activas
-            reservaciones_activas = [r for r in self.gestor.obtener_reservaciones_por_usuario(id_usuario)
-                                     if r.estado in ["pendiente", "aprobada"]]
-            if reservaciones_activas:
-                # Cancelar reservaciones del usuario
-                for reservacion in reservaciones_activas:
-                    reservacion.cancelar()
-                self.gestor._guardar_reservaciones()
-
-            # Eliminar de la lista en memoria
-            self.usuarios = [u for u in self.usuarios if u.id != id_usuario]
-
-            # Actualizar archivo JSON
-            with open(self.ruta_usuarios, 'r', encoding='utf-8') as f:
-                usuarios_json = json.load(f)
-            usuarios_json = [u for u in usuarios_json if u['id'] != id_usuario]
-            with open(self.ruta_usuarios, 'w', encoding='utf-8') as f:
-                json.dump(usuarios_json, f, indent=4, ensure_ascii=False)
-
-            return True
-        except Exception as e:
-            print(f"Error al eliminar usuario: {e}")
-            return False
-
-    def eliminar_espacio(self, nombre_espacio):
-        """
-        Elimina un espacio del sistema
-        Args:
-            nombre_espacio: Nombre del espacio a eliminar
-        Returns:
-            bool: True si se eliminó exitosamente
-        """
-        try:
-            if nombre_espacio in self.espacios:
-                # Cancelar reservaciones futuras del espacio
-                for reservacion in self.gestor.reservaciones:
-                    if (reservacion.espacio.nombre == nombre_espacio and
-                            reservacion.estado in ["pendiente", "aprobada"]):
-                        reservacion.cancelar()
-
-                # Eliminar de la lista en memoria
-                del self.espacios[nombre_espacio]
-
-                # Actualizar archivo JSON
-                with open(self.ruta_espacios, 'r', encoding='utf-8') as f:
-                    espacios_json = json.load(f)
-                espacios_json = [e for e in espacios_json if e['nombre'] != nombre_espacio]
-                with open(self.ruta_espacios, 'w', encoding='utf-8') as f:
-                    json.dump(espacios_json, f, indent=4, ensure_ascii=False)
-
-                self.gestor._guardar_reservaciones()
-                return True
-        except Exception as e:
-            print(f"Error al eliminar espacio: {e}")
-        return False
-
-    def agregar_reservacion_directa(self, nombre_espacio, fecha, hora_inicio, hora_fin, tipo_evento, descripcion):
-        try:
-            # Buscar el espacio
-            espacio = next((esp for esp in self.espacios if esp.nombre == nombre_espacio), None)
-            if not espacio:
-                return False
-
-            # Crear un ID único para la reservación
-            id_reservacion = f"RES_{len(self.obtener_reservaciones()) + 1}"
-
-            # Crear nueva reservación
-            nueva_reservacion = {
-                "id": id_reservacion,
-                "espacio": nombre_espacio,
-                "fecha": fecha,
-                "hora_inicio": hora_inicio,
-                "hora_fin": hora_fin,
-                "tipo_evento": tipo_evento,
-                "descripcion": descripcion,
-                "estado": "activa"
-            }
-
-            # Guardar la reservación
-            try:
-                with open(os.path.join(self.directorio_datos, "reservaciones.json"), "r+") as f:
-                    try:
-                        reservaciones = json.load(f)
-                    except json.JSONDecodeError:
-                        reservaciones = []
-
-                    reservaciones.append(nueva_reservacion)
-                    f.seek(0)
-                    json.dump(reservaciones, f, indent=4)
-                    f.truncate()
-                return True
-            except FileNotFoundError:
-                with open(os.path.join(self.directorio_datos, "reservaciones.json"), "w") as f:
-                    json.dump([nueva_reservacion], f, indent=4)
-                return True
-
-        except Exception as e:
-            print(f"Error al crear reservación: {str(e)}")
-            return False
-
-    def crear_reservacion(self, nombre_espacio: str, fecha: str,
-                          hora_inicio: str, hora_fin: str,
-                          tipo_evento: str, descripcion: str = "") -> tuple:
-        """
-        Crea una nueva reservación
-        Args:
-            nombre_espacio: Nombre del espacio a reservar
-            fecha: Fecha de la reservación (YYYY-MM-DD)
-            hora_inicio: Hora de inicio (HH:MM)
-            hora_fin: Hora de fin (HH:MM)
-            tipo_evento: Tipo de evento
-            descripcion: Descripción del evento
-        Returns:
-            tuple: (éxito, mensaje)
-        """
-        if not self.usuario_actual:
-            return False, "No hay usuario con sesión iniciada"
-
-        if nombre_espacio not in self.espacios:
-            return False, "Espacio no encontrado"
-
-        try:
-            espacio = self.espacios[nombre_espacio]
-            horario = Horario(fecha, hora_inicio, hora_fin)
-
-            # Crear la reservación
-            reservacion = Reservacion(
-                self.usuario_actual,
-                espacio,
-                horario,
-                tipo_evento,
-                descripcion
-            )
-
-            # Intentar agregar la reservación
-            if self.gestor.agregar_reservacion(reservacion):
-                return True, "Reservación creada exitosamente"
-            return False, "No se pudo crear la reservación (posible conflicto de horario)"
-        except ValueError as e:
-            return False, str(e)
-        except Exception as e:
-            return False, f"Error al crear la reservación: {str(e)}"
-
-    def eliminar_reservacion(self, id_reservacion):
-        """
-        Elimina una reservación del sistema
-        Args:
-            id_reservacion: ID de la reservación a eliminar
-        Returns:
-            bool: True si se eliminó exitosamente
-        """
-        return self.gestor.eliminar_reservacion(id_reservacion)
-
-    def obtener_reservaciones_usuario(self):
-        """
-        Obtiene las reservaciones del usuario actual
-        Returns:
-            list: Lista de reservaciones del usuario
-        """
-        if not self.usuario_actual:
-            return []
-        return self.gestor.obtener_reservaciones_por_usuario(self.usuario_actual.id)
-
-    def obtener_espacios_disponibles(self, fecha=None):
-        """
-        Obtiene los espacios disponibles para una fecha específica
-        Args:
-            fecha: Fecha para verificar disponibilidad (opcional)
-        Returns:
-            list: Lista de espacios disponibles
-        """
-        espacios_info = []
-        for espacio in self.espacios.values():
-            info = espacio.to_dict()
-            if fecha:
-                info['horarios_disponibles'] = self.gestor.obtener_disponibilidad(espacio, fecha)
-            espacios_info.append(info)
-        return espacios_info
-
-
-if __name__ == "__main__":
-    # Código de prueba
-    controlador = ControladorTec()
+import os
+import json
+from contextlib import contextmanager
+from datetime import datetime
+from modelo.Usuarios import Usuario, Estudiante, Profesor, Administrativo, ResponsableArea
+from modelo.Espacios import Salon, Laboratorio, SalaJuntas, Auditorio
+from modelo.Horarios import Horario
+from modelo.Reservaciones import Reservacion
+from modelo.Recurrencia import ReglaRecurrencia
+from modelo.Importacion import ImportadorReservaciones
+from modelo.GestorReservaciones1 import GestorReservaciones
+from modelo.Almacenamiento import crear_almacenamiento
+from modelo.Cache import CacheArranque
+from modelo.Repositorio import RepositorioCatalogo
+from modelo.Indices import IndiceCapacidad
+from modelo.Concurrencia import CerrojoLectoresEscritores, SinCerrojo
+from modelo.Sesiones import GestorSesiones
+from modelo.Coalescencia import ColaReservaciones
+
+class ControladorTec:
+    def __init__(self, ruta_reservaciones="datos/reservas.json", modo_almacenamiento="json",
+                 usar_cache=True, concurrente=False, inactividad_sesion=30 * 60):
+        """
+        Inicializa el controlador del sistema
+        Args:
+            ruta_reservaciones: Ruta al archivo JSON de reservaciones
+            modo_almacenamiento: "json" (reescritura completa), "diario" (solo-anexado),
+                "particionado" (un archivo por mes en datos/reservas/; solo se cargan
+                el mes actual y los siguientes) o "sqlite" (base de datos en datos/reservatec.db)
+            usar_cache: Usar la instantánea de arranque (datos/cache_arranque.pickle)
+                mientras los archivos de datos no cambien
+            concurrente: Sincronizar el acceso para atender solicitudes desde varios
+                hilos (p. ej. un servidor con un pool de hilos); las reservaciones
+                creadas al mismo tiempo se agrupan en lotes con una sola escritura
+            inactividad_sesion: Segundos sin uso tras los que expira una sesión
+        """
+        # Obtener la ruta absoluta del directorio actual del script
+        directorio_base = os.path.dirname(os.path.abspath(__file__))
+
+        # Construir las rutas absolutas para los archivos
+        self.directorio_datos = os.path.join(directorio_base, "..", "datos")
+        self.ruta_usuarios = os.path.join(self.directorio_datos, "usuarios.json")
+        self.ruta_espacios = os.path.join(self.directorio_datos, "espacios.json")
+        ruta_reservaciones = os.path.join(self.directorio_datos, "reservas.json")
+
+        print(f"Rutas de archivos:")
+        print(f"Usuarios: {self.ruta_usuarios}")
+        print(f"Espacios: {self.ruta_espacios}")
+        print(f"Reservaciones: {ruta_reservaciones}")
+
+        # Verificar que los archivos existen
+        if not os.path.exists(self.ruta_usuarios):
+            raise FileNotFoundError(f"No se encontró el archivo de usuarios en: {self.ruta_usuarios}")
+        if not os.path.exists(self.ruta_espacios):
+            raise FileNotFoundError(f"No se encontró el archivo de espacios en: {self.ruta_espacios}")
+        if not os.path.exists(ruta_reservaciones):
+            raise FileNotFoundError(f"No se encontró el archivo de reservaciones en: {ruta_reservaciones}")
+
+        almacenamiento = crear_almacenamiento(modo_almacenamiento, ruta_reservaciones)
+
+        # Los catálogos JSON se mantienen en memoria; los cambios se anexan a
+        # un diario por archivo en lugar de reescribir el archivo completo
+        self.repositorio_usuarios = RepositorioCatalogo(self.ruta_usuarios, "id")
+        self.repositorio_espacios = RepositorioCatalogo(self.ruta_espacios, "nombre")
+
+        # En modo SQLite los catálogos también viven en la base de datos;
+        # la primera vez se importan desde los archivos JSON
+        self.catalogo_sqlite = None
+        if modo_almacenamiento == "sqlite":
+            self.catalogo_sqlite = almacenamiento
+            if almacenamiento.esta_vacio():
+                for repositorio in (self.repositorio_usuarios, self.repositorio_espacios):
+                    if repositorio.entradas_diario:
+                        repositorio.compactar()
+                almacenamiento.importar_json(ruta_reservaciones, self.ruta_usuarios, self.ruta_espacios)
+
+        # Con un solo archivo de reservaciones (modos json y diario), los
+        # catálogos, los registros de reservación y sus índices se toman de la
+        # instantánea de arranque mientras los archivos no cambien
+        self.cache_arranque = None
+        if usar_cache and modo_almacenamiento in ("json", "diario"):
+            archivos = [self.ruta_usuarios, self.repositorio_usuarios.archivo_diario,
+                        self.ruta_espacios, self.repositorio_espacios.archivo_diario,
+                        ruta_reservaciones]
+            if getattr(almacenamiento, "archivo_diario", None):
+                archivos.append(almacenamiento.archivo_diario)
+            self.cache_arranque = CacheArranque(
+                os.path.join(self.directorio_datos, "cache_arranque.pickle"), archivos
+            )
+
+        self.usuario_actual = None
+        # Protege los catálogos en memoria; las reservaciones las sincroniza el gestor
+        self._cerrojo = CerrojoLectoresEscritores() if concurrente else SinCerrojo()
+        datos = self.cache_arranque.leer() if self.cache_arranque else None
+        if datos is not None:
+            self.espacios, self.usuarios, instantanea = datos
+        else:
+            huellas = self.cache_arranque.huellas() if self.cache_arranque else None
+            self.espacios = self._cargar_espacios()
+            self.usuarios = self._cargar_usuarios()
+            instantanea = None
+        self.gestor = GestorReservaciones(
+            ruta_reservaciones, almacenamiento,
+            usuarios=self.usuarios, espacios=self.espacios.values(), instantanea=instantanea,
+            concurrente=concurrente
+        )
+        if self.cache_arranque and datos is None:
+            self.cache_arranque.guardar(
+                (self.espacios, self.usuarios, self.gestor.exportar_instantanea()), huellas
+            )
+        self._indice_capacidad = IndiceCapacidad(self.espacios.values())
+        self._configurar_responsables()
+        self.cola_reservaciones = ColaReservaciones(self.gestor) if concurrente else None
+
+        # Varias sesiones comparten los datos cargados; usuario_actual se
+        # conserva para el uso de un solo usuario (operaciones sin sesión)
+        self._usuarios_por_id = {u.id: u for u in self.usuarios}
+        self.sesiones = GestorSesiones(self._usuarios_por_id, inactividad_sesion)
+
+    def _configurar_responsables(self):
+        """Actualiza en el gestor el mapa responsable -> espacios que puede autorizar"""
+        responsables = [u for u in self.usuarios if u.rol == "responsable_area"]
+        self.gestor.configurar_responsables(responsables, self.espacios.values())
+
+    def _cargar_usuarios(self):
+        """
+        Carga los usuarios desde el archivo JSON
+        Returns:
+            list: Lista de usuarios
+        """
+        try:
+            if self.catalogo_sqlite:
+                datos_usuarios = self.catalogo_sqlite.cargar_usuarios()
+            else:
+                datos_usuarios = self.repositorio_usuarios.cargar()
+
+            usuarios = []
+            for datos in datos_usuarios:
+                rol = datos.get('rol')
+                usuario = None
+
+                if rol == "estudiante":
+                    usuario = Estudiante(
+                        datos['nombre'],
+                        datos.get('unidad_academica'),
+                        datos.get('email'),
+                        datos.get('carrera'),
+                        datos.get('semestre')
+                    )
+                elif rol == "profesor":
+                    usuario = Profesor(
+                        datos['nombre'],
+                        datos.get('unidad_academica'),
+                        datos.get('email'),
+                        datos.get('departamento')
+                    )
+                elif rol == "administrativo":
+                    usuario = Administrativo(
+                        datos['nombre'],
+                        datos.get('unidad_academica'),
+                        datos.get('email'),
+                        datos.get('cargo'),
+                        datos.get('departamento')
+                    )
+                elif rol == "responsable_area":
+                    usuario = ResponsableArea(
+                        datos['nombre'],
+                        datos.get('unidad_academica'),
+                        datos.get('email'),
+                        datos.get('areas_responsable', [])
+                    )
+
+                if usuario:
+                    usuario.id = datos['id']
+                    usuarios.append(usuario)
+
+            return usuarios
+        except Exception as e:
+            print(f"Error al cargar usuarios: {str(e)}")
+            return []
+
+    def _cargar_espacios(self):
+        """
+        Carga los espacios desde el archivo JSON
+        Returns:
+            dict: Diccionario de espacios
+        """
+        try:
+            if self.catalogo_sqlite:
+                datos_espacios = self.catalogo_sqlite.cargar_espacios()
+            else:
+                datos_espacios = self.repositorio_espacios.cargar()
+
+            espacios = {}
+            for datos in datos_espacios:
+                nombre = datos['nombre']
+                tipo = datos['tipo'].lower()
+                capacidad = datos['capacidad']
+                responsable = datos.get('responsable', {})
+
+                if tipo == "salon":
+                    espacio = Salon(nombre, capacidad)
+                elif tipo == "laboratorio":
+                    espacio = Laboratorio(nombre, capacidad)
+                elif tipo == "salajuntas":
+                    espacio = SalaJuntas(nombre, capacidad)
+                elif tipo == "auditorio":
+                    espacio = Auditorio(nombre, capacidad)
+                else:
+                    continue
+
+                espacio.unidad_academica = datos.get('unidad_academica')
+                espacios[nombre] = espacio
+
+            return espacios
+        except Exception as e:
+            print(f"Error al cargar espacios: {str(e)}")
+            return {}
+
+    def obtener_usuarios(self):
+        """
+        Obtiene todos los usuarios del sistema
+        Returns:
+            list: Lista de usuarios
+        """
+        return self.usuarios
+
+    def obtener_espacios(self):
+        """
+        Obtiene todos los espacios disponibles
+        Returns:
+            list: Lista de espacios
+        """
+        return list(self.espacios.values())
+
+    def obtener_reservaciones(self):
+        """
+        Obtiene todas las reservaciones del sistema
+        Returns:
+            list: Lista de reservaciones
+        """
+        return self.gestor.reservaciones
+
+    def obtener_historial_reservaciones(self, fecha_inicio=None, fecha_fin=None):
+        """
+        Obtiene las reservaciones de un rango de fechas para reportes,
+        incluidas las históricas que no se cargan al iniciar
+        Args:
+            fecha_inicio: Fecha mínima YYYY-MM-DD (opcional)
+            fecha_fin: Fecha máxima YYYY-MM-DD (opcional)
+        Returns:
+            list: Reservaciones ordenadas por fecha y hora
+        """
+        return self.gestor.obtener_historial(fecha_inicio, fecha_fin)
+
+    def iniciar_sesion(self, id_usuario: str, tipo_usuario: str = None) -> tuple:
+        """
+        Inicia sesión de un usuario en el sistema
+        Args:
+            id_usuario: Identificador del usuario
+            tipo_usuario: Tipo de usuario (opcional)
+        Returns:
+            tuple: (éxito, mensaje)
+        """
+        try:
+            usuario = self._usuarios_por_id.get(id_usuario)
+
+            if usuario:
+                if tipo_usuario and usuario.rol != tipo_usuario:
+                    return False, "El tipo de usuario no coincide"
+                self.usuario_actual = usuario
+                return True, f"Sesión iniciada como {usuario.rol}: {usuario.nombre}"
+            return False, "Usuario no encontrado"
+        except Exception as e:
+            return False, f"Error al iniciar sesión: {str(e)}"
+
+    def cerrar_sesion(self, sesion: str = None):
+        """
+        Cierra la sesión actual, o la indicada
+        Args:
+            sesion: Token de la sesión (opcional)
+        """
+        if sesion is not None:
+            self.sesiones.cerrar(sesion)
+            return
+        self.usuario_actual = None
+
+    def abrir_sesion(self, id_usuario: str, tipo_usuario: str = None) -> tuple:
+        """
+        Abre una sesión independiente de usuario_actual, para atender a varios
+        usuarios con los mismos datos cargados. El token se pasa como
+        ``sesion`` a las demás operaciones.
+        Args:
+            id_usuario: Identificador del usuario
+            tipo_usuario: Tipo de usuario (opcional)
+        Returns:
+            tuple: (éxito, mensaje, token)
+        """
+        return self.sesiones.iniciar(id_usuario, tipo_usuario)
+
+    def _usuario_sesion(self, sesion: str = None):
+        """Usuario de la sesión indicada (o usuario_actual si no se indica); None si expiró"""
+        if sesion is None:
+            return self.usuario_actual
+        return self.sesiones.obtener(sesion)
+
+    def crear_usuario(self, id, nombre, tipo, **kwargs):
+        """
+        Crea un nuevo usuario y lo guarda en el archivo JSON
+        Args:
+            id: Identificador del usuario
+            nombre: Nombre del usuario
+            tipo: Tipo de usuario (estudiante, profesor, administrativo, responsable_area)
+            **kwargs: Atributos adicionales según el tipo
+        Returns:
+            Usuario: Objeto usuario creado o None si hay error
+        """
+        with self._cerrojo.escritura():
+            # Verificar si el ID ya existe
+            if id in self._usuarios_por_id:
+                print("Error: ID de usuario ya existe")
+                return None
+
+            nuevo_usuario = None
+            datos_usuario = {
+                "id": id,
+                "nombre": nombre,
+                "rol": tipo,
+                "unidad_academica": kwargs.get('unidad_academica'),
+                "email": kwargs.get('email')
+            }
+
+            try:
+                if tipo == "estudiante":
+                    nuevo_usuario = Estudiante(
+                        nombre,
+                        kwargs.get('unidad_academica'),
+                        kwargs.get('email'),
+                        kwargs.get('carrera'),
+                        kwargs.get('semestre')
+                    )
+                    datos_usuario.update({
+                        "carrera": kwargs.get('carrera'),
+                        "semestre": kwargs.get('semestre')
+                    })
+                elif tipo == "profesor":
+                    nuevo_usuario = Profesor(
+                        nombre,
+                        kwargs.get('unidad_academica'),
+                        kwargs.get('email'),
+                        kwargs.get('departamento')
+                    )
+                    datos_usuario["departamento"] = kwargs.get('departamento')
+                elif tipo == "administrativo":
+                    nuevo_usuario = Administrativo(
+                        nombre,
+                        kwargs.get('unidad_academica'),
+                        kwargs.get('email'),
+                        kwargs.get('cargo'),
+                        kwargs.get('departamento')
+                    )
+                    datos_usuario.update({
+                        "cargo": kwargs.get('cargo'),
+                        "departamento": kwargs.get('departamento')
+                    })
+                elif tipo == "responsable_area":
+                    nuevo_usuario = ResponsableArea(
+                        nombre,
+                        kwargs.get('unidad_academica'),
+                        kwargs.get('email'),
+                        kwargs.get('areas_responsable', [])
+                    )
+                    datos_usuario["areas_responsable"] = kwargs.get('areas_responsable', [])
+
+                if nuevo_usuario:
+                    nuevo_usuario.id = id
+                    # Persistir el alta antes de publicarla en memoria
+                    if self.catalogo_sqlite:
+                        self.catalogo_sqlite.guardar_usuario(datos_usuario)
+                    else:
+                        self.repositorio_usuarios.guardar(datos_usuario)
+
+                    self.usuarios.append(nuevo_usuario)
+                    self._usuarios_por_id[id] = nuevo_usuario
+                    self.gestor.registrar_catalogo(usuarios=[nuevo_usuario])
+                    if tipo == "responsable_area":
+                        self._configurar_responsables()
+                    return nuevo_usuario
+
+            except Exception as e:
+                print(f"Error al crear usuario: {e}")
+            return None
+
+    def crear_espacio(self, nombre, tipo, capacidad, responsable_id, unidad_academica=None):
+        """
+        Crea un nuevo espacio y lo guarda en el archivo JSON
+        Args:
+            nombre: Nombre del espacio
+            tipo: Tipo de espacio (salon, laboratorio, salajuntas, auditorio)
+            capacidad: Capacidad del espacio
+            responsable_id: ID del responsable del espacio
+            unidad_academica: Unidad académica del espacio (opcional)
+        Returns:
+            bool: True si se creó exitosamente, False en caso contrario
+        """
+        with self._cerrojo.escritura():
+            try:
+                # Verificar si el espacio ya existe
+                if nombre in self.espacios:
+                    return False
+
+                # Buscar al responsable
+                responsable = self._usuarios_por_id.get(responsable_id)
+                if not responsable:
+                    return False
+
+                # Crear el espacio según el tipo
+                nuevo_espacio = None
+                if tipo.lower() == "salon":
+                    nuevo_espacio = Salon(nombre, capacidad)
+                elif tipo.lower() == "laboratorio":
+                    nuevo_espacio = Laboratorio(nombre, capacidad)
+                elif tipo.lower() == "salajuntas":
+                    nuevo_espacio = SalaJuntas(nombre, capacidad)
+                elif tipo.lower() == "auditorio":
+                    nuevo_espacio = Auditorio(nombre, capacidad)
+
+                if nuevo_espacio:
+                    nuevo_espacio.unidad_academica = unidad_academica
+                    datos_espacio = {
+                        "nombre": nombre,
+                        "tipo": tipo.lower(),
+                        "capacidad": capacidad,
+                        "responsable": {
+                            "id": responsable.id,
+                            "nombre": responsable.nombre
+                        }
+                    }
+                    if unidad_academica is not None:
+                        datos_espacio["unidad_academica"] = unidad_academica
+
+                    # Persistir el alta antes de publicarla en memoria
+                    if self.catalogo_sqlite:
+                        self.catalogo_sqlite.guardar_espacio(datos_espacio)
+                    else:
+                        self.repositorio_espacios.guardar(datos_espacio)
+
+                    # Agregar a la lista en memoria
+                    self.espacios[nombre] = nuevo_espacio
+                    self._indice_capacidad.agregar(nuevo_espacio)
+                    self.gestor.registrar_catalogo(espacios=[nuevo_espacio])
+                    self._configurar_responsables()
+                    return True
+
+            except Exception as e:
+                print(f"Error al crear espacio: {e}")
+            return False
+
+    @contextmanager
+    def lote_catalogo(self):
+        """
+        Agrupa varias altas y bajas de usuarios y espacios (p. ej. una
+        sincronización con el directorio) en una sola escritura por catálogo.
+        Si esa escritura falla, el error se propaga al salir del bloque.
+        """
+        if self.catalogo_sqlite:
+            yield
+            return
+        with self.repositorio_usuarios.lote(), self.repositorio_espacios.lote():
+            yield
+
+    def eliminar_usuario(self, id_usuario):
+        """
+        Elimina un usuario del sistema y actualiza el archivo JSON
+        Args:
+            id_usuario: ID del usuario a eliminar
+        Returns:
+            bool: True si se eliminó exitosamente
+        """
+        with self._cerrojo.escritura():
+            try:
+                # Persistir la baja; si falla, el usuario y sus reservaciones no cambian
+                if self.catalogo_sqlite:
+                    self.catalogo_sqlite.eliminar_usuario(id_usuario)
+                else:
+                    self.repositorio_usuarios.eliminar(id_usuario)
+
+                # Verificar si hay reservaciones activas
+                reservaciones_activas = self.gestor.obtener_reservaciones_por_usuario(
+                    id_usuario, estados=["pendiente", "aprobada"]
+                )
+                if reservaciones_activas:
+                    # Cancelar reservaciones del usuario
+                    self.gestor.cancelar_reservaciones(reservaciones_activas)
+
+                # Eliminar de la lista en memoria
+                self.usuarios = [u for u in self.usuarios if u.id != id_usuario]
+                self._usuarios_por_id.pop(id_usuario, None)
+                self.sesiones.cerrar_de_usuario(id_usuario)
+                self._configurar_responsables()
+                return True
+            except Exception as e:
+                print(f"Error al eliminar usuario: {e}")
+                return False
+
+    def eliminar_espacio(self, nombre_espacio):
+        """
+        Elimina un espacio del sistema
+        Args:
+            nombre_espacio: Nombre del espacio a eliminar
+        Returns:
+            bool: True si se eliminó exitosamente
+        """
+        with self._cerrojo.escritura():
+            try:
+                if nombre_espacio in self.espacios:
+                    # Persistir la baja; si falla, el espacio y sus reservaciones no cambian
+                    if self.catalogo_sqlite:
+                        self.catalogo_sqlite.eliminar_espacio(nombre_espacio)
+                    else:
+                        self.repositorio_espacios.eliminar(nombre_espacio)
+
+                    # Cancelar reservaciones futuras del espacio
+                    activas = self.gestor.obtener_reservaciones_activas_por_espacio(nombre_espacio)
+
+                    # Eliminar de la lista en memoria
+                    self._indice_capacidad.quitar(self.espacios.pop(nombre_espacio))
+                    self._configurar_responsables()
+
+                    self.gestor.cancelar_reservaciones(activas)
+                    return True
+            except Exception as e:
+                print(f"Error al eliminar espacio: {e}")
+            return False
+
+    def agregar_reservacion_directa(self, nombre_espacio, fecha, hora_inicio, hora_fin, tipo_evento, descripcion):
+        try:
+            # Buscar el espacio
+            espacio = next((esp for esp in self.espacios if esp.nombre == nombre_espacio), None)
+            if not espacio:
+                return False
+
+            # Crear un ID único para la reservación
+            id_reservacion = f"RES_{len(self.obtener_reservaciones()) + 1}"
+
+            # Crear nueva reservación
+            nueva_reservacion = {
+                "id": id_reservacion,
+                "espacio": nombre_espacio,
+                "fecha": fecha,
+                "hora_inicio": hora_inicio,
+                "hora_fin": hora_fin,
+                "tipo_evento": tipo_evento,
+                "descripcion": descripcion,
+                "estado": "activa"
+            }
+
+            # Guardar la reservación
+            try:
+                with open(os.path.join(self.directorio_datos, "reservaciones.json"), "r+") as f:
+                    try:
+                        reservaciones = json.load(f)
+                    except json.JSONDecodeError:
+                        reservaciones = []
+
+                    reservaciones.append(nueva_reservacion)
+                    f.seek(0)
+                    json.dump(reservaciones, f, indent=4)
+                    f.truncate()
+                return True
+            except FileNotFoundError:
+                with open(os.path.join(self.directorio_datos, "reservaciones.json"), "w") as f:
+                    json.dump([nueva_reservacion], f, indent=4)
+                return True
+
+        except Exception as e:
+            print(f"Error al crear reservación: {str(e)}")
+            return False
+
+    def crear_reservacion(self, nombre_espacio: str, fecha: str,
+                          hora_inicio: str, hora_fin: str,
+                          tipo_evento: str, descripcion: str = "", sesion: str = None) -> tuple:
+        """
+        Crea una nueva reservación
+        Args:
+            nombre_espacio: Nombre del espacio a reservar
+            fecha: Fecha de la reservación (YYYY-MM-DD)
+            hora_inicio: Hora de inicio (HH:MM)
+            hora_fin: Hora de fin (HH:MM)
+            tipo_evento: Tipo de evento
+            descripcion: Descripción del evento
+            sesion: Token de sesión (por defecto, usuario_actual)
+        Returns:
+            tuple: (éxito, mensaje)
+        """
+        usuario = self._usuario_sesion(sesion)
+        if not usuario:
+            return False, "No hay usuario con sesión iniciada"
+
+        if nombre_espacio not in self.espacios:
+            return False, "Espacio no encontrado"
+
+        try:
+            espacio = self.espacios[nombre_espacio]
+            horario = Horario(fecha, hora_inicio, hora_fin)
+
+            # Crear la reservación
+            reservacion = Reservacion(
+                usuario,
+                espacio,
+                horario,
+                tipo_evento,
+                descripcion
+            )
+
+            # Intentar agregar la reservación
+            if self.cola_reservaciones is not None:
+                return self.cola_reservaciones.agregar(reservacion)
+            if self.gestor.agregar_reservacion(reservacion):
+                return True, "Reservación creada exitosamente"
+            return False, "No se pudo crear la reservación (posible conflicto de horario)"
+        except ValueError as e:
+            return False, str(e)
+        except Exception as e:
+            return False, f"Error al crear la reservación: {str(e)}"
+
+    def crear_serie_reservaciones(self, nombre_espacio: str, regla: ReglaRecurrencia,
+                                  hora_inicio: str, hora_fin: str, tipo_evento: str,
+                                  descripcion: str = "", omitir_conflictos: bool = False,
+                                  sesion: str = None) -> tuple:
+        """
+        Crea una serie de reservaciones recurrentes del usuario actual
+        Args:
+            nombre_espacio: Nombre del espacio a reservar
+            regla: ReglaRecurrencia con las fechas de la serie
+            hora_inicio: Hora de inicio (HH:MM)
+            hora_fin: Hora de fin (HH:MM)
+            tipo_evento: Tipo de evento
+            descripcion: Descripción del evento
+            omitir_conflictos: Si es True se crean las fechas sin conflicto; si no,
+                la serie se crea completa o no se crea
+            sesion: Token de sesión (por defecto, usuario_actual)
+        Returns:
+            tuple: (éxito, mensaje, conflictos) donde conflictos es un diccionario
+                fecha (YYYY-MM-DD) -> motivo
+        """
+        usuario = self._usuario_sesion(sesion)
+        if not usuario:
+            return False, "No hay usuario con sesión iniciada", {}
+
+        if nombre_espacio not in self.espacios:
+            return False, "Espacio no encontrado", {}
+
+        try:
+            espacio = self.espacios[nombre_espacio]
+            reservaciones = [
+                Reservacion(usuario, espacio, Horario(fecha, hora_inicio, hora_fin),
+                            tipo_evento, descripcion)
+                for fecha in regla.fechas()
+            ]
+            if not reservaciones:
+                return False, "La regla de recurrencia no genera fechas", {}
+
+            resultados = self.gestor.agregar_lote(reservaciones, atomico=not omitir_conflictos)
+            conflictos = {
+                r.horario.fecha.strftime("%Y-%m-%d"): mensaje
+                for r, (exito, mensaje) in zip(reservaciones, resultados)
+                if not exito and mensaje != self.gestor.MENSAJE_LOTE_DESCARTADO
+            }
+            creadas = sum(1 for exito, _ in resultados if exito)
+            if creadas == 0:
+                return False, "No se pudo crear la serie de reservaciones", conflictos
+            return True, f"Se crearon {creadas} de {len(reservaciones)} reservaciones", conflictos
+        except ValueError as e:
+            return False, str(e), {}
+        except Exception as e:
+            return False, f"Error al crear la serie de reservaciones: {str(e)}", {}
+
+    def importar_reservaciones(self, ruta: str, formato: str = None) -> list:
+        """
+        Importa reservaciones en bloque desde un archivo CSV o JSON Lines
+        Args:
+            ruta: Ruta al archivo
+            formato: "csv" o "jsonl" (por defecto se deduce de la extensión)
+        Returns:
+            list: Reporte por fila (fila, aceptada, motivo, id)
+        """
+        importador = ImportadorReservaciones(
+            self.gestor, {u.id: u for u in self.usuarios}, self.espacios
+        )
+        return importador.importar(ruta, formato)
+
+    def obtener_bandeja_aprobaciones(self, sesion: str = None):
+        """
+        Obtiene las reservaciones pendientes que puede autorizar el responsable
+        de área con sesión iniciada
+        Args:
+            sesion: Token de sesión (por defecto, usuario_actual)
+        Returns:
+            list: Reservaciones pendientes ordenadas por fecha y hora
+        """
+        usuario = self._usuario_sesion(sesion)
+        if not usuario or usuario.rol != "responsable_area":
+            return []
+        return self.gestor.obtener_bandeja(usuario.id)
+
+    def aprobar_reservaciones(self, ids_reservaciones, sesion: str = None) -> list:
+        """
+        Aprueba varias reservaciones como el responsable de área con sesión iniciada
+        Args:
+            ids_reservaciones: IDs de las reservaciones a aprobar
+            sesion: Token de sesión (por defecto, usuario_actual)
+        Returns:
+            list: (id, éxito, mensaje) por cada reservación
+        """
+        usuario = self._usuario_sesion(sesion)
+        if not usuario or usuario.rol != "responsable_area":
+            return [(i, False, "Se requiere un responsable de área con sesión iniciada")
+                    for i in ids_reservaciones]
+        return self.gestor.aprobar_reservaciones(ids_reservaciones, usuario)
+
+    def rechazar_reservaciones(self, ids_reservaciones, motivo: str, sesion: str = None) -> list:
+        """
+        Rechaza varias reservaciones como el responsable de área con sesión iniciada
+        Args:
+            ids_reservaciones: IDs de las reservaciones a rechazar
+            motivo: Motivo del rechazo
+            sesion: Token de sesión (por defecto, usuario_actual)
+        Returns:
+            list: (id, éxito, mensaje) por cada reservación
+        """
+        usuario = self._usuario_sesion(sesion)
+        if not usuario or usuario.rol != "responsable_area":
+            return [(i, False, "Se requiere un responsable de área con sesión iniciada")
+                    for i in ids_reservaciones]
+        return self.gestor.rechazar_reservaciones(ids_reservaciones, usuario, motivo)
+
+    def cancelar_reservacion(self, id_reservacion, sesion: str = None) -> tuple:
+        """
+        Cancela una reservación del usuario con sesión iniciada (un responsable
+        de área puede cancelar cualquiera)
+        Args:
+            id_reservacion: ID de la reservación
+            sesion: Token de sesión (por defecto, usuario_actual)
+        Returns:
+            tuple: (éxito, mensaje)
+        """
+        usuario = self._usuario_sesion(sesion)
+        if not usuario:
+            return False, "No hay usuario con sesión iniciada"
+        return self.gestor.cancelar_reservacion(id_reservacion, usuario)
+
+    def eliminar_reservacion(self, id_reservacion):
+        """
+        Elimina una reservación del sistema
+        Args:
+            id_reservacion: ID de la reservación a eliminar
+        Returns:
+            bool: True si se eliminó exitosamente
+        """
+        return self.gestor.eliminar_reservacion(id_reservacion)
+
+    def obtener_reservaciones_usuario(self, estados=None, fecha_inicio=None, fecha_fin=None, sesion=None):
+        """
+        Obtiene las reservaciones del usuario actual
+        Args:
+            estados: Estados aceptados (opcional)
+            fecha_inicio: Fecha mínima YYYY-MM-DD (opcional)
+            fecha_fin: Fecha máxima YYYY-MM-DD (opcional)
+            sesion: Token de sesión (por defecto, usuario_actual)
+        Returns:
+            list: Lista de reservaciones del usuario
+        """
+        usuario = self._usuario_sesion(sesion)
+        if not usuario:
+            return []
+        return self.gestor.obtener_reservaciones_por_usuario(
+            usuario.id, estados, fecha_inicio, fecha_fin
+        )
+
+    def obtener_espacios_disponibles(self, fecha=None):
+        """
+        Obtiene los espacios disponibles para una fecha específica
+        Args:
+            fecha: Fecha para verificar disponibilidad (opcional)
+        Returns:
+            list: Lista de espacios disponibles
+        """
+        with self._cerrojo.lectura():
+            espacios_info = []
+            for espacio in self.espacios.values():
+                info = espacio.to_dict()
+                if fecha:
+                    info['horarios_disponibles'] = self.gestor.obtener_disponibilidad(espacio, fecha)
+                espacios_info.append(info)
+            return espacios_info
+
+    def obtener_disponibilidad(self, nombre_espacio, fecha):
+        """
+        Obtiene las franjas horarias de un espacio en una fecha
+        Args:
+            nombre_espacio: Nombre del espacio
+            fecha: Fecha (YYYY-MM-DD)
+        Returns:
+            list: Franjas del día, o None si el espacio no existe
+        """
+        with self._cerrojo.lectura():
+            espacio = self.espacios.get(nombre_espacio)
+            if espacio is None:
+                return None
+            return self.gestor.obtener_disponibilidad(espacio, fecha)
+
+    def buscar_espacios(self, tipo=None, capacidad_minima=0, fecha=None,
+                        hora_inicio=None, hora_fin=None, limite=None):
+        """
+        Busca espacios de un tipo con capacidad suficiente que estén libres en
+        un horario, ordenados por mejor ajuste (menor capacidad sobrante)
+        Args:
+            tipo: Tipo de espacio (salon, laboratorio, salajuntas, auditorio); opcional
+            capacidad_minima: Capacidad mínima requerida
+            fecha: Fecha (YYYY-MM-DD); si se omite no se verifica disponibilidad
+            hora_inicio: Hora de inicio (HH:MM); obligatoria si se indica la fecha
+            hora_fin: Hora de fin (HH:MM); obligatoria si se indica la fecha
+            limite: Cantidad máxima de resultados (opcional)
+        Returns:
+            list: Lista de espacios
+        """
+        if (fecha or hora_inicio or hora_fin) and not (fecha and hora_inicio and hora_fin):
+            raise ValueError("Para verificar disponibilidad se requieren fecha, hora_inicio y hora_fin")
+        with self._cerrojo.lectura():
+            horario = Horario(fecha, hora_inicio, hora_fin) if fecha else None
+
+            resultado = []
+            for nombre in self._indice_capacidad.candidatos(tipo, capacidad_minima):
+                if horario is not None and not self.gestor.esta_disponible(nombre, horario):
+                    continue
+                resultado.append(self.espacios[nombre])
+                if limite is not None and len(resultado) >= limite:
+                    break
+            return resultado
+
+    def obtener_matriz_ocupacion(self, fecha_inicio, fecha_fin, nombres_espacios=None):
+        """
+        Obtiene la ocupación de los espacios en un rango de fechas, para la
+        vista de planificación semanal
+        Args:
+            fecha_inicio: Primera fecha (YYYY-MM-DD)
+            fecha_fin: Última fecha, inclusive (YYYY-MM-DD)
+            nombres_espacios: Espacios a incluir (por defecto, todo el catálogo)
+        Returns:
+            MatrizOcupacion: Matriz espacios × días × franjas
+        """
+        if nombres_espacios is None:
+            nombres_espacios = list(self.espacios.keys())
+        return self.gestor.obtener_matriz_ocupacion(nombres_espacios, fecha_inicio, fecha_fin)
+
+
+if __name__ == "__main__":
+    # Código de prueba
+    controlador = ControladorTec()
     print("Sistema iniciado correctamente")
\ No newline at end of file
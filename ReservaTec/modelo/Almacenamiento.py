@@ -0,0 +1,672 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date
+from typing import Dict, List, Optional
+
+
+class AlmacenamientoJSON:
+    """
+    Almacenamiento original: un único arreglo JSON que se reescribe completo
+    en cada cambio.
+    """
+    # Indica si el almacenamiento puede persistir cambios individuales; los
+    # incrementales implementan además registrar(registros) y eliminar(ids)
+    incremental = False
+
+    def __init__(self, archivo: str):
+        self.archivo = archivo
+
+    def cargar(self) -> List[dict]:
+        """Carga los registros de reservaciones desde el archivo JSON"""
+        try:
+            with open(self.archivo, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+        except json.JSONDecodeError:
+            print("Error al decodificar el archivo JSON")
+            return []
+
+    def guardar(self, registros: List[dict]) -> None:
+        """Reescribe el archivo JSON con todos los registros"""
+        _escribir_json(self.archivo, registros)
+
+
+class AlmacenamientoDiario(AlmacenamientoJSON):
+    """
+    Almacenamiento con diario de solo-anexado.
+
+    Cada cambio agrega una línea JSON compacta al diario (``<archivo>.diario``),
+    por lo que su costo no depende de la cantidad de reservaciones guardadas.
+    Al superar ``umbral_compactacion`` entradas, el diario se integra en la
+    instantánea (el arreglo JSON original) y se vacía. Al cargar se lee la
+    instantánea y luego se reproducen las entradas del diario.
+    """
+    incremental = True
+
+    def __init__(self, archivo: str, umbral_compactacion: int = 500):
+        super().__init__(archivo)
+        self.archivo_diario = archivo + ".diario"
+        self.umbral_compactacion = umbral_compactacion
+        self.entradas_diario = 0
+
+    def cargar(self) -> List[dict]:
+        """
+        Carga la instantánea y reproduce el diario sobre ella
+
+        Returns:
+            List[dict]: Registros vigentes, en orden de creación
+        """
+        registros = {}
+        for registro in super().cargar():
+            registros[registro.get("id")] = registro
+
+        self.entradas_diario = 0
+        for entrada in self._leer_diario():
+            self._aplicar(registros, entrada)
+            self.entradas_diario += 1
+
+        return list(registros.values())
+
+    def guardar(self, registros: List[dict]) -> None:
+        """Escribe una instantánea completa y descarta el diario"""
+        _escribir_json(self.archivo, registros)
+        self._vaciar_diario()
+
+    def registrar(self, registros: List[dict]) -> None:
+        """
+        Anexa un cambio al diario
+
+        Args:
+            registros: Reservaciones afectadas por el cambio
+        """
+        self._anexar({"op": "guardar", "reservaciones": registros})
+
+    def eliminar(self, ids: List[str]) -> None:
+        """
+        Anexa una eliminación al diario
+
+        Args:
+            ids: IDs de las reservaciones eliminadas
+        """
+        self._anexar({"op": "eliminar", "ids": list(ids)})
+
+    def compactar(self) -> None:
+        """Integra el diario en la instantánea"""
+        self.guardar(self.cargar())
+
+    def _anexar(self, entrada: dict) -> None:
+        # Los errores de escritura se propagan: el gestor conserva el cambio
+        # como pendiente y lo reintenta
+        with open(self.archivo_diario, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entrada, ensure_ascii=False, separators=(',', ':')))
+            f.write("\n")
+
+        self.entradas_diario += 1
+        if self.entradas_diario >= self.umbral_compactacion:
+            self.compactar()
+
+    def _leer_diario(self):
+        """Lee las entradas del diario, ignorando una última línea incompleta"""
+        try:
+            with open(self.archivo_diario, 'r', encoding='utf-8') as f:
+                for linea in f:
+                    linea = linea.strip()
+                    if not linea:
+                        continue
+                    try:
+                        yield json.loads(linea)
+                    except json.JSONDecodeError:
+                        print("Entrada del diario dañada, se ignora")
+        except FileNotFoundError:
+            return
+
+    def _vaciar_diario(self) -> None:
+        try:
+            with open(self.archivo_diario, 'w', encoding='utf-8'):
+                pass
+        except Exception as e:
+            print(f"Error al vaciar el diario: {str(e)}")
+        self.entradas_diario = 0
+
+    @staticmethod
+    def _aplicar(registros: dict, entrada: dict) -> None:
+        if entrada.get("op") == "guardar":
+            for registro in entrada.get("reservaciones", []):
+                registros[registro.get("id")] = registro
+        elif entrada.get("op") == "eliminar":
+            for id_reservacion in entrada.get("ids", []):
+                registros.pop(id_reservacion, None)
+
+
+class AlmacenamientoParticionado:
+    """
+    Almacenamiento particionado por mes de la reservación.
+
+    Cada mes es un archivo JSON ``AAAA-MM.json`` dentro de ``directorio``.
+    Por defecto solo se cargan las particiones "calientes" (el mes actual y
+    los siguientes); las históricas se abren bajo demanda con
+    ``cargar_historial``. Cada cambio reescribe únicamente los archivos de
+    los meses afectados.
+
+    Las reservaciones de meses históricos no están en memoria, así que no se
+    pueden verificar sus conflictos: el gestor rechaza las nuevas
+    reservaciones anteriores a ``fecha_inicial()``.
+    """
+    incremental = True
+    # Registros sin una fecha AAAA-MM-DD reconocible encontrados al migrar;
+    # no se cargan y se conservan aparte para revisarlos
+    SIN_FECHA = "sin_fecha"
+
+    def __init__(self, directorio: str, archivo_origen: Optional[str] = None, meses_anteriores: int = 0):
+        """
+        Args:
+            directorio: Directorio de las particiones
+            archivo_origen: Arreglo JSON que se reparte en particiones si el
+                directorio aún no existe (migración desde AlmacenamientoJSON)
+            meses_anteriores: Meses anteriores al actual que también se cargan
+        """
+        self.directorio = directorio
+        self.meses_anteriores = meses_anteriores
+        # Particiones cargadas: mes -> {id: registro}
+        self._particiones: Dict[str, Dict[str, dict]] = {}
+        # Mes de cada reservación cargada
+        self._mes_por_id: Dict[str, str] = {}
+
+        if not os.path.isdir(directorio):
+            os.makedirs(directorio)
+            if archivo_origen:
+                self._migrar(archivo_origen)
+
+    def mes_inicial(self) -> str:
+        """Primer mes (AAAA-MM) de las particiones calientes"""
+        return _mes_inicial(self.meses_anteriores)
+
+    def fecha_inicial(self) -> str:
+        """Primera fecha (AAAA-MM-DD) de las particiones calientes"""
+        return f"{self.mes_inicial()}-01"
+
+    def meses(self) -> List[str]:
+        """Meses (AAAA-MM) que tienen partición, en orden"""
+        return sorted(nombre[:-5] for nombre in os.listdir(self.directorio)
+                      if nombre.endswith(".json") and _ES_MES.match(nombre[:-5]))
+
+    def cargar(self) -> List[dict]:
+        """Carga las particiones calientes"""
+        self._particiones.clear()
+        self._mes_por_id.clear()
+        inicial = self.mes_inicial()
+        registros = []
+        for mes in self.meses():
+            if mes >= inicial:
+                registros.extend(self._abrir(mes).values())
+        return registros
+
+    def cargar_historial(self, mes_inicio: Optional[str] = None, mes_fin: Optional[str] = None) -> List[dict]:
+        """
+        Lee particiones bajo demanda (p. ej. para reportes) sin conservarlas
+        en memoria
+
+        Args:
+            mes_inicio: Primer mes AAAA-MM, inclusive (opcional)
+            mes_fin: Último mes AAAA-MM, inclusive (opcional)
+
+        Returns:
+            List[dict]: Registros de los meses indicados
+        """
+        registros = []
+        for mes in self.meses():
+            if (mes_inicio is None or mes >= mes_inicio) and (mes_fin is None or mes <= mes_fin):
+                particion = self._particiones.get(mes)
+                if particion is None:
+                    particion = self._leer(mes)
+                registros.extend(particion.values())
+        return registros
+
+    def guardar(self, registros: List[dict]) -> None:
+        """
+        Reescribe las particiones cargadas con los registros indicados; los
+        registros de meses no cargados se agregan a su partición
+        """
+        por_mes = self._agrupar(registros)
+        for mes, particion in self._particiones.items():
+            for id_reservacion in particion:
+                self._mes_por_id.pop(id_reservacion, None)
+            particion.clear()
+            if mes not in por_mes:
+                self._escribir(mes)
+        for mes, registros_mes in por_mes.items():
+            self._actualizar(mes, registros_mes)
+
+    def registrar(self, registros: List[dict]) -> None:
+        """
+        Inserta o actualiza registros reescribiendo solo sus particiones
+
+        Args:
+            registros: Reservaciones afectadas por el cambio
+        """
+        for mes, registros_mes in self._agrupar(registros).items():
+            self._actualizar(mes, registros_mes)
+
+    def eliminar(self, ids: List[str]) -> None:
+        """
+        Elimina registros de sus particiones
+
+        Args:
+            ids: IDs de las reservaciones eliminadas
+        """
+        afectados = set()
+        for id_reservacion in ids:
+            mes = self._mes_por_id.pop(id_reservacion, None)
+            if mes is not None:
+                self._particiones[mes].pop(id_reservacion, None)
+                afectados.add(mes)
+        for mes in afectados:
+            self._escribir(mes)
+
+    def _actualizar(self, mes: str, registros: List[dict]) -> None:
+        # Las particiones no cargadas (históricas) se leen, se modifican y se
+        # escriben sin conservarlas en memoria
+        particion = self._particiones.get(mes)
+        if particion is None:
+            particion = self._leer(mes)
+        modificados = {mes}
+        for registro in registros:
+            id_reservacion = registro.get("id")
+            mes_anterior = self._mes_por_id.get(id_reservacion)
+            if mes_anterior is not None and mes_anterior != mes:
+                # La reservación cambió de mes
+                self._particiones[mes_anterior].pop(id_reservacion, None)
+                modificados.add(mes_anterior)
+            particion[id_reservacion] = registro
+            if mes in self._particiones:
+                self._mes_por_id[id_reservacion] = mes
+        self._escribir(mes, particion)
+        for mes_anterior in modificados - {mes}:
+            self._escribir(mes_anterior)
+
+    def _abrir(self, mes: str) -> Dict[str, dict]:
+        """Lee una partición y la conserva en memoria"""
+        particion = self._leer(mes)
+        self._particiones[mes] = particion
+        for id_reservacion in particion:
+            self._mes_por_id[id_reservacion] = mes
+        return particion
+
+    def _leer(self, mes: str) -> Dict[str, dict]:
+        try:
+            with open(self._ruta(mes), 'r', encoding='utf-8') as f:
+                return {r.get("id"): r for r in json.load(f)}
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            print(f"Error al decodificar la partición {mes}")
+            return {}
+
+    def _escribir(self, mes: str, particion: Optional[Dict[str, dict]] = None) -> None:
+        if particion is None:
+            particion = self._particiones.get(mes, {})
+        if particion:
+            _escribir_json(self._ruta(mes), list(particion.values()))
+        else:
+            try:
+                os.remove(self._ruta(mes))
+            except FileNotFoundError:
+                pass
+
+    def _ruta(self, mes: str) -> str:
+        return os.path.join(self.directorio, f"{mes}.json")
+
+    def _agrupar(self, registros: List[dict]) -> Dict[str, List[dict]]:
+        por_mes = {}
+        for registro in registros:
+            mes = self._mes(registro)
+            if mes == self.SIN_FECHA:
+                raise ValueError(f"La reservación {registro.get('id')} no tiene una fecha AAAA-MM-DD")
+            por_mes.setdefault(mes, []).append(registro)
+        return por_mes
+
+    @classmethod
+    def _mes(cls, registro: dict) -> str:
+        fecha = str((registro.get("horario") or {}).get("fecha", ""))
+        return fecha[:7] if _ES_FECHA.match(fecha) else cls.SIN_FECHA
+
+    def _migrar(self, archivo_origen: str) -> None:
+        """Reparte un arreglo JSON existente en particiones mensuales"""
+        por_mes = {}
+        for registro in AlmacenamientoJSON(archivo_origen).cargar():
+            por_mes.setdefault(self._mes(registro), []).append(registro)
+        sin_fecha = por_mes.get(self.SIN_FECHA)
+        if sin_fecha:
+            print(f"{len(sin_fecha)} reservaciones sin fecha válida se guardaron en "
+                  f"{self._ruta(self.SIN_FECHA)} y no se cargarán")
+        for mes, registros_mes in por_mes.items():
+            _escribir_json(self._ruta(mes), registros_mes)
+
+
+_ES_MES = re.compile(r"^\d{4}-\d{2}$")
+_ES_FECHA = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _mes_inicial(meses_anteriores: int) -> str:
+    """Mes (AAAA-MM) que está ``meses_anteriores`` meses antes del actual"""
+    hoy = date.today()
+    indice = hoy.year * 12 + hoy.month - 1 - meses_anteriores
+    return f"{indice // 12:04d}-{indice % 12 + 1:02d}"
+
+
+class AlmacenamientoSQLite:
+    """
+    Almacenamiento en una base de datos SQLite.
+
+    Cada reservación es una fila con columnas indexadas (espacio, fecha,
+    estado, usuario e id) y el registro completo en JSON. Los cambios son
+    inserciones o actualizaciones de filas individuales y las consultas se
+    resuelven en SQL. También guarda los catálogos de usuarios y espacios.
+    Los archivos JSON se mantienen como formato de importación/exportación.
+
+    Al iniciar solo se cargan las reservaciones de la ventana caliente (del
+    mes actual en adelante, más las pendientes de cualquier fecha); el
+    historial se consulta en SQL con ``consultar``. La conexión se comparte
+    entre hilos y todos sus usos se serializan con un cerrojo.
+    """
+    incremental = True
+
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS reservaciones (
+            id TEXT PRIMARY KEY,
+            espacio TEXT COLLATE NOCASE,
+            fecha TEXT,
+            hora_inicio TEXT,
+            hora_fin TEXT,
+            estado TEXT,
+            id_usuario TEXT,
+            datos TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_reservaciones_espacio_fecha
+            ON reservaciones (espacio, fecha);
+        CREATE INDEX IF NOT EXISTS idx_reservaciones_fecha ON reservaciones (fecha);
+        CREATE INDEX IF NOT EXISTS idx_reservaciones_estado ON reservaciones (estado);
+        CREATE INDEX IF NOT EXISTS idx_reservaciones_usuario ON reservaciones (id_usuario);
+        CREATE TABLE IF NOT EXISTS usuarios (
+            id TEXT PRIMARY KEY,
+            rol TEXT,
+            datos TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS espacios (
+            nombre TEXT PRIMARY KEY,
+            tipo TEXT,
+            capacidad INTEGER,
+            datos TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, ruta_bd: str, meses_anteriores: int = 0):
+        """
+        Args:
+            ruta_bd: Archivo de la base de datos
+            meses_anteriores: Meses anteriores al actual que también se cargan
+        """
+        self.ruta_bd = ruta_bd
+        self.meses_anteriores = meses_anteriores
+        # Una sola conexión para todos los hilos; el cerrojo serializa su uso
+        self._cerrojo = threading.RLock()
+        self.conexion = sqlite3.connect(ruta_bd, check_same_thread=False)
+        self.conexion.executescript(self.ESQUEMA)
+        # IDs de las reservaciones cargadas: las que reemplaza ``guardar``
+        self._ids_cargados = set()
+
+    def cerrar(self) -> None:
+        with self._cerrojo:
+            self.conexion.close()
+
+    def esta_vacio(self) -> bool:
+        """Indica si la base de datos aún no tiene datos"""
+        with self._cerrojo:
+            for tabla in ("reservaciones", "usuarios", "espacios"):
+                if self.conexion.execute(f"SELECT 1 FROM {tabla} LIMIT 1").fetchone():
+                    return False
+            return True
+
+    @contextmanager
+    def _transaccion(self):
+        """Transacción con la conexión tomada por el hilo actual"""
+        with self._cerrojo, self.conexion:
+            yield self.conexion
+
+    def _leer(self, consulta: str, parametros=()) -> List[dict]:
+        """Ejecuta una consulta de la columna ``datos`` y decodifica cada registro"""
+        with self._cerrojo:
+            filas = self.conexion.execute(consulta, parametros).fetchall()
+        return [json.loads(datos) for (datos,) in filas]
+
+    # Reservaciones
+
+    def fecha_inicial(self) -> str:
+        """Primera fecha (AAAA-MM-DD) de la ventana caliente"""
+        return f"{_mes_inicial(self.meses_anteriores)}-01"
+
+    def cargar(self) -> List[dict]:
+        """
+        Carga las reservaciones de la ventana caliente en orden de creación:
+        las de ``fecha_inicial()`` en adelante y las pendientes de cualquier fecha
+        """
+        with self._cerrojo:
+            # Unión de dos búsquedas indexadas: con OR SQLite recorrería toda la tabla
+            registros = self._leer(
+                """
+                SELECT datos FROM reservaciones WHERE rowid IN (
+                    SELECT rowid FROM reservaciones WHERE fecha >= ?
+                    UNION SELECT rowid FROM reservaciones WHERE estado = 'pendiente'
+                ) ORDER BY rowid
+                """,
+                (self.fecha_inicial(),)
+            )
+            self._ids_cargados = {r.get("id") for r in registros}
+        return registros
+
+    def guardar(self, registros: List[dict]) -> None:
+        """
+        Reemplaza las reservaciones cargadas por los registros indicados; el
+        historial que no se cargó se conserva
+        """
+        ids = {r.get("id") for r in registros}
+        with self._cerrojo:
+            with self._transaccion() as conexion:
+                conexion.executemany("DELETE FROM reservaciones WHERE id = ?",
+                                     [(id_reservacion,) for id_reservacion in self._ids_cargados - ids])
+                self._insertar_reservaciones(registros)
+            self._ids_cargados = ids
+
+    def registrar(self, registros: List[dict]) -> None:
+        """Inserta o actualiza las reservaciones indicadas en una transacción"""
+        with self._cerrojo:
+            with self._transaccion():
+                self._insertar_reservaciones(registros)
+            self._ids_cargados.update(r.get("id") for r in registros)
+
+    def eliminar(self, ids: List[str]) -> None:
+        """Elimina las reservaciones indicadas en una transacción"""
+        with self._cerrojo:
+            with self._transaccion() as conexion:
+                conexion.executemany("DELETE FROM reservaciones WHERE id = ?",
+                                     [(id_reservacion,) for id_reservacion in ids])
+            self._ids_cargados.difference_update(ids)
+
+    def consultar(self, espacio: Optional[str] = None, fecha: Optional[str] = None,
+                  estados: Optional[List[str]] = None, id_usuario: Optional[str] = None,
+                  ids: Optional[List[str]] = None, fecha_inicio: Optional[str] = None,
+                  fecha_fin: Optional[str] = None) -> List[dict]:
+        """
+        Consulta reservaciones usando las columnas indexadas
+
+        Args:
+            espacio: Nombre del espacio (sin distinguir mayúsculas)
+            fecha: Fecha en formato YYYY-MM-DD
+            estados: Estados aceptados
+            id_usuario: ID del usuario que reservó
+            ids: IDs de reservación
+            fecha_inicio: Fecha mínima YYYY-MM-DD, inclusive
+            fecha_fin: Fecha máxima YYYY-MM-DD, inclusive
+
+        Returns:
+            List[dict]: Registros que cumplen todos los filtros
+        """
+        condiciones = []
+        parametros = []
+        if espacio is not None:
+            condiciones.append("espacio = ?")
+            parametros.append(espacio)
+        if fecha is not None:
+            condiciones.append("fecha = ?")
+            parametros.append(fecha)
+        if fecha_inicio is not None:
+            condiciones.append("fecha >= ?")
+            parametros.append(fecha_inicio)
+        if fecha_fin is not None:
+            condiciones.append("fecha <= ?")
+            parametros.append(fecha_fin)
+        if id_usuario is not None:
+            condiciones.append("id_usuario = ?")
+            parametros.append(id_usuario)
+        for columna, valores in (("estado", estados), ("id", ids)):
+            if valores is not None:
+                valores = list(valores)
+                condiciones.append(f"{columna} IN ({', '.join('?' * len(valores))})")
+                parametros.extend(valores)
+
+        consulta = "SELECT datos FROM reservaciones"
+        if condiciones:
+            consulta += " WHERE " + " AND ".join(condiciones)
+        consulta += " ORDER BY rowid"
+        return self._leer(consulta, parametros)
+
+    def _insertar_reservaciones(self, registros: List[dict]) -> None:
+        self.conexion.executemany(
+            """
+            INSERT INTO reservaciones
+                (id, espacio, fecha, hora_inicio, hora_fin, estado, id_usuario, datos)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                espacio = excluded.espacio,
+                fecha = excluded.fecha,
+                hora_inicio = excluded.hora_inicio,
+                hora_fin = excluded.hora_fin,
+                estado = excluded.estado,
+                id_usuario = excluded.id_usuario,
+                datos = excluded.datos
+            """,
+            [self._fila_reservacion(r) for r in registros]
+        )
+
+    @staticmethod
+    def _fila_reservacion(registro: dict) -> tuple:
+        horario = registro.get("horario") or {}
+        return (
+            registro.get("id"),
+            (registro.get("espacio") or {}).get("nombre"),
+            horario.get("fecha"),
+            horario.get("hora_inicio"),
+            horario.get("hora_fin"),
+            registro.get("estado"),
+            (registro.get("usuario") or {}).get("id"),
+            json.dumps(registro, ensure_ascii=False)
+        )
+
+    # Catálogos de usuarios y espacios
+
+    def cargar_usuarios(self) -> List[dict]:
+        return self._leer("SELECT datos FROM usuarios ORDER BY rowid")
+
+    def guardar_usuario(self, datos: dict) -> None:
+        with self._transaccion() as conexion:
+            conexion.execute(
+                "INSERT OR REPLACE INTO usuarios (id, rol, datos) VALUES (?, ?, ?)",
+                (datos["id"], datos.get("rol"), json.dumps(datos, ensure_ascii=False))
+            )
+
+    def eliminar_usuario(self, id_usuario: str) -> None:
+        with self._transaccion() as conexion:
+            conexion.execute("DELETE FROM usuarios WHERE id = ?", (id_usuario,))
+
+    def cargar_espacios(self) -> List[dict]:
+        return self._leer("SELECT datos FROM espacios ORDER BY rowid")
+
+    def guardar_espacio(self, datos: dict) -> None:
+        with self._transaccion() as conexion:
+            conexion.execute(
+                "INSERT OR REPLACE INTO espacios (nombre, tipo, capacidad, datos) VALUES (?, ?, ?, ?)",
+                (datos["nombre"], datos.get("tipo"), datos.get("capacidad"),
+                 json.dumps(datos, ensure_ascii=False))
+            )
+
+    def eliminar_espacio(self, nombre: str) -> None:
+        with self._transaccion() as conexion:
+            conexion.execute("DELETE FROM espacios WHERE nombre = ?", (nombre,))
+
+    # Importación y exportación JSON
+
+    def importar_json(self, ruta_reservaciones: str, ruta_usuarios: str, ruta_espacios: str) -> None:
+        """Reemplaza el contenido de la base de datos con los archivos JSON"""
+        reservaciones = AlmacenamientoJSON(ruta_reservaciones).cargar()
+        usuarios = AlmacenamientoJSON(ruta_usuarios).cargar()
+        espacios = AlmacenamientoJSON(ruta_espacios).cargar()
+        with self._transaccion() as conexion:
+            conexion.execute("DELETE FROM reservaciones")
+            conexion.execute("DELETE FROM usuarios")
+            conexion.execute("DELETE FROM espacios")
+            self._insertar_reservaciones(reservaciones)
+            conexion.executemany(
+                "INSERT OR REPLACE INTO usuarios (id, rol, datos) VALUES (?, ?, ?)",
+                [(u["id"], u.get("rol"), json.dumps(u, ensure_ascii=False)) for u in usuarios]
+            )
+            conexion.executemany(
+                "INSERT OR REPLACE INTO espacios (nombre, tipo, capacidad, datos) VALUES (?, ?, ?, ?)",
+                [(e["nombre"], e.get("tipo"), e.get("capacidad"), json.dumps(e, ensure_ascii=False))
+                 for e in espacios]
+            )
+
+    def exportar_json(self, ruta_reservaciones: str, ruta_usuarios: str, ruta_espacios: str) -> None:
+        """Escribe el contenido de la base de datos (incluido el historial) en los archivos JSON"""
+        _escribir_json(ruta_reservaciones, self.consultar())
+        _escribir_json(ruta_usuarios, self.cargar_usuarios())
+        _escribir_json(ruta_espacios, self.cargar_espacios())
+
+
+def _escribir_json(archivo: str, registros: List[dict]) -> None:
+    """Escribe el arreglo de registros de forma atómica (temporal + renombrado)"""
+    temporal = archivo + ".tmp"
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(registros, f, indent=4, ensure_ascii=False)
+    os.replace(temporal, archivo)
+
+
+def crear_almacenamiento(modo: str, archivo: str, **opciones):
+    """
+    Crea el almacenamiento de reservaciones según el modo indicado
+
+    Args:
+        modo: "json" (reescritura completa), "diario" (solo-anexado),
+            "particionado" (un archivo por mes) o "sqlite"
+        archivo: Ruta al archivo JSON de reservaciones
+        **opciones: Opciones específicas del almacenamiento
+
+    Returns:
+        Objeto de almacenamiento
+    """
+    if modo == "json":
+        return AlmacenamientoJSON(archivo)
+    if modo == "diario":
+        return AlmacenamientoDiario(archivo, **opciones)
+    if modo == "particionado":
+        # Las particiones viven en datos/reservas/; la primera vez se reparte el arreglo JSON
+        directorio = opciones.pop("directorio", None) or os.path.splitext(archivo)[0]
+        return AlmacenamientoParticionado(directorio, archivo_origen=archivo, **opciones)
+    if modo == "sqlite":
+        ruta_bd = opciones.get("ruta_bd") or os.path.join(os.path.dirname(archivo), "reservatec.db")
+        return AlmacenamientoSQLite(ruta_bd, meses_anteriores=opciones.get("meses_anteriores", 0))
+    raise ValueError(f"Modo de almacenamiento no válido: {modo}")
@@ -0,0 +1,147 @@
+import hashlib
+import os
+import pickle
+from typing import List, Optional
+
+
+def huella_archivo(ruta: str) -> Optional[tuple]:
+    """
+    Huella de un archivo: (tamaño, mtime en nanosegundos, hash SHA-256)
+
+    Returns:
+        Optional[tuple]: None si el archivo no existe
+    """
+    try:
+        estado = os.stat(ruta)
+    except FileNotFoundError:
+        return None
+    return estado.st_size, estado.st_mtime_ns, _hash_archivo(ruta)
+
+
+def _hash_archivo(ruta: str) -> str:
+    digest = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b""):
+            digest.update(bloque)
+    return digest.hexdigest()
+
+
+class CacheArranque:
+    """
+    Instantánea binaria (pickle) de los datos cargados al arrancar.
+
+    Se guarda junto con la huella (tamaño, mtime y hash del contenido) de
+    cada archivo de datos del que se obtuvo. Mientras las huellas coincidan se
+    usa la instantánea en lugar de volver a leer los archivos; si alguno
+    cambió, los datos se reconstruyen y la instantánea se reescribe.
+
+    Para no leer los archivos completos en cada arranque, el hash solo se
+    calcula cuando el tamaño coincide pero el mtime no (p. ej. un archivo
+    reescrito con el mismo contenido).
+    """
+    # Cambiar al modificar el formato de los datos guardados
+    VERSION = 4
+
+    def __init__(self, ruta_cache: str, archivos: List[str]):
+        """
+        Args:
+            ruta_cache: Archivo de la instantánea
+            archivos: Archivos de datos de los que dependen los datos guardados
+        """
+        self.ruta_cache = ruta_cache
+        self.archivos = list(archivos)
+        self.aciertos = 0
+        self.fallos = 0
+
+    def leer(self):
+        """
+        Lee la instantánea si sigue vigente
+
+        Returns:
+            Los datos guardados, o None si no hay instantánea o está vencida
+        """
+        contenido = self._leer()
+        if contenido is None:
+            self.fallos += 1
+            return None
+        huellas = self._comprobar(contenido["huellas"])
+        if huellas is None:
+            self.fallos += 1
+            return None
+
+        self.aciertos += 1
+        if huellas != contenido["huellas"]:
+            # Mismo contenido con otro mtime: se actualiza la huella para no
+            # volver a calcular el hash en el siguiente arranque
+            self.guardar(contenido["datos"], huellas)
+        return contenido["datos"]
+
+    def huellas(self) -> List[Optional[tuple]]:
+        """
+        Huellas actuales de los archivos de datos. Deben tomarse antes de
+        leer los archivos: si cambian mientras se leen, la instantánea queda
+        vencida en lugar de guardar datos viejos con una huella nueva.
+        """
+        return [huella_archivo(ruta) for ruta in self.archivos]
+
+    def guardar(self, datos, huellas: Optional[List[tuple]] = None) -> None:
+        """Escribe la instantánea de forma atómica (archivo temporal + reemplazo)"""
+        if huellas is None:
+            huellas = self.huellas()
+        temporal = self.ruta_cache + ".tmp"
+        try:
+            with open(temporal, 'wb') as f:
+                pickle.dump({"version": self.VERSION, "huellas": huellas, "datos": datos},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporal, self.ruta_cache)
+        except Exception as e:
+            # La caché es opcional: si no se puede escribir, se sigue sin ella
+            print(f"No se pudo guardar la caché de arranque: {str(e)}")
+
+    def invalidar(self) -> None:
+        """Borra la instantánea"""
+        try:
+            os.remove(self.ruta_cache)
+        except FileNotFoundError:
+            pass
+
+    def _leer(self) -> Optional[dict]:
+        try:
+            with open(self.ruta_cache, 'rb') as f:
+                contenido = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Caché de arranque dañada, se reconstruye: {str(e)}")
+            return None
+        if not isinstance(contenido, dict) or contenido.get("version") != self.VERSION:
+            return None
+        return contenido
+
+    def _comprobar(self, huellas: List[tuple]) -> Optional[List[tuple]]:
+        """
+        Compara las huellas guardadas con los archivos actuales
+
+        Returns:
+            Optional[List[tuple]]: Huellas actuales si el contenido no cambió, o None
+        """
+        if len(huellas) != len(self.archivos):
+            return None
+        actualizadas = []
+        for ruta, huella in zip(self.archivos, huellas):
+            try:
+                estado = os.stat(ruta)
+            except FileNotFoundError:
+                if huella is not None:
+                    return None
+                actualizadas.append(None)
+                continue
+            if huella is None or estado.st_size != huella[0]:
+                return None
+            if estado.st_mtime_ns != huella[1]:
+                hash_actual = _hash_archivo(ruta)
+                if hash_actual != huella[2]:
+                    return None
+                huella = (estado.st_size, estado.st_mtime_ns, hash_actual)
+            actualizadas.append(huella)
+        return actualizadas
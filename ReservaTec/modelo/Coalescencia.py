@@ -0,0 +1,112 @@
+import threading
+from time import monotonic
+
+
+class _Solicitud:
+    __slots__ = ("reservacion", "resultado")
+
+    def __init__(self, reservacion):
+        self.reservacion = reservacion
+        self.resultado = None
+
+
+class ColaReservaciones:
+    """
+    Cola que agrupa las solicitudes concurrentes de nuevas reservaciones.
+
+    Cada hilo que llama a ``agregar`` deja su solicitud en la cola. Si nadie
+    está procesando, ese hilo se vuelve el líder: espera ``ventana_ms`` (o a
+    que se junten ``max_lote`` solicitudes), toma las pendientes y las
+    resuelve con una sola llamada a ``agregar_lote`` del gestor, en orden de
+    llegada contra el índice de intervalos y con una sola escritura. Los
+    demás hilos esperan su resultado individual. Mientras el líder escribe,
+    las solicitudes nuevas se acumulan para el siguiente lote, así que el
+    tamaño de los lotes crece con la carga en lugar de encolar escrituras.
+    """
+
+    def __init__(self, gestor, ventana_ms: float = 2, max_lote: int = 256):
+        """
+        Args:
+            gestor: GestorReservaciones en el que se agregan las reservaciones
+            ventana_ms: Espera del líder para juntar solicitudes antes de procesar
+            max_lote: Solicitudes máximas por lote
+        """
+        if ventana_ms < 0 or max_lote < 1:
+            raise ValueError("La ventana debe ser >= 0 y el máximo del lote >= 1")
+        self.gestor = gestor
+        self.ventana_ms = ventana_ms
+        self.max_lote = max_lote
+        self._condicion = threading.Condition()
+        self._pendientes = []
+        self._hay_lider = False
+
+        self.lotes = 0
+        self.solicitudes = 0
+        self.lote_maximo = 0
+
+    def agregar(self, reservacion) -> tuple:
+        """
+        Agrega una reservación, agrupada con las solicitudes concurrentes
+
+        Args:
+            reservacion: Reservación a agregar
+
+        Returns:
+            tuple: (éxito, mensaje)
+        """
+        solicitud = _Solicitud(reservacion)
+        with self._condicion:
+            self._pendientes.append(solicitud)
+            if len(self._pendientes) >= self.max_lote:
+                self._condicion.notify_all()
+            while solicitud.resultado is None:
+                if self._hay_lider:
+                    self._condicion.wait()
+                    continue
+                self._hay_lider = True
+                try:
+                    self._procesar_lote()
+                finally:
+                    self._hay_lider = False
+                    self._condicion.notify_all()
+            return solicitud.resultado
+
+    def estadisticas(self) -> dict:
+        """
+        Contadores de agrupación
+
+        Returns:
+            dict: lotes, solicitudes, promedio y máximo de solicitudes por lote
+        """
+        with self._condicion:
+            return {
+                "lotes": self.lotes,
+                "solicitudes": self.solicitudes,
+                "promedio_lote": self.solicitudes / self.lotes if self.lotes else 0.0,
+                "lote_maximo": self.lote_maximo,
+            }
+
+    def _procesar_lote(self) -> None:
+        """Procesa un lote; se llama con la condición tomada y la suelta durante la escritura"""
+        limite = monotonic() + self.ventana_ms / 1000
+        while len(self._pendientes) < self.max_lote:
+            restante = limite - monotonic()
+            if restante <= 0:
+                break
+            self._condicion.wait(restante)
+        lote = self._pendientes[:self.max_lote]
+        del self._pendientes[:self.max_lote]
+
+        self._condicion.release()
+        try:
+            resultados = self.gestor.agregar_lote([s.reservacion for s in lote], ordenar=False)
+        except Exception as e:
+            resultados = [(False, f"Error al agregar la reservación: {str(e)}")] * len(lote)
+        finally:
+            self._condicion.acquire()
+
+        for solicitud, resultado in zip(lote, resultados):
+            solicitud.resultado = resultado
+        self.lotes += 1
+        self.solicitudes += len(lote)
+        self.lote_maximo = max(self.lote_maximo, len(lote))
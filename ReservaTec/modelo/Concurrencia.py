@@ -0,0 +1,104 @@
+import threading
+from contextlib import contextmanager, nullcontext
+
+
+class CerrojoLectoresEscritores:
+    """
+    Cerrojo de lectores/escritores con preferencia de escritura.
+
+    Varios hilos pueden estar dentro de ``lectura()`` a la vez; ``escritura()``
+    es exclusiva. Cuando un escritor espera, los lectores nuevos esperan tras
+    él para que las escrituras no se posterguen indefinidamente. Es reentrante
+    dentro del mismo hilo: un escritor puede volver a entrar en lectura o
+    escritura, y un lector en lectura; pasar de lectura a escritura no está
+    permitido.
+    """
+
+    def __init__(self):
+        self._condicion = threading.Condition()
+        self._lectores = 0
+        self._escritor = None
+        self._escritores_esperando = 0
+        self._local = threading.local()
+
+    @contextmanager
+    def lectura(self):
+        """Sección de solo lectura, compartida con otros lectores"""
+        anidada = self._escritor == threading.get_ident() or getattr(self._local, "lecturas", 0) > 0
+        if not anidada:
+            with self._condicion:
+                self._condicion.wait_for(lambda: self._escritor is None and not self._escritores_esperando)
+                self._lectores += 1
+        self._local.lecturas = getattr(self._local, "lecturas", 0) + 1
+        try:
+            yield
+        finally:
+            self._local.lecturas -= 1
+            if not anidada:
+                with self._condicion:
+                    self._lectores -= 1
+                    if not self._lectores:
+                        self._condicion.notify_all()
+
+    @contextmanager
+    def escritura(self):
+        """Sección exclusiva"""
+        yo = threading.get_ident()
+        if self._escritor == yo:
+            yield
+            return
+        if getattr(self._local, "lecturas", 0):
+            raise RuntimeError("No se puede pasar de lectura a escritura")
+        with self._condicion:
+            self._escritores_esperando += 1
+            try:
+                self._condicion.wait_for(lambda: self._escritor is None and not self._lectores)
+            finally:
+                self._escritores_esperando -= 1
+            self._escritor = yo
+        try:
+            yield
+        finally:
+            with self._condicion:
+                self._escritor = None
+                self._condicion.notify_all()
+
+
+class CerrojosPorClave:
+    """
+    Un cerrojo por clave (p. ej. por espacio), creado al primer uso, para
+    serializar operaciones sobre la misma clave sin bloquear a las demás
+    """
+
+    def __init__(self):
+        self._cerrojo = threading.Lock()
+        self._cerrojos = {}
+
+    @contextmanager
+    def bloquear(self, *claves):
+        """
+        Toma los cerrojos de las claves indicadas, siempre en el mismo orden
+        para que dos hilos con claves en común no se bloqueen mutuamente
+        """
+        with self._cerrojo:
+            cerrojos = [self._cerrojos.setdefault(c, threading.Lock()) for c in sorted(set(claves))]
+        for cerrojo in cerrojos:
+            cerrojo.acquire()
+        try:
+            yield
+        finally:
+            for cerrojo in reversed(cerrojos):
+                cerrojo.release()
+
+
+class SinCerrojo:
+    """Sustituto sin sincronización de los cerrojos anteriores, para uso en un solo hilo"""
+
+    def lectura(self):
+        return nullcontext()
+
+    def escritura(self):
+        return nullcontext()
+
+    def bloquear(self, *claves):
+        return nullcontext()
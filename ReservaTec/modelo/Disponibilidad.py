@@ -0,0 +1,286 @@
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+# Horario laboral: 7:00 - 22:00 en bloques de 30 minutos
+HORA_APERTURA = 7 * 60
+HORA_CIERRE = 22 * 60
+DURACION_FRANJA = 30
+NUM_FRANJAS = (HORA_CIERRE - HORA_APERTURA) // DURACION_FRANJA
+TODAS_LAS_FRANJAS = (1 << NUM_FRANJAS) - 1
+
+
+def _formatear(minutos: int) -> str:
+    return f"{minutos // 60:02d}:{minutos % 60:02d}"
+
+
+# Etiquetas (inicio, fin) de cada franja, precalculadas
+ETIQUETAS_FRANJAS = [
+    (_formatear(HORA_APERTURA + i * DURACION_FRANJA),
+     _formatear(HORA_APERTURA + (i + 1) * DURACION_FRANJA))
+    for i in range(NUM_FRANJAS)
+]
+
+
+def a_minutos(hora) -> int:
+    """Convierte un objeto time (o un entero de minutos) a minutos desde medianoche"""
+    if isinstance(hora, int):
+        return hora
+    return hora.hour * 60 + hora.minute
+
+
+def minutos_de_texto(hora: str) -> int:
+    """Convierte una hora HH:MM a minutos desde medianoche"""
+    horas, minutos = hora.split(":")
+    return int(horas) * 60 + int(minutos)
+
+
+def mascara_intervalo(inicio: int, fin: int) -> int:
+    """
+    Máscara de las franjas que se traslapan con el intervalo [inicio, fin)
+
+    Args:
+        inicio: Minutos desde medianoche
+        fin: Minutos desde medianoche
+
+    Returns:
+        int: Bit i encendido si la franja i está ocupada
+    """
+    primera = max(0, (inicio - HORA_APERTURA) // DURACION_FRANJA)
+    ultima = min(NUM_FRANJAS, -(-(fin - HORA_APERTURA) // DURACION_FRANJA))
+    if ultima <= primera:
+        return 0
+    return ((1 << (ultima - primera)) - 1) << primera
+
+
+def inicios_contiguos(libres: int, num_franjas: int) -> int:
+    """
+    Máscara de las franjas donde empiezan ``num_franjas`` franjas libres seguidas
+
+    Args:
+        libres: Máscara de franjas libres
+        num_franjas: Cantidad de franjas consecutivas requeridas
+    """
+    resultado = libres
+    for desplazamiento in range(1, num_franjas):
+        resultado &= libres >> desplazamiento
+    return resultado
+
+
+def indices_encendidos(mascara: int) -> List[int]:
+    """Posiciones de los bits encendidos, en orden ascendente"""
+    indices = []
+    while mascara:
+        bit = mascara & -mascara
+        indices.append(bit.bit_length() - 1)
+        mascara ^= bit
+    return indices
+
+
+class MotorDisponibilidad:
+    """
+    Disponibilidad de los espacios representada como máscaras de bits.
+
+    Cada par (espacio, fecha) tiene un entero con un bit por franja de 30
+    minutos entre 7:00 y 22:00. Las máscaras se calculan a partir del índice
+    de intervalos la primera vez que se consultan y luego se mantienen con
+    cada cambio: agregar una reservación enciende sus bits y quitarla obliga a
+    recalcular solo esa máscara.
+    """
+
+    def __init__(self, indice_intervalos):
+        self._indice = indice_intervalos
+        self._mascaras = {}
+
+    def mascara_ocupacion(self, nombre_espacio: str, fecha) -> int:
+        """Máscara de las franjas ocupadas de un espacio en una fecha"""
+        clave = self._indice.clave(nombre_espacio, fecha)
+        mascara = self._mascaras.get(clave)
+        if mascara is None:
+            intervalos = self._indice.intervalos(nombre_espacio, fecha)
+            if not intervalos:
+                # Las fechas sin reservaciones no se guardan
+                return 0
+            mascara = 0
+            for inicio, fin, _ in intervalos:
+                mascara |= mascara_intervalo(a_minutos(inicio), a_minutos(fin))
+            self._mascaras[clave] = mascara
+        return mascara
+
+    def mascara_libre(self, nombre_espacio: str, fecha) -> int:
+        """Máscara de las franjas libres de un espacio en una fecha"""
+        return ~self.mascara_ocupacion(nombre_espacio, fecha) & TODAS_LAS_FRANJAS
+
+    def agregar(self, nombre_espacio: str, fecha, inicio, fin) -> None:
+        """Marca como ocupado el intervalo de una nueva reservación activa"""
+        clave = self._indice.clave(nombre_espacio, fecha)
+        if clave in self._mascaras:
+            self._mascaras[clave] |= mascara_intervalo(a_minutos(inicio), a_minutos(fin))
+
+    def quitar(self, nombre_espacio: str, fecha) -> None:
+        """Descarta la máscara de un espacio y fecha; se recalcula al consultarla"""
+        self._mascaras.pop(self._indice.clave(nombre_espacio, fecha), None)
+
+    def limpiar(self) -> None:
+        self._mascaras.clear()
+
+    def franjas_libres(self, nombre_espacio: str, fecha) -> List[int]:
+        """Índices de las franjas libres"""
+        return indices_encendidos(self.mascara_libre(nombre_espacio, fecha))
+
+    def ventanas_libres(self, nombre_espacio: str, fecha, num_franjas: int) -> List[int]:
+        """Índices de las franjas donde empieza una ventana libre de ``num_franjas``"""
+        libres = self.mascara_libre(nombre_espacio, fecha)
+        return indices_encendidos(inicios_contiguos(libres, num_franjas))
+
+
+class CacheDisponibilidad:
+    """
+    Respuestas de disponibilidad ya calculadas, por (espacio, fecha).
+
+    Guarda como máximo ``capacidad`` entradas y descarta la usada hace más
+    tiempo (LRU). El gestor invalida exactamente la clave de cada espacio y
+    fecha cuyo conjunto de reservaciones activas cambia, así que una consulta
+    repetida cuesta una búsqueda en un diccionario. Los valores guardados
+    son tuplas para que ningún llamador pueda modificarlos.
+    """
+
+    def __init__(self, capacidad: int = 4096):
+        """
+        Args:
+            capacidad: Entradas máximas (0 desactiva la caché)
+        """
+        self.capacidad = capacidad
+        self._entradas = OrderedDict()
+        # Las consultas concurrentes comparten la caché (solo bajo el cerrojo de lectura del gestor)
+        self._cerrojo = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidaciones = 0
+
+    def obtener(self, clave) -> Optional[tuple]:
+        """Respuesta guardada para la clave, o None"""
+        with self._cerrojo:
+            valor = self._entradas.get(clave)
+            if valor is None:
+                self.fallos += 1
+                return None
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return valor
+
+    def guardar(self, clave, valor: tuple) -> None:
+        if not self.capacidad:
+            return
+        with self._cerrojo:
+            self._entradas[clave] = valor
+            self._entradas.move_to_end(clave)
+            if len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)
+
+    def invalidar(self, clave) -> None:
+        """Descarta la respuesta de un espacio y fecha"""
+        with self._cerrojo:
+            if self._entradas.pop(clave, None) is not None:
+                self.invalidaciones += 1
+
+    def limpiar(self) -> None:
+        with self._cerrojo:
+            self._entradas.clear()
+
+    def estadisticas(self) -> dict:
+        """
+        Returns:
+            dict: aciertos, fallos, tasa de aciertos, invalidaciones, entradas y capacidad
+        """
+        with self._cerrojo:
+            consultas = self.aciertos + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+                "invalidaciones": self.invalidaciones,
+                "entradas": len(self._entradas),
+                "capacidad": self.capacidad,
+            }
+
+
+# Traduce los caracteres '0'/'1' de una máscara en binario a bytes 0/1
+_BITS_A_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class MatrizOcupacion:
+    """
+    Matriz de ocupación espacios × días × franjas.
+
+    Los datos se guardan en un ``array('B')`` plano (1 = franja ocupada) y
+    además se conservan las máscaras de bits de cada espacio y día, con las
+    que se calculan las reducciones sin recorrer franja por franja.
+    """
+
+    def __init__(self, espacios: List[str], fechas: List, mascaras: List[List[int]]):
+        """
+        Args:
+            espacios: Nombres de los espacios (primera dimensión)
+            fechas: Fechas (segunda dimensión)
+            mascaras: Máscara de ocupación por espacio y fecha
+        """
+        self.espacios = list(espacios)
+        self.fechas = list(fechas)
+        self.mascaras = mascaras
+        self.datos = array('B')
+        for mascaras_espacio in mascaras:
+            for mascara in mascaras_espacio:
+                bits = format(mascara, f"0{NUM_FRANJAS}b")[::-1].encode("ascii")
+                self.datos.frombytes(bits.translate(_BITS_A_BYTES))
+
+    @property
+    def forma(self) -> tuple:
+        return len(self.espacios), len(self.fechas), NUM_FRANJAS
+
+    def ocupada(self, indice_espacio: int, indice_fecha: int, franja: int) -> bool:
+        """Indica si una franja está ocupada"""
+        return bool(self.datos[(indice_espacio * len(self.fechas) + indice_fecha) * NUM_FRANJAS + franja])
+
+    def fila(self, indice_espacio: int, indice_fecha: int) -> array:
+        """Ocupación de todas las franjas de un espacio en una fecha"""
+        inicio = (indice_espacio * len(self.fechas) + indice_fecha) * NUM_FRANJAS
+        return self.datos[inicio:inicio + NUM_FRANJAS]
+
+    def espacios_libres(self, hora_inicio: str = "07:00", hora_fin: str = "22:00") -> List[str]:
+        """
+        Espacios libres durante toda la ventana horaria en todas las fechas
+
+        Args:
+            hora_inicio: Inicio de la ventana (HH:MM)
+            hora_fin: Fin de la ventana (HH:MM)
+
+        Returns:
+            List[str]: Nombres de los espacios libres
+        """
+        ventana = mascara_intervalo(minutos_de_texto(hora_inicio), minutos_de_texto(hora_fin))
+        libres = []
+        for nombre, mascaras_espacio in zip(self.espacios, self.mascaras):
+            ocupacion = 0
+            for mascara in mascaras_espacio:
+                ocupacion |= mascara
+            if not ocupacion & ventana:
+                libres.append(nombre)
+        return libres
+
+    def utilizacion_por_espacio(self) -> Dict[str, float]:
+        """Fracción de franjas ocupadas de cada espacio en el rango de fechas"""
+        total = len(self.fechas) * NUM_FRANJAS
+        return {
+            nombre: (sum(m.bit_count() for m in mascaras_espacio) / total if total else 0.0)
+            for nombre, mascaras_espacio in zip(self.espacios, self.mascaras)
+        }
+
+    def utilizacion_por_fecha(self) -> Dict:
+        """Fracción de franjas ocupadas de todos los espacios en cada fecha"""
+        total = len(self.espacios) * NUM_FRANJAS
+        return {
+            fecha: (sum(m[i].bit_count() for m in self.mascaras) / total if total else 0.0)
+            for i, fecha in enumerate(self.fechas)
+        }
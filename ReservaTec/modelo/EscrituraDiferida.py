@@ -0,0 +1,184 @@
+import atexit
+import threading
+from time import perf_counter
+from typing import Callable, Optional
+
+
+class EscritorDiferido:
+    """
+    Escritura diferida con confirmación en grupo.
+
+    Las mutaciones solo marcan el estado como pendiente (``marcar``); un hilo
+    de fondo llama a ``volcar`` como máximo cada ``intervalo_ms`` milisegundos
+    desde la primera mutación pendiente, o en cuanto se acumulan
+    ``max_mutaciones``. Así una ráfaga de cambios se persiste con una sola
+    escritura. Quien necesite confirmación durable llama a ``esperar``, que
+    bloquea hasta que termina un volcado posterior a sus mutaciones.
+    """
+
+    def __init__(self, volcar: Callable[[], None], intervalo_ms: float = 50, max_mutaciones: int = 100):
+        """
+        Args:
+            volcar: Función que persiste el estado pendiente
+            intervalo_ms: Espera máxima entre la primera mutación pendiente y su volcado
+            max_mutaciones: Mutaciones pendientes que provocan un volcado inmediato
+        """
+        if intervalo_ms < 0 or max_mutaciones < 1:
+            raise ValueError("El intervalo debe ser >= 0 y el máximo de mutaciones >= 1")
+        self._volcar = volcar
+        self.intervalo_ms = intervalo_ms
+        self.max_mutaciones = max_mutaciones
+
+        self._condicion = threading.Condition()
+        # Generación de la última mutación marcada y de la última volcada
+        self._generacion = 0
+        self._generacion_volcada = 0
+        self._pendientes = 0
+        self._primera_pendiente = None
+        self._forzar = False
+        self._activo = True
+
+        self.volcados = 0
+        self.mutaciones = 0
+        self.errores = 0
+        self._latencia_total = 0.0
+        self._latencia_maxima = 0.0
+        self._latencia_ultima = 0.0
+        self._espera_total = 0.0
+        self._espera_maxima = 0.0
+
+        self._hilo = threading.Thread(target=self._ejecutar, name="EscritorDiferido", daemon=True)
+        self._hilo.start()
+        atexit.register(self.detener)
+
+    def marcar(self, mutaciones: int = 1) -> int:
+        """
+        Registra mutaciones pendientes de persistir
+
+        Returns:
+            int: Generación de la mutación, para ``esperar``
+        """
+        with self._condicion:
+            self._generacion += 1
+            self._pendientes += mutaciones
+            self.mutaciones += mutaciones
+            if self._primera_pendiente is None:
+                self._primera_pendiente = perf_counter()
+            self._condicion.notify_all()
+            return self._generacion
+
+    def esperar(self, generacion: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que se vuelquen las mutaciones marcadas hasta ``generacion``
+        (por defecto, todas las marcadas hasta ahora)
+
+        Returns:
+            bool: True si quedaron persistidas antes del timeout
+        """
+        with self._condicion:
+            if generacion is None:
+                generacion = self._generacion
+            return self._condicion.wait_for(
+                lambda: self._generacion_volcada >= generacion or not self._hilo.is_alive(), timeout
+            ) and self._generacion_volcada >= generacion
+
+    def sincronizar(self, timeout: Optional[float] = None) -> bool:
+        """Vuelca de inmediato lo pendiente y espera a que termine"""
+        with self._condicion:
+            generacion = self._generacion
+            self._forzar = True
+            self._condicion.notify_all()
+        return self.esperar(generacion, timeout)
+
+    def detener(self) -> None:
+        """Vuelca lo pendiente y detiene el hilo de fondo"""
+        with self._condicion:
+            if not self._activo:
+                return
+            self._activo = False
+            self._condicion.notify_all()
+        self._hilo.join()
+        atexit.unregister(self.detener)
+
+    def estadisticas(self) -> dict:
+        """
+        Contadores para ajustar el intervalo y el máximo de mutaciones
+
+        Returns:
+            dict: volcados, mutaciones, mutaciones por volcado, errores, pendientes,
+                latencia de cada volcado y espera desde la primera mutación
+                pendiente hasta su volcado (en ms)
+        """
+        with self._condicion:
+            exitosos = self.volcados or 1
+            return {
+                "volcados": self.volcados,
+                "mutaciones": self.mutaciones,
+                "mutaciones_por_volcado": self.mutaciones / exitosos if self.volcados else 0.0,
+                "errores": self.errores,
+                "pendientes": self._pendientes,
+                "latencia_promedio_ms": self._latencia_total * 1000 / exitosos,
+                "latencia_maxima_ms": self._latencia_maxima * 1000,
+                "latencia_ultima_ms": self._latencia_ultima * 1000,
+                "espera_promedio_ms": self._espera_total * 1000 / exitosos,
+                "espera_maxima_ms": self._espera_maxima * 1000,
+            }
+
+    def _ejecutar(self) -> None:
+        while True:
+            with self._condicion:
+                self._condicion.wait_for(lambda: self._pendientes or self._forzar or not self._activo)
+                if not self._pendientes:
+                    self._forzar = False
+                    self._generacion_volcada = self._generacion
+                    self._condicion.notify_all()
+                    if not self._activo:
+                        return
+                    continue
+                # Se espera a completar el intervalo o el máximo de mutaciones
+                limite = self._primera_pendiente + self.intervalo_ms / 1000
+                while (self._activo and not self._forzar
+                       and self._pendientes < self.max_mutaciones):
+                    restante = limite - perf_counter()
+                    if restante <= 0:
+                        break
+                    self._condicion.wait(restante)
+
+                generacion = self._generacion
+                pendientes = self._pendientes
+                primera = self._primera_pendiente
+                self._pendientes = 0
+                self._primera_pendiente = None
+                self._forzar = False
+
+            inicio = perf_counter()
+            try:
+                self._volcar()
+                exito = True
+            except Exception as e:
+                print(f"Error en la escritura diferida: {str(e)}")
+                exito = False
+            fin = perf_counter()
+
+            with self._condicion:
+                if exito:
+                    self.volcados += 1
+                    self._generacion_volcada = generacion
+                    latencia = fin - inicio
+                    self._latencia_total += latencia
+                    self._latencia_maxima = max(self._latencia_maxima, latencia)
+                    self._latencia_ultima = latencia
+                    espera = fin - primera
+                    self._espera_total += espera
+                    self._espera_maxima = max(self._espera_maxima, espera)
+                else:
+                    # Se reintenta en el siguiente intervalo
+                    self.errores += 1
+                    self._pendientes += pendientes
+                    if self._primera_pendiente is None:
+                        self._primera_pendiente = perf_counter()
+                    if not self._activo:
+                        # Al detener no se reintenta indefinidamente
+                        self._condicion.notify_all()
+                        return
+                self._condicion.notify_all()
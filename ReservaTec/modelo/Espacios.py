@@ -1,60 +1,75 @@
-from typing import Dict
-
-class Espacio:
-    """Clase base para representar espacios reservables"""
-    def __init__(self, nombre: str, capacidad: int, responsable_id=None):
-        self.__nombre = nombre
-        self.__capacidad = capacidad
-        self.__tipo = None
-        self.responsable_id = responsable_id
-
-    @property
-    def nombre(self) -> str:
-        return self.__nombre
-
-    @property
-    def capacidad(self) -> int:
-        return self.__capacidad
-
-    @property
-    def tipo(self) -> str:
-        return self.__tipo
-
-    def to_dict(self) -> Dict:
-        """Convierte el espacio a un diccionario"""
-        return {
-            "nombre": self.__nombre,
-            "tipo": self.__tipo,
-            "capacidad": self.__capacidad
-        }
-
-    def __str__(self) -> str:
-        return f"{self.__nombre} ({self.__tipo}) - Capacidad: {self.__capacidad}"
-
-
-class Salon(Espacio):
-    """Clase para representar un salón de clases"""
-    def __init__(self, nombre: str, capacidad: int):
-        super().__init__(nombre, capacidad)
-        self._Espacio__tipo = "salon"
-
-
-class Laboratorio(Espacio):
-    """Clase para representar un laboratorio"""
-    def __init__(self, nombre: str, capacidad: int):
-        super().__init__(nombre, capacidad)
-        self._Espacio__tipo = "laboratorio"
-
-
-class SalaJuntas(Espacio):
-    """Clase para representar una sala de juntas"""
-    def __init__(self, nombre: str, capacidad: int):
-        super().__init__(nombre, capacidad)
-        self._Espacio__tipo = "sala de juntas"
-
-
-class Auditorio(Espacio):
-    """Clase para representar un auditorio"""
-    def __init__(self, nombre: str, capacidad: int):
-        super().__init__(nombre, capacidad)
+from typing import Dict
+
+class Espacio:
+    """Clase base para representar espacios reservables"""
+    __slots__ = ('__nombre', '__capacidad', '__tipo', 'responsable_id', 'unidad_academica')
+
+    def __init__(self, nombre: str, capacidad: int, responsable_id=None, unidad_academica=None):
+        self.__nombre = nombre
+        self.__capacidad = capacidad
+        self.__tipo = None
+        self.responsable_id = responsable_id
+        # Unidad académica a la que pertenece; solo sus responsables pueden autorizar
+        self.unidad_academica = unidad_academica
+
+    @property
+    def nombre(self) -> str:
+        return self.__nombre
+
+    @property
+    def capacidad(self) -> int:
+        return self.__capacidad
+
+    @property
+    def tipo(self) -> str:
+        return self.__tipo
+
+    def to_dict(self) -> Dict:
+        """Convierte el espacio a un diccionario"""
+        datos = {
+            "nombre": self.__nombre,
+            "tipo": self.__tipo,
+            "capacidad": self.__capacidad
+        }
+        if self.unidad_academica is not None:
+            datos["unidad_academica"] = self.unidad_academica
+        return datos
+
+    def __str__(self) -> str:
+        return f"{self.__nombre} ({self.__tipo}) - Capacidad: {self.__capacidad}"
+
+
+class Salon(Espacio):
+    """Clase para representar un salón de clases"""
+    __slots__ = ()
+
+    def __init__(self, nombre: str, capacidad: int):
+        super().__init__(nombre, capacidad)
+        self._Espacio__tipo = "salon"
+
+
+class Laboratorio(Espacio):
+    """Clase para representar un laboratorio"""
+    __slots__ = ()
+
+    def __init__(self, nombre: str, capacidad: int):
+        super().__init__(nombre, capacidad)
+        self._Espacio__tipo = "laboratorio"
+
+
+class SalaJuntas(Espacio):
+    """Clase para representar una sala de juntas"""
+    __slots__ = ()
+
+    def __init__(self, nombre: str, capacidad: int):
+        super().__init__(nombre, capacidad)
+        self._Espacio__tipo = "sala de juntas"
+
+
+class Auditorio(Espacio):
+    """Clase para representar un auditorio"""
+    __slots__ = ()
+
+    def __init__(self, nombre: str, capacidad: int):
+        super().__init__(nombre, capacidad)
         self._Espacio__tipo = "auditorio"
\ No newline at end of file
@@ -1,316 +1,1114 @@
-import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Union
-from modelo.Espacios import Salon, Laboratorio, SalaJuntas, Auditorio
-from modelo.Horarios import Horario
-from modelo.Usuarios import Usuario, Estudiante, Profesor, Administrativo, ResponsableArea
-from modelo.Reservaciones import Reservacion
-
-
-class GestorReservaciones:
-    def __init__(self, archivo_reservaciones: str):
-        self.archivo_reservaciones = archivo_reservaciones
-        self.reservaciones = self._cargar_reservaciones()
-
-    def agregar_reservacion(self, reservacion) -> bool:
-        """
-        Agrega una nueva reservación al sistema
-        """
-        # Verificar si la reservación es válida
-        if not reservacion.es_valida():
-            print("La reservación no es válida")
-            return False
-
-        # Verificar si hay conflictos
-        if self._hay_conflicto(reservacion):
-            print("Hay conflicto de horario")
-            return False
-
-        # Agregar la reservación
-        self.reservaciones.append(reservacion)
-        self._guardar_reservaciones()
-        return True
-
-    def aprobar_reservacion(self, id_reservacion: str, responsable) -> tuple[bool, str]:
-        """
-        Aprueba una reservación pendiente
-        
-        Args:
-            id_reservacion: ID de la reservación
-            responsable: Objeto ResponsableArea que aprueba
-            
-        Returns:
-            tuple: (éxito, mensaje)
-        """
-        reservacion = self._buscar_reservacion(id_reservacion)
-        if not reservacion:
-            return False, "Reservación no encontrada"
-            
-        if not responsable.puede_autorizar(reservacion.espacio):
-            return False, "No tiene autorización para aprobar reservaciones en este espacio"
-            
-        if reservacion.aprobar(responsable):
-            self._guardar_reservaciones()
-            return True, "Reservación aprobada exitosamente"
-        return False, "No se pudo aprobar la reservación"
-
-    def rechazar_reservacion(self, id_reservacion: str, responsable, motivo: str) -> tuple[bool, str]:
-        """
-        Rechaza una reservación pendiente
-        
-        Args:
-            id_reservacion: ID de la reservación
-            responsable: Objeto ResponsableArea que rechaza
-            motivo: Motivo del rechazo
-            
-        Returns:
-            tuple: (éxito, mensaje)
-        """
-        reservacion = self._buscar_reservacion(id_reservacion)
-        if not reservacion:
-            return False, "Reservación no encontrada"
-            
-        if not responsable.puede_autorizar(reservacion.espacio):
-            return False, "No tiene autorización para rechazar reservaciones en este espacio"
-            
-        if reservacion.rechazar(responsable, motivo):
-            self._guardar_reservaciones()
-            return True, "Reservación rechazada exitosamente"
-        return False, "No se pudo rechazar la reservación"
-
-    def cancelar_reservacion(self, id_reservacion: str, usuario) -> tuple[bool, str]:
-        """
-        Cancela una reservación existente
-        
-        Args:
-            id_reservacion: ID de la reservación
-            usuario: Usuario que solicita la cancelación
-            
-        Returns:
-            tuple: (éxito, mensaje)
-        """
-        reservacion = self._buscar_reservacion(id_reservacion)
-        if not reservacion:
-            return False, "Reservación no encontrada"
-            
-        # Verificar que sea el propietario o un responsable de área
-        if reservacion.usuario.id != usuario.id and usuario.rol != "responsable_area":
-            return False, "No tiene autorización para cancelar esta reservación"
-            
-        if reservacion.cancelar():
-            self._guardar_reservaciones()
-            return True, "Reservación cancelada exitosamente"
-        return False, "No se pudo cancelar la reservación"
-
-    def finalizar_reservacion(self, id_reservacion: str) -> tuple[bool, str]:
-        """
-        Marca una reservación como finalizada
-        
-        Args:
-            id_reservacion: ID de la reservación
-            
-        Returns:
-            tuple: (éxito, mensaje)
-        """
-        reservacion = self._buscar_reservacion(id_reservacion)
-        if not reservacion:
-            return False, "Reservación no encontrada"
-            
-        if reservacion.finalizar():
-            self._guardar_reservaciones()
-            return True, "Reservación finalizada exitosamente"
-        return False, "No se pudo finalizar la reservación"
-
-
-    def obtener_reservaciones_por_usuario(self, id_usuario: str) -> List:
-        """
-        Obtiene todas las reservaciones de un usuario específico
-        """
-        # Añadir log para depuración
-        print(f"Buscando reservaciones para usuario: {id_usuario}")
-        print(f"Total de reservaciones en el sistema: {len(self.reservaciones)}")
-        reservaciones_usuario = [r for r in self.reservaciones
-                               if hasattr(r.usuario, 'id') and r.usuario.id == id_usuario]
-        print(f"Reservaciones encontradas: {len(reservaciones_usuario)}")
-        return reservaciones_usuario
-
-    def obtener_reservaciones_activas_por_espacio(self, nombre_espacio: str) -> List:
-        """
-        Obtiene las reservaciones activas para un espacio específico
-        """
-        return [r for r in self.reservaciones 
-                if r.espacio.nombre.lower() == nombre_espacio.lower() 
-                and r.estado in ["pendiente", "aprobada"]]
-
-    def obtener_disponibilidad(self, espacio, fecha: str) -> List[dict]:
-        """
-        Obtiene los horarios disponibles para un espacio en una fecha específica
-        
-        Args:
-            espacio: Objeto Espacio
-            fecha: Fecha en formato YYYY-MM-DD
-            
-        Returns:
-            List[dict]: Lista de franjas horarias disponibles
-        """
-        horarios_ocupados = [(r.horario.hora_inicio, r.horario.hora_fin) 
-                            for r in self.reservaciones 
-                            if r.espacio.nombre == espacio.nombre 
-                            and r.horario.fecha == fecha 
-                            and r.estado in ["pendiente", "aprobada"]]
-        
-        # Horario laboral: 7:00 - 22:00
-        hora_inicio = datetime.strptime("07:00", "%H:%M")
-        hora_fin = datetime.strptime("22:00", "%H:%M")
-        intervalo = timedelta(minutes=30)  # Bloques de 30 minutos
-        
-        horarios_disponibles = []
-        hora_actual = hora_inicio
-        
-        while hora_actual < hora_fin:
-            hora_sig = hora_actual + intervalo
-            franja = (hora_actual.strftime("%H:%M"), hora_sig.strftime("%H:%M"))
-            
-            # Verificar si la franja está ocupada
-            ocupada = False
-            for inicio, fin in horarios_ocupados:
-                if (datetime.strptime(inicio, "%H:%M") < hora_sig and 
-                    datetime.strptime(fin, "%H:%M") > hora_actual):
-                    ocupada = True
-                    break
-            
-            if not ocupada:
-                horarios_disponibles.append({
-                    "inicio": franja[0],
-                    "fin": franja[1]
-                })
-            
-            hora_actual = hora_sig
-        
-        return horarios_disponibles
-
-    def _buscar_reservacion(self, id_reservacion: str):
-        """Busca una reservación por su ID"""
-        for reservacion in self.reservaciones:
-            if reservacion.id == id_reservacion:
-                return reservacion
-        return None
-
-    def _hay_conflicto(self, nueva_reservacion) -> bool:
-        """
-            Verifica si hay conflicto con otras reservaciones
-            """
-        print(f"Verificando conflictos para el espacio: {nueva_reservacion.espacio.nombre}")
-        print(f"Fecha: {nueva_reservacion.horario.fecha}")
-        print(f"Horario: {nueva_reservacion.horario.hora_inicio} - {nueva_reservacion.horario.hora_fin}")
-
-        reservaciones_espacio = self.obtener_reservaciones_activas_por_espacio(
-            nueva_reservacion.espacio.nombre
-        )
-
-        print(f"Reservaciones activas encontradas: {len(reservaciones_espacio)}")
-        for r in reservaciones_espacio:
-            if r.horario.hay_conflicto(nueva_reservacion.horario):
-                print(f"Conflicto encontrado con reservación: {r.id}")
-                print(f"Horario en conflicto: {r.horario.fecha} {r.horario.hora_inicio}-{r.horario.hora_fin}")
-                return True
-        return False
-
-    def _cargar_reservaciones(self) -> List:
-        """Carga las reservaciones desde el archivo JSON"""
-        try:
-            with open(self.archivo_reservaciones, 'r', encoding='utf-8') as f:
-                datos = json.load(f)
-                return [self._deserializar_reservacion(r) for r in datos]
-        except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            print("Error al decodificar el archivo JSON")
-            return []
-
-    def _guardar_reservaciones(self) -> None:
-        """Guarda las reservaciones en el archivo JSON"""
-        try:
-            with open(self.archivo_reservaciones, 'w', encoding='utf-8') as f:
-                json.dump([r.to_dict() for r in self.reservaciones], 
-                         f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error al guardar las reservaciones: {str(e)}")
-
-    def _deserializar_reservacion(self, datos):
-        """
-        Convierte un diccionario en un objeto Reservacion
-        """
-        try:
-            # Validar que los datos necesarios existan
-            datos_usuario = datos.get("usuario")
-            datos_espacio = datos.get("espacio")
-            datos_horario = datos.get("horario")
-            
-            if not all([datos_usuario, datos_espacio, datos_horario]):
-                raise ValueError("Faltan datos obligatorios en la reservación")
-
-            # Crear el usuario según su tipo
-            tipo_usuario = datos_usuario.get("rol", "").lower()
-            nombre_usuario = datos_usuario.get("nombre", "")
-            id_usuario = datos_usuario.get("id", "")
-
-            if tipo_usuario == "estudiante":
-                usuario = Estudiante(nombre_usuario)
-                usuario.carrera = datos_usuario.get("carrera", "")
-            elif tipo_usuario == "profesor":
-                usuario = Profesor(nombre_usuario)
-                usuario.departamento = datos_usuario.get("departamento", "")
-            elif tipo_usuario == "administrativo":
-                usuario = Administrativo(nombre_usuario)
-            elif tipo_usuario == "responsable_area":
-                usuario = ResponsableArea(
-                    nombre_usuario,
-                    datos_usuario.get("unidad_academica", ""),
-                    datos_usuario.get("areas_responsable", [])
-                )
-            else:
-                usuario = Usuario(nombre_usuario)
-            
-            usuario.id = id_usuario
-
-            # Crear el espacio según su tipo
-            tipo_espacio = datos_espacio.get("tipo", "").lower()
-            nombre_espacio = datos_espacio.get("nombre", "")
-            capacidad = datos_espacio.get("capacidad", 0)
-
-            if tipo_espacio == "salon":
-                espacio = Salon(nombre_espacio, capacidad)
-            elif tipo_espacio == "laboratorio":
-                espacio = Laboratorio(nombre_espacio, capacidad)
-            elif tipo_espacio == "salajuntas":
-                espacio = SalaJuntas(nombre_espacio, capacidad)
-            elif tipo_espacio == "auditorio":
-                espacio = Auditorio(nombre_espacio, capacidad)
-            else:
-                espacio = Salon(nombre_espacio, capacidad)  # Espacio por defecto
-
-            # Crear el horario
-            horario = Horario(
-                datos_horario.get("fecha", ""),
-                datos_horario.get("hora_inicio", ""),
-                datos_horario.get("hora_fin", "")
-            )
-
-            # Crear la reservación
-            reservacion = Reservacion(
-                usuario,
-                espacio,
-                horario,
-                datos.get("tipo_evento", ""),
-                datos.get("descripcion", "")
-            )
-
-            # Establecer estado
-            reservacion.estado = datos.get("estado", "pendiente")
-
-            return reservacion
-        except Exception as e:
-            print(f"Error al deserializar reservación: {e}")
-            print(f"Datos problemáticos: {datos}")
+import json
+import threading
+from datetime import date, datetime, timedelta
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Union
+from uuid import uuid4
+from modelo.Espacios import Salon, Laboratorio, SalaJuntas, Auditorio
+from modelo.Horarios import Horario, _parsear_fecha, _parsear_hora
+from modelo.Usuarios import Usuario, Estudiante, Profesor, Administrativo, ResponsableArea
+from modelo.Reservaciones import Reservacion
+from modelo.Almacenamiento import AlmacenamientoJSON
+from modelo.Hidratacion import ColeccionPerezosa
+from modelo.EscrituraDiferida import EscritorDiferido
+from modelo.Concurrencia import CerrojoLectoresEscritores, CerrojosPorClave, SinCerrojo
+from modelo.Indices import IndiceIntervalos, BandejaAprobaciones
+from modelo.Disponibilidad import (MotorDisponibilidad, MatrizOcupacion, CacheDisponibilidad,
+                                   ETIQUETAS_FRANJAS, DURACION_FRANJA)
+
+
+class GestorReservaciones:
+    # Estados que ocupan el espacio reservado
+    ESTADOS_ACTIVOS = ("pendiente", "aprobada")
+    # Mensaje de las reservaciones válidas de un lote atómico que no se agregó
+    MENSAJE_LOTE_DESCARTADO = "No se agregó por conflictos en otras reservaciones del lote"
+    # Mensaje de las reservaciones anteriores a la ventana cargada del almacenamiento
+    MENSAJE_FECHA_HISTORICA = "La fecha pertenece al historial; no se pueden verificar sus conflictos"
+
+    def __init__(self, archivo_reservaciones: str, almacenamiento=None, usuarios=(), espacios=(),
+                 instantanea=None, concurrente: bool = False, capacidad_cache_disponibilidad: int = 4096):
+        """
+        Args:
+            archivo_reservaciones: Ruta al archivo JSON de reservaciones
+            almacenamiento: Almacenamiento a utilizar (por defecto, JSON completo)
+            usuarios: Usuarios del catálogo con los que se resuelven las reservaciones
+            espacios: Espacios del catálogo con los que se resuelven las reservaciones
+            instantanea: Estado devuelto por ``exportar_instantanea`` (p. ej. desde
+                la caché de arranque); si se omite se carga del almacenamiento
+            concurrente: Sincronizar el acceso para usar el gestor desde varios hilos:
+                las consultas se ejecutan en paralelo bajo un cerrojo de lectura,
+                las modificaciones bajo uno de escritura, y la verificación de
+                conflictos con la inserción de cada reservación se serializan por espacio
+            capacidad_cache_disponibilidad: Respuestas de ``obtener_disponibilidad``
+                (por espacio y fecha) que se conservan; 0 la desactiva
+        """
+        self.archivo_reservaciones = archivo_reservaciones
+        self.almacenamiento = almacenamiento or AlmacenamientoJSON(archivo_reservaciones)
+        # Mapas de identidad: todas las reservaciones de un mismo usuario o
+        # espacio comparten el mismo objeto (los espacios, sin distinguir mayúsculas)
+        self._usuarios_canonicos = {}
+        self._espacios_canonicos = {}
+        self._cerrojo = CerrojoLectoresEscritores() if concurrente else SinCerrojo()
+        self._cerrojos_espacio = CerrojosPorClave() if concurrente else SinCerrojo()
+        # Cambios que aún no se escriben: reservaciones modificadas y eliminadas
+        # (almacenamiento incremental) o el guardado completo. Se escriben al
+        # salir de cada modificación, o en el hilo de la escritura diferida.
+        self._escritor = None
+        self._cerrojo_persistencia = threading.Lock()
+        self._cerrojo_pendientes = threading.Lock()
+        self._sucias = {}
+        self._eliminadas = set()
+        self._guardado_completo = False
+        self._cache_disponibilidad = CacheDisponibilidad(capacidad_cache_disponibilidad)
+        # Ordinal de la primera fecha cargada si el almacenamiento deja el
+        # historial sin cargar (None si se cargan todas las reservaciones)
+        self._ordinal_inicial = None
+        self.registrar_catalogo(usuarios, espacios)
+        if instantanea is not None:
+            self._restaurar_instantanea(instantanea)
+            return
+        # Las reservaciones se guardan como registros y se construyen al accederlas
+        self.reservaciones = self._cargar_reservaciones()
+        self._por_usuario = {}
+        self._indice_intervalos = IndiceIntervalos()
+        self._disponibilidad = MotorDisponibilidad(self._indice_intervalos)
+        self._bandeja = BandejaAprobaciones()
+        self._reconstruir_indices()
+
+    def exportar_instantanea(self) -> dict:
+        """
+        Estado cargado del gestor (registros e índices), sin objetos del
+        almacenamiento, para guardarlo en la caché de arranque
+        """
+        with self._cerrojo.lectura():
+            return {
+                "registros": self.reservaciones.registros(),
+                "por_usuario": self._por_usuario,
+                "indice_intervalos": self._indice_intervalos,
+                "bandeja": self._bandeja,
+            }
+
+    def _restaurar_instantanea(self, instantanea: dict) -> None:
+        self.reservaciones = ColeccionPerezosa(instantanea["registros"], self._deserializar_reservacion)
+        self._por_usuario = instantanea["por_usuario"]
+        self._indice_intervalos = instantanea["indice_intervalos"]
+        self._disponibilidad = MotorDisponibilidad(self._indice_intervalos)
+        self._bandeja = instantanea["bandeja"]
+
+    def agregar_reservacion(self, reservacion) -> bool:
+        """
+        Agrega una nueva reservación al sistema
+        """
+        # Verificar si la reservación es válida
+        if not reservacion.es_valida():
+            print("La reservación no es válida")
+            return False
+        if self._es_historica(reservacion):
+            print(self.MENSAJE_FECHA_HISTORICA)
+            return False
+
+        # La verificación de conflictos y la inserción se serializan por
+        # espacio; mientras tanto las consultas siguen en paralelo
+        with self._cerrojos_espacio.bloquear(reservacion.espacio.nombre.lower()):
+            with self._cerrojo.lectura():
+                conflicto = self._hay_conflicto(reservacion)
+            if conflicto:
+                print("Hay conflicto de horario")
+                return False
+
+            # Agregar la reservación
+            with self._cerrojo.escritura():
+                self.reservaciones.append(reservacion)
+                self._indexar(reservacion)
+                self._persistir(reservacion)
+        self._escribir_pendientes()
+        return True
+
+    def agregar_lote(self, reservaciones, atomico: bool = False, ordenar: bool = True) -> List[tuple]:
+        """
+        Agrega varias reservaciones verificando todos los conflictos en una sola
+        pasada y persistiendo una sola vez
+
+        Las reservaciones se recorren ordenadas por espacio, fecha y hora de
+        inicio (o en el orden recibido si ``ordenar`` es False). Cada una se
+        compara contra el índice de intervalos, que incluye provisionalmente las
+        ya aceptadas del lote, así que también se detectan conflictos dentro del lote.
+
+        Args:
+            reservaciones: Reservaciones a agregar
+            atomico: Si es True, no se agrega ninguna cuando alguna es rechazada
+            ordenar: Si es False, los conflictos se resuelven por orden de llegada
+
+        Returns:
+            List[tuple]: (éxito, mensaje) por reservación, en el orden recibido
+        """
+        reservaciones = list(reservaciones)
+        espacios = [r.espacio.nombre.lower() for r in reservaciones]
+        with self._cerrojos_espacio.bloquear(*espacios), self._seccion_escritura():
+            return self._agregar_lote(reservaciones, atomico, ordenar)
+
+    def _agregar_lote(self, reservaciones, atomico: bool, ordenar: bool) -> List[tuple]:
+        resultados = [None] * len(reservaciones)
+        orden = range(len(reservaciones))
+        if ordenar:
+            orden = sorted(orden, key=lambda i: (
+                reservaciones[i].espacio.nombre.lower(),
+                reservaciones[i].horario.ordinal,
+                reservaciones[i].horario.minuto_inicio
+            ))
+
+        aceptadas = []
+        for i in orden:
+            reservacion = reservaciones[i]
+            horario = reservacion.horario
+            if not reservacion.es_valida():
+                resultados[i] = (False, "La reservación no es válida")
+                continue
+            if self._es_historica(reservacion):
+                resultados[i] = (False, self.MENSAJE_FECHA_HISTORICA)
+                continue
+            id_conflicto = self._indice_intervalos.buscar_conflicto(
+                reservacion.espacio.nombre, horario.ordinal, horario.minuto_inicio, horario.minuto_fin
+            )
+            if id_conflicto is not None:
+                resultados[i] = (False, f"Conflicto de horario con la reservación {id_conflicto}")
+                continue
+            # Registro provisional para detectar conflictos dentro del lote
+            self._indice_intervalos.agregar(
+                reservacion.espacio.nombre, horario.ordinal,
+                horario.minuto_inicio, horario.minuto_fin, reservacion.id
+            )
+            aceptadas.append(reservacion)
+            resultados[i] = (True, "Reservación creada exitosamente")
+
+        for reservacion in aceptadas:
+            horario = reservacion.horario
+            self._indice_intervalos.quitar(
+                reservacion.espacio.nombre, horario.ordinal,
+                horario.minuto_inicio, horario.minuto_fin, reservacion.id
+            )
+
+        if atomico and len(aceptadas) < len(reservaciones):
+            return [(False, self.MENSAJE_LOTE_DESCARTADO) if exito else (exito, mensaje) for exito, mensaje in resultados]
+
+        for reservacion in aceptadas:
+            self.reservaciones.append(reservacion)
+            self._indexar(reservacion)
+        if aceptadas:
+            self._persistir(*aceptadas)
+        return resultados
+
+    def aprobar_reservacion(self, id_reservacion: str, responsable) -> tuple[bool, str]:
+        """
+        Aprueba una reservación pendiente
+        
+        Args:
+            id_reservacion: ID de la reservación
+            responsable: Objeto ResponsableArea que aprueba
+            
+        Returns:
+            tuple: (éxito, mensaje)
+        """
+        with self._seccion_escritura():
+            reservacion = self._buscar_reservacion(id_reservacion)
+            if not reservacion:
+                return False, "Reservación no encontrada"
+            
+            if not responsable.puede_autorizar(reservacion.espacio):
+                return False, "No tiene autorización para aprobar reservaciones en este espacio"
+            
+            estado_anterior = reservacion.estado
+            if reservacion.aprobar(responsable):
+                self._actualizar_indices(reservacion, estado_anterior)
+                self._persistir(reservacion)
+                return True, "Reservación aprobada exitosamente"
+            return False, "No se pudo aprobar la reservación"
+
+    def rechazar_reservacion(self, id_reservacion: str, responsable, motivo: str) -> tuple[bool, str]:
+        """
+        Rechaza una reservación pendiente
+        
+        Args:
+            id_reservacion: ID de la reservación
+            responsable: Objeto ResponsableArea que rechaza
+            motivo: Motivo del rechazo
+            
+        Returns:
+            tuple: (éxito, mensaje)
+        """
+        with self._seccion_escritura():
+            reservacion = self._buscar_reservacion(id_reservacion)
+            if not reservacion:
+                return False, "Reservación no encontrada"
+            
+            if not responsable.puede_autorizar(reservacion.espacio):
+                return False, "No tiene autorización para rechazar reservaciones en este espacio"
+            
+            estado_anterior = reservacion.estado
+            if reservacion.rechazar(responsable, motivo):
+                self._actualizar_indices(reservacion, estado_anterior)
+                self._persistir(reservacion)
+                return True, "Reservación rechazada exitosamente"
+            return False, "No se pudo rechazar la reservación"
+
+    def aprobar_reservaciones(self, ids, responsable) -> List[tuple]:
+        """
+        Aprueba varias reservaciones pendientes con una sola escritura
+
+        Args:
+            ids: IDs de las reservaciones
+            responsable: Objeto ResponsableArea que aprueba
+
+        Returns:
+            List[tuple]: (id, éxito, mensaje) por cada ID
+        """
+        return self._autorizar_en_lote(
+            ids, responsable, lambda r: r.aprobar(responsable), "aprobar", "aprobada"
+        )
+
+    def rechazar_reservaciones(self, ids, responsable, motivo: str) -> List[tuple]:
+        """
+        Rechaza varias reservaciones pendientes con una sola escritura
+
+        Args:
+            ids: IDs de las reservaciones
+            responsable: Objeto ResponsableArea que rechaza
+            motivo: Motivo del rechazo
+
+        Returns:
+            List[tuple]: (id, éxito, mensaje) por cada ID
+        """
+        return self._autorizar_en_lote(
+            ids, responsable, lambda r: r.rechazar(responsable, motivo), "rechazar", "rechazada"
+        )
+
+    def _autorizar_en_lote(self, ids, responsable, accion, verbo: str, participio: str) -> List[tuple]:
+        """
+        Aplica una acción de autorización a varias reservaciones en memoria y
+        persiste todos los cambios juntos. La autorización del responsable se
+        verifica una sola vez por espacio.
+        """
+        with self._seccion_escritura():
+            resultados = []
+            modificadas = []
+            autorizado_por_espacio = {}
+            for id_reservacion in ids:
+                reservacion = self._buscar_reservacion(id_reservacion)
+                if not reservacion:
+                    resultados.append((id_reservacion, False, "Reservación no encontrada"))
+                    continue
+
+                nombre_espacio = reservacion.espacio.nombre
+                if nombre_espacio not in autorizado_por_espacio:
+                    autorizado_por_espacio[nombre_espacio] = responsable.puede_autorizar(reservacion.espacio)
+                if not autorizado_por_espacio[nombre_espacio]:
+                    resultados.append((id_reservacion, False,
+                                       f"No tiene autorización para {verbo} reservaciones en este espacio"))
+                    continue
+
+                estado_anterior = reservacion.estado
+                if accion(reservacion):
+                    self._actualizar_indices(reservacion, estado_anterior)
+                    modificadas.append(reservacion)
+                    resultados.append((id_reservacion, True, f"Reservación {participio} exitosamente"))
+                else:
+                    resultados.append((id_reservacion, False, f"No se pudo {verbo} la reservación"))
+
+            if modificadas:
+                self._persistir(*modificadas)
+            return resultados
+
+    def cancelar_reservacion(self, id_reservacion: str, usuario) -> tuple[bool, str]:
+        """
+        Cancela una reservación existente
+        
+        Args:
+            id_reservacion: ID de la reservación
+            usuario: Usuario que solicita la cancelación
+            
+        Returns:
+            tuple: (éxito, mensaje)
+        """
+        with self._seccion_escritura():
+            reservacion = self._buscar_reservacion(id_reservacion)
+            if not reservacion:
+                return False, "Reservación no encontrada"
+            
+            # Verificar que sea el propietario o un responsable de área
+            if reservacion.usuario.id != usuario.id and usuario.rol != "responsable_area":
+                return False, "No tiene autorización para cancelar esta reservación"
+            
+            estado_anterior = reservacion.estado
+            if reservacion.cancelar():
+                self._actualizar_indices(reservacion, estado_anterior)
+                self._persistir(reservacion)
+                return True, "Reservación cancelada exitosamente"
+            return False, "No se pudo cancelar la reservación"
+
+    def finalizar_reservacion(self, id_reservacion: str) -> tuple[bool, str]:
+        """
+        Marca una reservación como finalizada
+        
+        Args:
+            id_reservacion: ID de la reservación
+            
+        Returns:
+            tuple: (éxito, mensaje)
+        """
+        with self._seccion_escritura():
+            reservacion = self._buscar_reservacion(id_reservacion)
+            if not reservacion:
+                return False, "Reservación no encontrada"
+            
+            estado_anterior = reservacion.estado
+            if reservacion.finalizar():
+                self._actualizar_indices(reservacion, estado_anterior)
+                self._persistir(reservacion)
+                return True, "Reservación finalizada exitosamente"
+            return False, "No se pudo finalizar la reservación"
+
+    def eliminar_reservacion(self, id_reservacion: str) -> bool:
+        """
+        Elimina una reservación del sistema
+
+        Args:
+            id_reservacion: ID de la reservación
+
+        Returns:
+            bool: True si se eliminó
+        """
+        with self._seccion_escritura():
+            reservacion = self._buscar_reservacion(id_reservacion)
+            if not reservacion:
+                return False
+
+            self.reservaciones.remove(reservacion)
+            self._desindexar(reservacion)
+            self._persistir_eliminacion(reservacion)
+            return True
+
+    def activar_escritura_diferida(self, intervalo_ms: float = 50, max_mutaciones: int = 100) -> None:
+        """
+        Activa la escritura diferida: los cambios solo se marcan como pendientes
+        y un hilo de fondo los persiste juntos como máximo cada ``intervalo_ms``
+        o al acumular ``max_mutaciones``. Cada volcado es atómico (archivo
+        temporal + renombrado, anexado o transacción según el almacenamiento).
+
+        Args:
+            intervalo_ms: Espera máxima desde el primer cambio pendiente hasta su escritura
+            max_mutaciones: Cambios pendientes que provocan una escritura inmediata
+        """
+        self.desactivar_escritura_diferida()
+        self._escritor = EscritorDiferido(self._volcar_pendientes, intervalo_ms, max_mutaciones)
+
+    def desactivar_escritura_diferida(self) -> None:
+        """Escribe los cambios pendientes y vuelve a la escritura inmediata"""
+        if self._escritor is None:
+            return
+        escritor, self._escritor = self._escritor, None
+        escritor.detener()
+        # Si el último volcado falló, se intenta una vez más de forma síncrona
+        self._escribir_pendientes()
+
+    def esperar_persistencia(self, timeout: Optional[float] = None) -> bool:
+        """
+        Confirmación durable: espera al volcado que incluye los cambios hechos
+        hasta ahora. Sin escritura diferida los cambios ya están escritos.
+
+        Args:
+            timeout: Segundos máximos de espera (None para esperar indefinidamente)
+
+        Returns:
+            bool: True si los cambios quedaron persistidos
+        """
+        if self._escritor is None:
+            return True
+        return self._escritor.esperar(timeout=timeout)
+
+    def estadisticas_escritura(self) -> Optional[dict]:
+        """
+        Contadores de la escritura diferida (volcados, mutaciones por volcado,
+        errores y latencias en ms)
+
+        Returns:
+            Optional[dict]: None si la escritura diferida no está activa
+        """
+        if self._escritor is None:
+            return None
+        return self._escritor.estadisticas()
+
+    def recargar(self) -> None:
+        """Vuelve a cargar las reservaciones desde el almacenamiento"""
+        if self._escritor is not None:
+            self._escritor.sincronizar()
+        with self._cerrojo.escritura():
+            self.reservaciones = self._cargar_reservaciones()
+            self._reconstruir_indices()
+
+    def obtener_por_ids(self, ids) -> List:
+        """
+        Obtiene varias reservaciones por su ID
+
+        Args:
+            ids: IDs de las reservaciones
+
+        Returns:
+            List: Reservaciones encontradas, en el orden de los IDs
+        """
+        with self._cerrojo.lectura():
+            reservaciones = [self.reservaciones.obtener(i) for i in ids]
+            return [r for r in reservaciones if r is not None]
+
+    def registrar_catalogo(self, usuarios=(), espacios=()) -> None:
+        """
+        Registra usuarios y espacios como los objetos canónicos que se usan al
+        cargar reservaciones
+
+        Args:
+            usuarios: Objetos Usuario
+            espacios: Objetos Espacio
+        """
+        with self._cerrojo.escritura():
+            for usuario in usuarios:
+                self._usuarios_canonicos[usuario.id] = usuario
+            for espacio in espacios:
+                self._espacios_canonicos[espacio.nombre.lower()] = espacio
+
+    def configurar_responsables(self, responsables, espacios) -> None:
+        """
+        Precalcula los espacios que puede autorizar cada responsable de área y
+        llena su bandeja de pendientes. Debe llamarse de nuevo cuando cambian
+        los responsables o el catálogo de espacios.
+
+        Args:
+            responsables: Objetos ResponsableArea
+            espacios: Objetos Espacio del catálogo
+        """
+        with self._cerrojo.escritura():
+            self._bandeja.configurar(responsables, espacios)
+
+    def obtener_bandeja(self, id_responsable: str) -> List:
+        """
+        Obtiene las reservaciones pendientes que puede autorizar un responsable
+
+        Args:
+            id_responsable: ID del responsable de área
+
+        Returns:
+            List: Reservaciones pendientes ordenadas por fecha y hora
+        """
+        with self._cerrojo.lectura():
+            return self.obtener_por_ids(self._bandeja.pendientes(id_responsable))
+
+    def cancelar_reservaciones(self, reservaciones) -> List:
+        """
+        Cancela varias reservaciones sin verificar autorización (uso
+        administrativo, p. ej. al eliminar un usuario o un espacio) y
+        persiste el cambio una sola vez
+
+        Args:
+            reservaciones: Reservaciones a cancelar
+
+        Returns:
+            List: Reservaciones que se cancelaron
+        """
+        with self._seccion_escritura():
+            canceladas = []
+            for reservacion in reservaciones:
+                estado_anterior = reservacion.estado
+                if reservacion.cancelar():
+                    self._actualizar_indices(reservacion, estado_anterior)
+                    canceladas.append(reservacion)
+            if canceladas:
+                self._persistir(*canceladas)
+            return canceladas
+
+
+    def obtener_reservaciones_por_usuario(self, id_usuario: str, estados=None,
+                                          fecha_inicio=None, fecha_fin=None) -> List:
+        """
+        Obtiene las reservaciones de un usuario específico. Usa el índice por
+        usuario, por lo que el costo depende solo de las reservaciones del usuario.
+        Si el almacenamiento consulta en SQL, las históricas que no se cargaron
+        se leen de las columnas indexadas y se devuelven primero.
+
+        Args:
+            id_usuario: ID del usuario
+            estados: Estados aceptados (opcional)
+            fecha_inicio: Fecha mínima, inclusive (YYYY-MM-DD o date, opcional)
+            fecha_fin: Fecha máxima, inclusive (YYYY-MM-DD o date, opcional)
+
+        Returns:
+            List: Reservaciones del usuario en orden de creación
+        """
+        with self._cerrojo.lectura():
+            desde = self._a_ordinal(fecha_inicio)
+            hasta = self._a_ordinal(fecha_fin)
+            historicas = []
+            if hasattr(self.almacenamiento, "consultar"):
+                historicas = [r for r in map(self._deserializar_reservacion,
+                                             self._registros_historicos(desde, hasta, estados, id_usuario))
+                              if r is not None]
+
+            ids_usuario = self._por_usuario.get(id_usuario)
+            if not ids_usuario:
+                return historicas
+            reservaciones_usuario = self.obtener_por_ids(ids_usuario)
+            if estados is None and fecha_inicio is None and fecha_fin is None:
+                return historicas + reservaciones_usuario
+
+            return historicas + [r for r in reservaciones_usuario
+                                 if (estados is None or r.estado in estados)
+                                 and (desde is None or r.horario.ordinal >= desde)
+                                 and (hasta is None or r.horario.ordinal <= hasta)]
+
+    def obtener_reservaciones_activas_por_espacio(self, nombre_espacio: str) -> List:
+        """
+        Obtiene las reservaciones activas para un espacio específico
+        """
+        with self._cerrojo.lectura():
+            return self.obtener_por_ids(self._indice_intervalos.ids_por_espacio(nombre_espacio))
+
+    def consultar_registros(self, espacio: Optional[str] = None, fecha: Optional[str] = None,
+                            estados: Optional[List[str]] = None,
+                            id_usuario: Optional[str] = None) -> List[dict]:
+        """
+        Consulta los registros (diccionarios) de las reservaciones que cumplen
+        los filtros. Si el almacenamiento lo permite, la consulta se hace en SQL.
+
+        Args:
+            espacio: Nombre del espacio
+            fecha: Fecha en formato YYYY-MM-DD
+            estados: Estados aceptados
+            id_usuario: ID del usuario
+
+        Returns:
+            List[dict]: Registros de las reservaciones
+        """
+        with self._cerrojo.lectura():
+            consultar = getattr(self.almacenamiento, "consultar", None)
+            if consultar is not None:
+                return consultar(espacio=espacio, fecha=fecha, estados=estados, id_usuario=id_usuario)
+
+            registros = self.reservaciones.registros()
+            return [r for r in registros
+                    if (espacio is None or r["espacio"]["nombre"].lower() == espacio.lower())
+                    and (fecha is None or r["horario"]["fecha"] == fecha)
+                    and (estados is None or r["estado"] in estados)
+                    and (id_usuario is None or r["usuario"]["id"] == id_usuario)]
+
+    def obtener_historial(self, fecha_inicio=None, fecha_fin=None) -> List:
+        """
+        Obtiene las reservaciones de un rango de fechas para reportes,
+        incluidas las de particiones históricas que no están cargadas. Las
+        reservaciones históricas no se agregan al gestor.
+
+        Args:
+            fecha_inicio: Fecha mínima, inclusive (YYYY-MM-DD o date, opcional)
+            fecha_fin: Fecha máxima, inclusive (YYYY-MM-DD o date, opcional)
+
+        Returns:
+            List: Reservaciones del rango, ordenadas por fecha y hora de inicio
+        """
+        with self._cerrojo.lectura():
+            desde = self._a_ordinal(fecha_inicio)
+            hasta = self._a_ordinal(fecha_fin)
+            # Las reservaciones cargadas se devuelven como el objeto del gestor
+            ids = []
+            for elemento in self.reservaciones.elementos():
+                id_reservacion, _, _, ordinal, _, _, _ = self._claves(elemento)
+                if (desde is None or ordinal >= desde) and (hasta is None or ordinal <= hasta):
+                    ids.append(id_reservacion)
+            historial = self.obtener_por_ids(ids)
+
+            for datos in self._registros_historicos(desde, hasta):
+                reservacion = self._deserializar_reservacion(datos)
+                if reservacion is not None:
+                    historial.append(reservacion)
+            historial.sort(key=lambda r: (r.horario.ordinal, r.horario.minuto_inicio))
+            return historial
+
+    def _registros_historicos(self, desde=None, hasta=None, estados=None, id_usuario=None) -> List[dict]:
+        """
+        Registros del almacenamiento anteriores a la ventana cargada, que no
+        están en memoria. Se filtran en SQL si el almacenamiento lo permite;
+        si no, se leen las particiones históricas del rango.
+
+        Args:
+            desde: Ordinal de la fecha mínima, inclusive (opcional)
+            hasta: Ordinal de la fecha máxima, inclusive (opcional)
+            estados: Estados aceptados (opcional)
+            id_usuario: ID del usuario (opcional)
+
+        Returns:
+            List[dict]: Registros válidos que cumplen los filtros
+        """
+        if self._ordinal_inicial is None:
+            return []
+        hasta = self._ordinal_inicial - 1 if hasta is None else min(hasta, self._ordinal_inicial - 1)
+        if desde is not None and desde > hasta:
+            return []
+
+        consultar = getattr(self.almacenamiento, "consultar", None)
+        cargar_historial = getattr(self.almacenamiento, "cargar_historial", None)
+        if consultar is not None:
+            registros = consultar(
+                estados=estados, id_usuario=id_usuario,
+                fecha_inicio=date.fromordinal(desde).isoformat() if desde is not None else None,
+                fecha_fin=date.fromordinal(hasta).isoformat()
+            )
+        elif cargar_historial is not None:
+            registros = cargar_historial(
+                date.fromordinal(desde).strftime("%Y-%m") if desde is not None else None,
+                date.fromordinal(hasta).strftime("%Y-%m")
+            )
+        else:
+            return []
+
+        historicos = []
+        for datos in registros:
+            # Las pendientes antiguas también se cargan; se usan desde memoria
+            if datos.get("id") in self.reservaciones or not self._validar_registro(datos):
+                continue
+            ordinal = _parsear_fecha(datos["horario"]["fecha"])
+            if (desde is not None and ordinal < desde) or ordinal > hasta:
+                continue
+            if (estados is not None and datos.get("estado", "pendiente") not in estados) \
+                    or (id_usuario is not None and datos["usuario"].get("id") != id_usuario):
+                continue
+            historicos.append(datos)
+        return historicos
+
+    def obtener_disponibilidad(self, espacio, fecha: str) -> List[dict]:
+        """
+        Obtiene los horarios disponibles para un espacio en una fecha específica
+        
+        Args:
+            espacio: Objeto Espacio
+            fecha: Fecha en formato YYYY-MM-DD
+            
+        Returns:
+            List[dict]: Lista de franjas horarias disponibles
+        """
+        with self._cerrojo.lectura():
+            ordinal = self._a_ordinal(fecha)
+            clave = self._indice_intervalos.clave(espacio.nombre, ordinal)
+            libres = self._cache_disponibilidad.obtener(clave)
+            if libres is None:
+                # Horario laboral: 7:00 - 22:00 en bloques de 30 minutos
+                libres = tuple(self._disponibilidad.franjas_libres(espacio.nombre, ordinal))
+                self._cache_disponibilidad.guardar(clave, libres)
+            # La caché guarda índices inmutables; cada llamada recibe diccionarios nuevos
+            return [{"inicio": ETIQUETAS_FRANJAS[i][0], "fin": ETIQUETAS_FRANJAS[i][1]} for i in libres]
+
+    def estadisticas_cache_disponibilidad(self) -> dict:
+        """
+        Contadores de la caché de ``obtener_disponibilidad``
+
+        Returns:
+            dict: aciertos, fallos, tasa de aciertos, invalidaciones, entradas y capacidad
+        """
+        return self._cache_disponibilidad.estadisticas()
+
+    def obtener_ventanas_libres(self, espacio, fecha: str, duracion_minutos: int) -> List[dict]:
+        """
+        Obtiene los horarios de inicio en los que el espacio está libre durante
+        al menos la duración indicada
+
+        Args:
+            espacio: Objeto Espacio
+            fecha: Fecha en formato YYYY-MM-DD
+            duracion_minutos: Duración requerida en minutos
+
+        Returns:
+            List[dict]: Ventanas libres con su hora de inicio y fin
+        """
+        with self._cerrojo.lectura():
+            num_franjas = max(1, -(-duracion_minutos // DURACION_FRANJA))
+            inicios = self._disponibilidad.ventanas_libres(espacio.nombre, self._a_ordinal(fecha), num_franjas)
+            return [{"inicio": ETIQUETAS_FRANJAS[i][0], "fin": ETIQUETAS_FRANJAS[i + num_franjas - 1][1]}
+                    for i in inicios]
+
+    def esta_disponible(self, nombre_espacio: str, horario) -> bool:
+        """
+        Indica si un espacio está libre en el horario indicado
+
+        Args:
+            nombre_espacio: Nombre del espacio
+            horario: Objeto Horario
+
+        Returns:
+            bool: True si ninguna reservación activa se traslapa
+        """
+        with self._cerrojo.lectura():
+            return self._indice_intervalos.buscar_conflicto(
+                nombre_espacio, horario.ordinal, horario.minuto_inicio, horario.minuto_fin
+            ) is None
+
+    def obtener_matriz_ocupacion(self, nombres_espacios: List[str], fecha_inicio, fecha_fin) -> MatrizOcupacion:
+        """
+        Obtiene la ocupación de varios espacios en un rango de fechas
+
+        Args:
+            nombres_espacios: Nombres de los espacios
+            fecha_inicio: Primera fecha (YYYY-MM-DD o date)
+            fecha_fin: Última fecha, inclusive (YYYY-MM-DD o date)
+
+        Returns:
+            MatrizOcupacion: Matriz espacios × días × franjas
+        """
+        with self._cerrojo.lectura():
+            fecha_inicio = self._a_fecha(fecha_inicio)
+            fecha_fin = self._a_fecha(fecha_fin)
+            fechas = [fecha_inicio + timedelta(days=i) for i in range((fecha_fin - fecha_inicio).days + 1)]
+            mascaras = [[self._disponibilidad.mascara_ocupacion(nombre, fecha.toordinal()) for fecha in fechas]
+                        for nombre in nombres_espacios]
+            return MatrizOcupacion(nombres_espacios, fechas, mascaras)
+
+    def _buscar_reservacion(self, id_reservacion: str):
+        """Busca una reservación por su ID"""
+        return self.reservaciones.obtener(id_reservacion)
+
+    def _hay_conflicto(self, nueva_reservacion) -> bool:
+        """
+            Verifica si hay conflicto con otras reservaciones activas del
+            mismo espacio y fecha usando el índice de intervalos
+            """
+        horario = nueva_reservacion.horario
+        id_conflicto = self._indice_intervalos.buscar_conflicto(
+            nueva_reservacion.espacio.nombre, horario.ordinal, horario.minuto_inicio, horario.minuto_fin
+        )
+        if id_conflicto is not None:
+            print(f"Conflicto encontrado con reservación: {id_conflicto}")
+            return True
+        return False
+
+    def _es_historica(self, reservacion) -> bool:
+        """
+        Indica si la reservación cae antes de la ventana cargada: las
+        reservaciones históricas no están en el índice de intervalos, así
+        que sus conflictos no se pueden verificar
+        """
+        return self._ordinal_inicial is not None and reservacion.horario.ordinal < self._ordinal_inicial
+
+    @staticmethod
+    def _a_fecha(valor):
+        """Convierte una fecha YYYY-MM-DD a date; otros valores se devuelven igual"""
+        if isinstance(valor, str):
+            return datetime.strptime(valor, "%Y-%m-%d").date()
+        return valor
+
+    @classmethod
+    def _a_ordinal(cls, valor):
+        """Convierte una fecha (YYYY-MM-DD o date) al ordinal usado por los índices"""
+        if valor is None or isinstance(valor, int):
+            return valor
+        if isinstance(valor, str):
+            # Memorizado: las consultas repiten las mismas fechas
+            return _parsear_fecha(valor)
+        return cls._a_fecha(valor).toordinal()
+
+    def _reconstruir_indices(self) -> None:
+        """
+        Reconstruye los índices a partir de la colección de reservaciones. Los
+        registros sin hidratar se indexan directamente, sin construir objetos.
+        Avisa si los datos traen reservaciones activas traslapadas.
+        """
+        self._por_usuario.clear()
+        self._indice_intervalos.limpiar()
+        self._disponibilidad.limpiar()
+        self._cache_disponibilidad.limpiar()
+        self._bandeja.vaciar()
+        traslapadas = 0
+        for elemento in self.reservaciones.elementos():
+            claves = self._claves(elemento)
+            _, _, nombre_espacio, ordinal, inicio, fin, estado = claves
+            if estado in self.ESTADOS_ACTIVOS and \
+                    self._indice_intervalos.buscar_conflicto(nombre_espacio, ordinal, inicio, fin) is not None:
+                traslapadas += 1
+            self._indexar_claves(*claves)
+        if traslapadas:
+            print(f"Advertencia: {traslapadas} reservaciones activas se traslapan con otras del mismo espacio")
+
+    def _indexar(self, reservacion) -> None:
+        """Agrega una reservación a los índices"""
+        self._indexar_claves(*self._claves(reservacion))
+        if reservacion.estado in self.ESTADOS_ACTIVOS:
+            self._cache_disponibilidad.invalidar(
+                self._indice_intervalos.clave(reservacion.espacio.nombre, reservacion.horario.ordinal)
+            )
+
+    def _indexar_claves(self, id_reservacion: str, id_usuario: str, nombre_espacio: str,
+                        ordinal: int, inicio: int, fin: int, estado: str) -> None:
+        self._por_usuario.setdefault(id_usuario, {})[id_reservacion] = None
+        if estado == "pendiente":
+            self._bandeja.agregar(nombre_espacio, ordinal, inicio, id_reservacion)
+        if estado in self.ESTADOS_ACTIVOS:
+            self._indice_intervalos.agregar(nombre_espacio, ordinal, inicio, fin, id_reservacion)
+            self._disponibilidad.agregar(nombre_espacio, ordinal, inicio, fin)
+
+    @staticmethod
+    def _claves(elemento) -> tuple:
+        """
+        Datos que usan los índices, de una Reservacion o de un registro sin
+        hidratar: (id, id_usuario, espacio, ordinal, inicio, fin, estado)
+        """
+        if isinstance(elemento, dict):
+            horario = elemento["horario"]
+            return (elemento["id"], elemento["usuario"].get("id", ""), elemento["espacio"].get("nombre", ""),
+                    _parsear_fecha(horario["fecha"]), _parsear_hora(horario["hora_inicio"]),
+                    _parsear_hora(horario["hora_fin"]), elemento.get("estado", "pendiente"))
+        horario = elemento.horario
+        return (elemento.id, elemento.usuario.id, elemento.espacio.nombre, horario.ordinal,
+                horario.minuto_inicio, horario.minuto_fin, elemento.estado)
+
+    def _desindexar(self, reservacion) -> None:
+        """Quita una reservación de los índices"""
+        reservaciones_usuario = self._por_usuario.get(reservacion.usuario.id)
+        if reservaciones_usuario is not None:
+            reservaciones_usuario.pop(reservacion.id, None)
+            if not reservaciones_usuario:
+                del self._por_usuario[reservacion.usuario.id]
+        self._quitar_por_estado(reservacion, reservacion.estado)
+
+    def _actualizar_indices(self, reservacion, estado_anterior: str) -> None:
+        """Actualiza los índices después de un cambio de estado"""
+        if estado_anterior == "pendiente" and reservacion.estado != "pendiente":
+            self._bandeja.quitar(reservacion.espacio.nombre, reservacion.horario.ordinal,
+                                 reservacion.horario.minuto_inicio, reservacion.id)
+        if estado_anterior in self.ESTADOS_ACTIVOS and reservacion.estado not in self.ESTADOS_ACTIVOS:
+            self._quitar_intervalo(reservacion)
+
+    def _quitar_por_estado(self, reservacion, estado: str) -> None:
+        """Quita una reservación de los índices que dependen de su estado"""
+        if estado == "pendiente":
+            self._bandeja.quitar(reservacion.espacio.nombre, reservacion.horario.ordinal,
+                                 reservacion.horario.minuto_inicio, reservacion.id)
+        if estado in self.ESTADOS_ACTIVOS:
+            self._quitar_intervalo(reservacion)
+
+    def _quitar_intervalo(self, reservacion) -> None:
+        horario = reservacion.horario
+        self._indice_intervalos.quitar(
+            reservacion.espacio.nombre, horario.ordinal,
+            horario.minuto_inicio, horario.minuto_fin, reservacion.id
+        )
+        self._disponibilidad.quitar(reservacion.espacio.nombre, horario.ordinal)
+        self._cache_disponibilidad.invalidar(
+            self._indice_intervalos.clave(reservacion.espacio.nombre, horario.ordinal)
+        )
+
+    def _cargar_reservaciones(self) -> ColeccionPerezosa:
+        """
+        Carga los registros de reservación desde el almacenamiento. Solo se
+        validan los datos que usan los índices; los objetos se construyen
+        cuando se accede a cada reservación.
+        """
+        registros = [r for r in self.almacenamiento.cargar() if self._validar_registro(r)]
+        # Después de cargar: si el mes cambia entretanto, la ventana es la más estricta
+        fecha_inicial = getattr(self.almacenamiento, "fecha_inicial", None)
+        self._ordinal_inicial = _parsear_fecha(fecha_inicial()) if fecha_inicial else None
+        return ColeccionPerezosa(registros, self._deserializar_reservacion)
+
+    def _validar_registro(self, datos) -> bool:
+        """
+        Verifica que un registro tenga los datos obligatorios y un horario
+        válido, y le asigna un ID si no tiene
+        """
+        try:
+            if not all([datos.get("usuario"), datos.get("espacio"), datos.get("horario")]):
+                raise ValueError("Faltan datos obligatorios en la reservación")
+            if str(datos.get("tipo_evento", "")).lower() not in Reservacion.TIPOS_EVENTO:
+                raise ValueError(f"Tipo de evento no válido. Tipos permitidos: {', '.join(Reservacion.TIPOS_EVENTO)}")
+            if not datos.get("id"):
+                datos["id"] = str(uuid4())
+            _, _, _, _, inicio, fin, _ = self._claves(datos)
+            if fin <= inicio:
+                raise ValueError("La hora de fin debe ser posterior a la hora de inicio")
+            return True
+        except Exception as e:
+            print(f"Error al deserializar reservación: {e}")
+            print(f"Datos problemáticos: {datos}")
+            return False
+
+    def estadisticas_hidratacion(self) -> dict:
+        """
+        Contadores de la carga perezosa
+
+        Returns:
+            dict: registros, hidratadas, sin_hidratar y fallidas
+        """
+        with self._cerrojo.lectura():
+            return self.reservaciones.estadisticas()
+
+    def _guardar_reservaciones(self) -> None:
+        """Guarda todas las reservaciones en el almacenamiento"""
+        self._persistir()
+        self._escribir_pendientes()
+
+    @contextmanager
+    def _seccion_escritura(self):
+        """
+        Sección exclusiva para modificar reservaciones. Los cambios marcados
+        con ``_persistir`` se escriben al salir, ya sin el cerrojo, para no
+        detener las consultas durante la escritura.
+        """
+        with self._cerrojo.escritura():
+            yield
+        self._escribir_pendientes()
+
+    def _persistir(self, *reservaciones) -> None:
+        """
+        Marca el cambio de las reservaciones indicadas para escribirlo. Si el
+        almacenamiento es incremental solo se escriben esas reservaciones; si
+        no (o si no se indica ninguna), se guarda todo.
+        """
+        with self._cerrojo_pendientes:
+            if not self.almacenamiento.incremental or not reservaciones:
+                self._guardado_completo = True
+            for r in reservaciones:
+                self._sucias[r.id] = r
+                self._eliminadas.discard(r.id)
+        if self._escritor is not None:
+            self._escritor.marcar(len(reservaciones) or 1)
+
+    def _persistir_eliminacion(self, reservacion) -> None:
+        """Marca la eliminación de una reservación para escribirla"""
+        with self._cerrojo_pendientes:
+            if not self.almacenamiento.incremental:
+                self._guardado_completo = True
+            self._sucias.pop(reservacion.id, None)
+            self._eliminadas.add(reservacion.id)
+        if self._escritor is not None:
+            self._escritor.marcar()
+
+    def _escribir_pendientes(self) -> None:
+        """Escribe los cambios pendientes, salvo que los escriba la escritura diferida"""
+        if self._escritor is not None:
+            return
+        try:
+            self._volcar_pendientes()
+        except Exception as e:
+            print(f"Error al guardar las reservaciones: {str(e)}")
+
+    def _volcar_pendientes(self) -> None:
+        """
+        Escribe los cambios pendientes. Si falla, los cambios vuelven a quedar
+        pendientes y el error se propaga.
+        """
+        with self._cerrojo_persistencia:
+            with self._cerrojo_pendientes:
+                sucias, self._sucias = self._sucias, {}
+                eliminadas, self._eliminadas = self._eliminadas, set()
+                completo, self._guardado_completo = self._guardado_completo, False
+            if not (sucias or eliminadas or completo):
+                return
+            try:
+                if completo:
+                    with self._cerrojo.lectura():
+                        registros = self.reservaciones.registros()
+                    self.almacenamiento.guardar(registros)
+                    return
+                with self._cerrojo.lectura():
+                    registros = [r.to_dict() for r in sucias.values()]
+                if eliminadas:
+                    self.almacenamiento.eliminar(list(eliminadas))
+                if registros:
+                    self.almacenamiento.registrar(registros)
+            except Exception:
+                with self._cerrojo_pendientes:
+                    # Los cambios posteriores al intento tienen prioridad
+                    self._guardado_completo = self._guardado_completo or completo
+                    for id_reservacion, r in sucias.items():
+                        if id_reservacion not in self._eliminadas:
+                            self._sucias.setdefault(id_reservacion, r)
+                    self._eliminadas.update(i for i in eliminadas if i not in self._sucias)
+                raise
+
+    def _deserializar_reservacion(self, datos):
+        """
+        Convierte un diccionario en un objeto Reservacion
+        """
+        try:
+            # Validar que los datos necesarios existan
+            datos_usuario = datos.get("usuario")
+            datos_espacio = datos.get("espacio")
+            datos_horario = datos.get("horario")
+            
+            if not all([datos_usuario, datos_espacio, datos_horario]):
+                raise ValueError("Faltan datos obligatorios en la reservación")
+
+            # Resolver el usuario en el mapa de identidad o crearlo según su tipo
+            tipo_usuario = datos_usuario.get("rol", "").lower()
+            nombre_usuario = datos_usuario.get("nombre", "")
+            id_usuario = datos_usuario.get("id", "")
+
+            usuario = self._usuarios_canonicos.get(id_usuario) if id_usuario else None
+            if usuario is None:
+                if tipo_usuario == "estudiante":
+                    usuario = Estudiante(nombre_usuario)
+                    usuario.carrera = datos_usuario.get("carrera", "")
+                elif tipo_usuario == "profesor":
+                    usuario = Profesor(nombre_usuario)
+                    usuario.departamento = datos_usuario.get("departamento", "")
+                elif tipo_usuario == "administrativo":
+                    usuario = Administrativo(nombre_usuario)
+                elif tipo_usuario == "responsable_area":
+                    usuario = ResponsableArea(
+                        nombre_usuario,
+                        datos_usuario.get("unidad_academica", ""),
+                        areas_responsable=datos_usuario.get("areas_responsable", [])
+                    )
+                else:
+                    usuario = Usuario(nombre_usuario)
+
+                usuario.id = id_usuario
+                if id_usuario:
+                    self._usuarios_canonicos[id_usuario] = usuario
+
+            # Resolver el espacio en el mapa de identidad o crearlo según su tipo
+            tipo_espacio = datos_espacio.get("tipo", "").lower()
+            nombre_espacio = datos_espacio.get("nombre", "")
+            capacidad = datos_espacio.get("capacidad", 0)
+
+            espacio = self._espacios_canonicos.get(nombre_espacio.lower())
+            if espacio is None:
+                if tipo_espacio == "salon":
+                    espacio = Salon(nombre_espacio, capacidad)
+                elif tipo_espacio == "laboratorio":
+                    espacio = Laboratorio(nombre_espacio, capacidad)
+                elif tipo_espacio == "salajuntas":
+                    espacio = SalaJuntas(nombre_espacio, capacidad)
+                elif tipo_espacio == "auditorio":
+                    espacio = Auditorio(nombre_espacio, capacidad)
+                else:
+                    espacio = Salon(nombre_espacio, capacidad)  # Espacio por defecto
+                espacio.unidad_academica = datos_espacio.get("unidad_academica")
+                self._espacios_canonicos[nombre_espacio.lower()] = espacio
+
+            # Crear el horario
+            horario = Horario(
+                datos_horario.get("fecha", ""),
+                datos_horario.get("hora_inicio", ""),
+                datos_horario.get("hora_fin", "")
+            )
+
+            # Crear la reservación
+            reservacion = Reservacion(
+                usuario,
+                espacio,
+                horario,
+                datos.get("tipo_evento", ""),
+                datos.get("descripcion", "")
+            )
+
+            # Conservar el identificador y el estado
+            if datos.get("id"):
+                reservacion.id = datos["id"]
+            reservacion.estado = datos.get("estado", "pendiente")
+
+            return reservacion
+        except Exception as e:
+            print(f"Error al deserializar reservación: {e}")
+            print(f"Datos problemáticos: {datos}")
             return None
\ No newline at end of file
@@ -0,0 +1,101 @@
+import threading
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+class ColeccionPerezosa:
+    """
+    Colección de reservaciones que se hidratan al accederlas.
+
+    Guarda los registros tal como vienen del almacenamiento (diccionarios) y
+    solo construye el objeto Reservacion, con su Usuario, Espacio y Horario,
+    la primera vez que alguien lo pide. El objeto construido reemplaza al
+    registro, así que los accesos siguientes devuelven siempre el mismo objeto.
+    Los elementos se guardan por ID en orden de inserción.
+    """
+
+    def __init__(self, registros, hidratar: Callable[[dict], Optional[object]]):
+        """
+        Args:
+            registros: Diccionarios de reservación; cada uno debe tener "id"
+            hidratar: Función que convierte un registro en Reservacion (o None si falla)
+        """
+        self._hidratar = hidratar
+        self._elementos: Dict[str, object] = {r["id"]: r for r in registros}
+        # IDs en orden para el acceso por posición; se reconstruye tras eliminar
+        self._ids: Optional[List[str]] = None
+        self.hidratadas = 0
+        self.fallidas = 0
+        # Evita que dos lectores concurrentes construyan objetos distintos del mismo registro
+        self._cerrojo = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._elementos)
+
+    def __contains__(self, id_reservacion: str) -> bool:
+        return id_reservacion in self._elementos
+
+    def __iter__(self) -> Iterator:
+        """Recorre las reservaciones hidratando las que aún no lo están"""
+        for id_reservacion in list(self._elementos):
+            reservacion = self.obtener(id_reservacion)
+            if reservacion is not None:
+                yield reservacion
+
+    def __getitem__(self, indice):
+        """Acceso por posición, como en una lista (preferir obtener)"""
+        if self._ids is None:
+            self._ids = list(self._elementos)
+        ids = self._ids[indice]
+        if isinstance(indice, slice):
+            return [r for r in map(self.obtener, ids) if r is not None]
+        return self.obtener(ids)
+
+    def obtener(self, id_reservacion: str):
+        """
+        Obtiene una reservación por su ID, hidratándola si hace falta
+
+        Returns:
+            Reservacion, o None si no existe o su registro no es válido
+        """
+        elemento = self._elementos.get(id_reservacion)
+        if not isinstance(elemento, dict):
+            return elemento
+        with self._cerrojo:
+            elemento = self._elementos.get(id_reservacion)
+            if not isinstance(elemento, dict):
+                return elemento
+            reservacion = self._hidratar(elemento)
+            if reservacion is None:
+                self.fallidas += 1
+                return None
+            self._elementos[id_reservacion] = reservacion
+            self.hidratadas += 1
+            return reservacion
+
+    def append(self, reservacion) -> None:
+        if self._ids is not None and reservacion.id not in self._elementos:
+            self._ids.append(reservacion.id)
+        self._elementos[reservacion.id] = reservacion
+
+    def remove(self, reservacion) -> None:
+        if self._elementos.pop(reservacion.id, None) is None:
+            raise ValueError("La reservación no está en la colección")
+        self._ids = None
+
+    def elementos(self) -> Iterator:
+        """Recorre los elementos sin hidratarlos (registros u objetos ya construidos)"""
+        return iter(list(self._elementos.values()))
+
+    def registros(self) -> List[dict]:
+        """Diccionarios de todas las reservaciones; las no hidratadas se devuelven sin construirlas"""
+        # Se copian los valores primero: el volcado diferido los recorre desde otro hilo
+        return [e if isinstance(e, dict) else e.to_dict() for e in list(self._elementos.values())]
+
+    def estadisticas(self) -> dict:
+        """Contadores de hidratación"""
+        return {
+            "registros": len(self._elementos),
+            "hidratadas": self.hidratadas,
+            "sin_hidratar": sum(1 for e in self._elementos.values() if isinstance(e, dict)),
+            "fallidas": self.fallidas,
+        }
@@ -1,73 +1,124 @@
-from datetime import datetime, time
-
-class Horario:
-    def __init__(self, fecha, hora_inicio, hora_fin):
-        """
-        Inicializa un horario
-        Args:
-            fecha: Fecha en formato YYYY-MM-DD
-            hora_inicio: Hora de inicio en formato HH:MM
-            hora_fin: Hora de fin en formato HH:MM
-        """
-        # Validar y convertir la fecha
-        try:
-            if isinstance(fecha, str):
-                self._fecha = datetime.strptime(fecha, "%Y-%m-%d").date()
-            else:
-                self._fecha = fecha
-
-            # Validar y convertir las horas
-            if isinstance(hora_inicio, str):
-                self._hora_inicio = datetime.strptime(hora_inicio, "%H:%M").time()
-            else:
-                self._hora_inicio = hora_inicio
-
-            if isinstance(hora_fin, str):
-                self._hora_fin = datetime.strptime(hora_fin, "%H:%M").time()
-            else:
-                self._hora_fin = hora_fin
-
-            # Validar que la hora de fin sea posterior a la hora de inicio
-            if self._hora_fin <= self._hora_inicio:
-                raise ValueError("La hora de fin debe ser posterior a la hora de inicio")
-
-        except ValueError as e:
-            raise ValueError(f"El horario no es válido: {str(e)}")
-
-    @property
-    def fecha(self):
-        return self._fecha
-
-    @property
-    def hora_inicio(self):
-        return self._hora_inicio
-
-    @property
-    def hora_fin(self):
-        return self._hora_fin
-
-    def __str__(self):
-        return f"Fecha: {self._fecha}, Hora inicio: {self._hora_inicio}, Hora fin: {self._hora_fin}"
-
-    def to_dict(self):
-        """Convierte el horario a un diccionario"""
-        return {
-            'fecha': self._fecha.strftime("%Y-%m-%d"),
-            'hora_inicio': self._hora_inicio.strftime("%H:%M"),
-            'hora_fin': self._hora_fin.strftime("%H:%M")
-        }
-
-    @classmethod
-    def from_dict(cls, data):
-        """
-        Crea un horario desde un diccionario
-        Args:
-            data: Diccionario con los datos del horario
-        Returns:
-            Horario: Nueva instancia de Horario
-        """
-        return cls(
-            fecha=data['fecha'],
-            hora_inicio=data['hora_inicio'],
-            hora_fin=data['hora_fin']
-        )
\ No newline at end of file
+from datetime import datetime, date, time
+from functools import lru_cache
+
+
+# Las fechas y horas de los datos siempre usan los formatos fijos YYYY-MM-DD y
+# HH:MM, y hay pocos textos distintos (las horas del día, las fechas del
+# semestre), así que se interpretan a mano y se memorizan. Los textos con otra
+# forma se delegan a strptime, que acepta p. ej. "7:00".
+
+@lru_cache(maxsize=4096)
+def _parsear_fecha(texto: str) -> int:
+    """Convierte una fecha YYYY-MM-DD al ordinal de date"""
+    if len(texto) == 10 and texto[4] == "-" and texto[7] == "-" \
+            and texto[:4].isdigit() and texto[5:7].isdigit() and texto[8:].isdigit():
+        return date(int(texto[:4]), int(texto[5:7]), int(texto[8:])).toordinal()
+    return datetime.strptime(texto, "%Y-%m-%d").toordinal()
+
+
+@lru_cache(maxsize=2048)
+def _parsear_hora(texto: str) -> int:
+    """Convierte una hora HH:MM a minutos desde medianoche"""
+    if len(texto) == 5 and texto[2] == ":" and texto[:2].isdigit() and texto[3:].isdigit():
+        horas, minutos = int(texto[:2]), int(texto[3:])
+        if horas > 23 or minutos > 59:
+            raise ValueError(f"time data '{texto}' does not match format '%H:%M'")
+        return horas * 60 + minutos
+    hora = datetime.strptime(texto, "%H:%M")
+    return hora.hour * 60 + hora.minute
+
+
+class Horario:
+    # Representación compacta: la fecha como ordinal y las horas como minutos
+    # desde medianoche. Los objetos date/time y los textos se generan al pedirlos.
+    __slots__ = ('_ordinal', '_minuto_inicio', '_minuto_fin')
+
+    def __init__(self, fecha, hora_inicio, hora_fin):
+        """
+        Inicializa un horario
+        Args:
+            fecha: Fecha en formato YYYY-MM-DD
+            hora_inicio: Hora de inicio en formato HH:MM
+            hora_fin: Hora de fin en formato HH:MM
+        """
+        # Validar y convertir la fecha
+        try:
+            if isinstance(fecha, str):
+                self._ordinal = _parsear_fecha(fecha)
+            else:
+                self._ordinal = fecha.toordinal()
+
+            # Validar y convertir las horas
+            if isinstance(hora_inicio, str):
+                self._minuto_inicio = _parsear_hora(hora_inicio)
+            else:
+                self._minuto_inicio = hora_inicio.hour * 60 + hora_inicio.minute
+
+            if isinstance(hora_fin, str):
+                self._minuto_fin = _parsear_hora(hora_fin)
+            else:
+                self._minuto_fin = hora_fin.hour * 60 + hora_fin.minute
+
+            # Validar que la hora de fin sea posterior a la hora de inicio
+            if self._minuto_fin <= self._minuto_inicio:
+                raise ValueError("La hora de fin debe ser posterior a la hora de inicio")
+
+        except ValueError as e:
+            raise ValueError(f"El horario no es válido: {str(e)}")
+
+    @property
+    def fecha(self):
+        return date.fromordinal(self._ordinal)
+
+    @property
+    def hora_inicio(self):
+        return time(self._minuto_inicio // 60, self._minuto_inicio % 60)
+
+    @property
+    def hora_fin(self):
+        return time(self._minuto_fin // 60, self._minuto_fin % 60)
+
+    @property
+    def ordinal(self) -> int:
+        """Fecha como ordinal (date.toordinal)"""
+        return self._ordinal
+
+    @property
+    def minuto_inicio(self) -> int:
+        """Hora de inicio en minutos desde medianoche"""
+        return self._minuto_inicio
+
+    @property
+    def minuto_fin(self) -> int:
+        """Hora de fin en minutos desde medianoche"""
+        return self._minuto_fin
+
+    def es_valido(self):
+        """Verifica que la hora de fin sea posterior a la hora de inicio"""
+        return self._minuto_fin > self._minuto_inicio
+
+    def __str__(self):
+        return f"Fecha: {self.fecha}, Hora inicio: {self.hora_inicio}, Hora fin: {self.hora_fin}"
+
+    def to_dict(self):
+        """Convierte el horario a un diccionario"""
+        return {
+            'fecha': self.fecha.strftime("%Y-%m-%d"),
+            'hora_inicio': f"{self._minuto_inicio // 60:02d}:{self._minuto_inicio % 60:02d}",
+            'hora_fin': f"{self._minuto_fin // 60:02d}:{self._minuto_fin % 60:02d}"
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Crea un horario desde un diccionario
+        Args:
+            data: Diccionario con los datos del horario
+        Returns:
+            Horario: Nueva instancia de Horario
+        """
+        return cls(
+            fecha=data['fecha'],
+            hora_inicio=data['hora_inicio'],
+            hora_fin=data['hora_fin']
+        )
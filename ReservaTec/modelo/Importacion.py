@@ -0,0 +1,122 @@
+import csv
+import json
+from typing import Dict, Iterator, List, Tuple
+
+from modelo.Horarios import Horario
+from modelo.Reservaciones import Reservacion
+
+
+class ImportadorReservaciones:
+    """
+    Importa reservaciones en bloque (p. ej. el horario de clases del semestre)
+    desde CSV o JSON Lines.
+
+    Cada fila debe tener las columnas id_usuario, espacio, fecha, hora_inicio,
+    hora_fin, tipo_evento y, opcionalmente, descripcion. El archivo se lee fila
+    por fila; las filas válidas se agregan con un único
+    ``GestorReservaciones.agregar_lote``, que detecta los conflictos con los
+    datos existentes y dentro del propio archivo en una sola pasada ordenada y
+    persiste una sola vez.
+    """
+    FORMATOS = ["csv", "jsonl"]
+
+    def __init__(self, gestor, usuarios: Dict, espacios: Dict):
+        """
+        Args:
+            gestor: GestorReservaciones donde se agregan las reservaciones
+            usuarios: Diccionario id -> Usuario
+            espacios: Diccionario nombre -> Espacio
+        """
+        self.gestor = gestor
+        self.usuarios = usuarios
+        self.espacios = espacios
+
+    def importar(self, ruta: str, formato: str = None) -> List[dict]:
+        """
+        Importa un archivo de reservaciones
+
+        Args:
+            ruta: Ruta al archivo
+            formato: "csv" o "jsonl"; por defecto se deduce de la extensión
+
+        Returns:
+            List[dict]: Reporte por fila con las llaves fila, aceptada, motivo e id
+        """
+        if formato is None:
+            formato = "csv" if ruta.lower().endswith(".csv") else "jsonl"
+        if formato not in self.FORMATOS:
+            raise ValueError(f"Formato no válido. Formatos permitidos: {', '.join(self.FORMATOS)}")
+
+        filas = self._leer_csv(ruta) if formato == "csv" else self._leer_jsonl(ruta)
+        return self.importar_filas(filas)
+
+    def importar_filas(self, filas) -> List[dict]:
+        """
+        Importa filas ya leídas
+
+        Args:
+            filas: Iterable de pares (número de fila, diccionario)
+
+        Returns:
+            List[dict]: Reporte por fila
+        """
+        reporte = []
+        reservaciones = []
+        posiciones = []
+        for numero, datos in filas:
+            try:
+                reservacion = self._crear_reservacion(datos)
+            except KeyError as e:
+                reporte.append({"fila": numero, "aceptada": False,
+                                "motivo": f"Falta la columna {e}", "id": None})
+                continue
+            except ValueError as e:
+                reporte.append({"fila": numero, "aceptada": False, "motivo": str(e), "id": None})
+                continue
+            posiciones.append(len(reporte))
+            reporte.append({"fila": numero, "aceptada": False, "motivo": "", "id": reservacion.id})
+            reservaciones.append(reservacion)
+
+        resultados = self.gestor.agregar_lote(reservaciones)
+        for posicion, (exito, mensaje) in zip(posiciones, resultados):
+            reporte[posicion]["aceptada"] = exito
+            reporte[posicion]["motivo"] = mensaje
+            if not exito:
+                reporte[posicion]["id"] = None
+        return reporte
+
+    def _crear_reservacion(self, datos: dict) -> Reservacion:
+        if not isinstance(datos, dict):
+            raise ValueError("La fila no tiene un formato válido")
+
+        def campo(nombre):
+            return str(datos[nombre]).strip()
+
+        usuario = self.usuarios.get(campo("id_usuario"))
+        if usuario is None:
+            raise ValueError(f"Usuario no encontrado: {campo('id_usuario')}")
+        # Algunos nombres de espacio tienen espacios al final
+        espacio = self.espacios.get(str(datos["espacio"])) or self.espacios.get(campo("espacio"))
+        if espacio is None:
+            raise ValueError(f"Espacio no encontrado: {campo('espacio')}")
+
+        horario = Horario(campo("fecha"), campo("hora_inicio"), campo("hora_fin"))
+        return Reservacion(usuario, espacio, horario, campo("tipo_evento"),
+                           datos.get("descripcion") or "")
+
+    @staticmethod
+    def _leer_csv(ruta: str) -> Iterator[Tuple[int, dict]]:
+        with open(ruta, 'r', encoding='utf-8', newline='') as f:
+            # La fila 1 es el encabezado
+            for numero, fila in enumerate(csv.DictReader(f), start=2):
+                yield numero, fila
+
+    @staticmethod
+    def _leer_jsonl(ruta: str) -> Iterator[Tuple[int, dict]]:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            for numero, linea in enumerate(f, start=1):
+                if linea.strip():
+                    try:
+                        yield numero, json.loads(linea)
+                    except json.JSONDecodeError:
+                        yield numero, None
@@ -0,0 +1,203 @@
+from bisect import bisect_left, insort
+from typing import List, Optional
+
+
+class IndiceIntervalos:
+    """
+    Índice de los intervalos ocupados de cada espacio por fecha.
+
+    Para cada par (espacio, fecha) guarda una lista de tuplas
+    (inicio, fin, id_reservacion) ordenada por hora de inicio, de modo que
+    verificar un conflicto es una búsqueda binaria. Los nombres de espacio no
+    distinguen mayúsculas.
+    """
+
+    def __init__(self):
+        self._intervalos = {}
+        # Duración máxima registrada por (espacio, fecha): acota cuántos
+        # intervalos anteriores pueden seguir abiertos al inicio buscado
+        self._duracion_maxima = {}
+
+    @staticmethod
+    def clave(nombre_espacio: str, fecha) -> tuple:
+        return nombre_espacio.lower(), fecha
+
+    def agregar(self, nombre_espacio: str, fecha, inicio, fin, id_reservacion: str) -> None:
+        """Registra un intervalo ocupado"""
+        clave = self.clave(nombre_espacio, fecha)
+        insort(self._intervalos.setdefault(clave, []), (inicio, fin, id_reservacion))
+        if fin - inicio > self._duracion_maxima.get(clave, 0):
+            self._duracion_maxima[clave] = fin - inicio
+
+    def quitar(self, nombre_espacio: str, fecha, inicio, fin, id_reservacion: str) -> bool:
+        """
+        Elimina un intervalo ocupado
+
+        Returns:
+            bool: True si el intervalo estaba registrado
+        """
+        clave = self.clave(nombre_espacio, fecha)
+        lista = self._intervalos.get(clave)
+        if not lista:
+            return False
+        entrada = (inicio, fin, id_reservacion)
+        pos = bisect_left(lista, entrada)
+        if pos == len(lista) or lista[pos] != entrada:
+            return False
+        del lista[pos]
+        if not lista:
+            del self._intervalos[clave]
+            del self._duracion_maxima[clave]
+        return True
+
+    def buscar_conflicto(self, nombre_espacio: str, fecha, inicio, fin) -> Optional[str]:
+        """
+        Busca un intervalo registrado que se traslape con [inicio, fin)
+
+        Basta revisar el siguiente a la posición de inicio y los anteriores
+        que empiezan a menos de la duración máxima: normalmente solo el
+        inmediato, pero los datos cargados pueden traer traslapes y entonces
+        uno más largo puede seguir abierto detrás de otro más corto.
+
+        Returns:
+            Optional[str]: ID de la reservación en conflicto, o None
+        """
+        clave = self.clave(nombre_espacio, fecha)
+        lista = self._intervalos.get(clave)
+        if not lista:
+            return None
+        pos = bisect_left(lista, (inicio,))
+        if pos < len(lista) and lista[pos][0] < fin:
+            return lista[pos][2]
+        limite = inicio - self._duracion_maxima[clave]
+        pos -= 1
+        while pos >= 0 and lista[pos][0] > limite:
+            if lista[pos][1] > inicio:
+                return lista[pos][2]
+            pos -= 1
+        return None
+
+    def intervalos(self, nombre_espacio: str, fecha) -> List[tuple]:
+        """Intervalos ocupados de un espacio en una fecha, ordenados por inicio"""
+        return list(self._intervalos.get(self.clave(nombre_espacio, fecha), []))
+
+    def ids_por_espacio(self, nombre_espacio: str) -> List[str]:
+        """IDs de las reservaciones registradas de un espacio, en todas las fechas"""
+        nombre = nombre_espacio.lower()
+        return [id_reservacion
+                for (espacio, _), lista in self._intervalos.items() if espacio == nombre
+                for _, _, id_reservacion in lista]
+
+    def limpiar(self) -> None:
+        self._intervalos.clear()
+        self._duracion_maxima.clear()
+
+
+class IndiceCapacidad:
+    """
+    Índice de espacios ordenados por capacidad, por tipo de espacio.
+
+    Los tipos usan el nombre de la clase en minúsculas (salon, laboratorio,
+    salajuntas, auditorio), igual que los archivos de datos. Recorrer un tipo
+    desde la capacidad mínima pedida da los espacios del mejor al peor ajuste.
+    """
+
+    def __init__(self, espacios=()):
+        self._por_tipo = {}
+        self._todos = []
+        for espacio in espacios:
+            self.agregar(espacio)
+
+    @staticmethod
+    def tipo(espacio) -> str:
+        return espacio.__class__.__name__.lower()
+
+    def agregar(self, espacio) -> None:
+        entrada = (espacio.capacidad, espacio.nombre)
+        insort(self._por_tipo.setdefault(self.tipo(espacio), []), entrada)
+        insort(self._todos, entrada)
+
+    def quitar(self, espacio) -> None:
+        entrada = (espacio.capacidad, espacio.nombre)
+        for lista in (self._por_tipo.get(self.tipo(espacio), []), self._todos):
+            pos = bisect_left(lista, entrada)
+            if pos < len(lista) and lista[pos] == entrada:
+                del lista[pos]
+
+    def candidatos(self, tipo: Optional[str] = None, capacidad_minima: int = 0) -> List[str]:
+        """
+        Nombres de los espacios con capacidad suficiente, de menor a mayor capacidad
+
+        Args:
+            tipo: Tipo de espacio (opcional)
+            capacidad_minima: Capacidad mínima requerida
+        """
+        lista = self._todos if tipo is None else self._por_tipo.get(tipo.lower(), [])
+        pos = bisect_left(lista, (capacidad_minima,))
+        return [nombre for _, nombre in lista[pos:]]
+
+
+class BandejaAprobaciones:
+    """
+    Bandeja de reservaciones pendientes de cada responsable de área.
+
+    A partir de un mapa precalculado responsable -> espacios que puede
+    autorizar, mantiene para cada responsable la lista de reservaciones
+    pendientes de esos espacios ordenada por fecha y hora de inicio. Además
+    conserva todas las pendientes registradas, para repartirlas de nuevo
+    cuando cambian los responsables sin recorrer todas las reservaciones.
+    Como en IndiceIntervalos, los nombres de espacio no distinguen mayúsculas.
+    """
+
+    def __init__(self):
+        self._responsables_por_espacio = {}
+        self._pendientes = {}
+        self._registradas = {}
+
+    def configurar(self, responsables, espacios) -> None:
+        """
+        Calcula qué espacios puede autorizar cada responsable y vacía la bandeja
+
+        Args:
+            responsables: Objetos ResponsableArea
+            espacios: Objetos Espacio del catálogo
+        """
+        espacios = list(espacios)
+        self._responsables_por_espacio = {}
+        self._pendientes = {}
+        for responsable in responsables:
+            self._pendientes[responsable.id] = []
+            for espacio in espacios:
+                if responsable.puede_autorizar(espacio):
+                    self._responsables_por_espacio.setdefault(espacio.nombre.lower(), []).append(responsable.id)
+        for id_reservacion, (nombre_espacio, fecha, hora_inicio) in self._registradas.items():
+            self._repartir(nombre_espacio, fecha, hora_inicio, id_reservacion)
+
+    def vaciar(self) -> None:
+        """Vacía las bandejas conservando el mapa de responsables"""
+        self._registradas.clear()
+        for lista in self._pendientes.values():
+            lista.clear()
+
+    def agregar(self, nombre_espacio: str, fecha, hora_inicio, id_reservacion: str) -> None:
+        """Agrega una reservación pendiente a la bandeja de sus responsables"""
+        self._registradas[id_reservacion] = (nombre_espacio, fecha, hora_inicio)
+        self._repartir(nombre_espacio, fecha, hora_inicio, id_reservacion)
+
+    def _repartir(self, nombre_espacio: str, fecha, hora_inicio, id_reservacion: str) -> None:
+        for id_responsable in self._responsables_por_espacio.get(nombre_espacio.lower(), ()):
+            insort(self._pendientes[id_responsable], (fecha, hora_inicio, id_reservacion))
+
+    def quitar(self, nombre_espacio: str, fecha, hora_inicio, id_reservacion: str) -> None:
+        """Quita una reservación de la bandeja de sus responsables"""
+        self._registradas.pop(id_reservacion, None)
+        entrada = (fecha, hora_inicio, id_reservacion)
+        for id_responsable in self._responsables_por_espacio.get(nombre_espacio.lower(), ()):
+            lista = self._pendientes[id_responsable]
+            pos = bisect_left(lista, entrada)
+            if pos < len(lista) and lista[pos] == entrada:
+                del lista[pos]
+
+    def pendientes(self, id_responsable: str) -> List[str]:
+        """IDs de las reservaciones pendientes del responsable, por fecha y hora"""
+        return [id_reservacion for _, _, id_reservacion in self._pendientes.get(id_responsable, ())]
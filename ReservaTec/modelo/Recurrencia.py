@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+from typing import List
+
+
+class ReglaRecurrencia:
+    """
+    Regla para generar las fechas de una serie de reservaciones
+    (p. ej. un curso que usa el mismo salón todas las semanas del semestre).
+    """
+    FRECUENCIAS = ["diaria", "semanal"]
+
+    def __init__(self, fecha_inicio, fecha_fin, frecuencia="semanal", intervalo=1,
+                 dias_semana=None, excepciones=None):
+        """
+        Args:
+            fecha_inicio: Primera fecha de la serie (YYYY-MM-DD o date)
+            fecha_fin: Última fecha posible de la serie, inclusive
+            frecuencia: "diaria" o "semanal"
+            intervalo: Cada cuántos días o semanas se repite
+            dias_semana: Días de la semana (0 = lunes) para la frecuencia semanal;
+                por defecto, el día de la semana de fecha_inicio
+            excepciones: Fechas que se omiten (feriados, semana de exámenes, etc.)
+        """
+        if frecuencia not in self.FRECUENCIAS:
+            raise ValueError(f"Frecuencia no válida. Frecuencias permitidas: {', '.join(self.FRECUENCIAS)}")
+        if intervalo < 1:
+            raise ValueError("El intervalo debe ser mayor o igual a 1")
+
+        self.fecha_inicio = self._a_fecha(fecha_inicio)
+        self.fecha_fin = self._a_fecha(fecha_fin)
+        if self.fecha_fin < self.fecha_inicio:
+            raise ValueError("La fecha de fin debe ser posterior a la fecha de inicio")
+
+        self.frecuencia = frecuencia
+        self.intervalo = intervalo
+        self.dias_semana = sorted(set(dias_semana)) if dias_semana else [self.fecha_inicio.weekday()]
+        self.excepciones = {self._a_fecha(f) for f in (excepciones or [])}
+
+    @staticmethod
+    def _a_fecha(valor):
+        if isinstance(valor, str):
+            return datetime.strptime(valor, "%Y-%m-%d").date()
+        return valor
+
+    def fechas(self) -> List:
+        """
+        Genera las fechas de la serie en orden, sin las excepciones
+
+        Returns:
+            List[date]: Fechas de la serie
+        """
+        fechas = []
+        if self.frecuencia == "diaria":
+            fecha = self.fecha_inicio
+            while fecha <= self.fecha_fin:
+                fechas.append(fecha)
+                fecha += timedelta(days=self.intervalo)
+        else:
+            # Lunes de la semana de inicio; se avanza de 'intervalo' en 'intervalo' semanas
+            semana = self.fecha_inicio - timedelta(days=self.fecha_inicio.weekday())
+            while semana <= self.fecha_fin:
+                for dia in self.dias_semana:
+                    fecha = semana + timedelta(days=dia)
+                    if self.fecha_inicio <= fecha <= self.fecha_fin:
+                        fechas.append(fecha)
+                semana += timedelta(weeks=self.intervalo)
+
+        return [f for f in fechas if f not in self.excepciones]
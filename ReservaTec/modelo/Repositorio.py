@@ -0,0 +1,157 @@
+import json
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from modelo.Almacenamiento import AlmacenamientoJSON, _escribir_json
+
+
+class RepositorioCatalogo:
+    """
+    Repositorio de un catálogo (usuarios o espacios) guardado en un arreglo JSON.
+
+    Los registros en memoria son la fuente de verdad. Cada alta, cambio o
+    baja se anexa como una línea al diario (``<archivo>.diario``) en lugar de
+    leer, modificar y reescribir el archivo completo. Al acumular
+    ``umbral_compactacion`` entradas, el contenido en memoria se escribe como
+    nuevo arreglo JSON y el diario se vacía. Dentro de ``lote()`` las entradas
+    se acumulan y se anexan juntas al salir.
+
+    Los registros se leen del disco solo cuando hacen falta (al consultarlos
+    o al compactar), así que anexar cambios no requiere cargar el catálogo.
+    """
+
+    def __init__(self, archivo: str, clave: str, umbral_compactacion: int = 500):
+        """
+        Args:
+            archivo: Arreglo JSON del catálogo
+            clave: Campo que identifica cada registro ("id" o "nombre")
+            umbral_compactacion: Entradas del diario que provocan una compactación
+        """
+        self.archivo = archivo
+        self.archivo_diario = archivo + ".diario"
+        self.clave = clave
+        self.umbral_compactacion = umbral_compactacion
+        self._registros: Optional[Dict[str, dict]] = None
+        self._pendientes: Optional[List[dict]] = None
+        self.entradas_diario = self._contar_entradas()
+
+    def cargar(self) -> List[dict]:
+        """
+        Registros del catálogo (arreglo JSON más los cambios del diario)
+
+        Returns:
+            List[dict]: Registros en orden de alta
+        """
+        return list(self._obtener_registros().values())
+
+    def guardar(self, datos: dict) -> None:
+        """
+        Da de alta o reemplaza un registro
+
+        Args:
+            datos: Registro completo; debe incluir el campo clave
+        """
+        if self._registros is not None:
+            self._registros[datos[self.clave]] = datos
+        self._anexar({"op": "guardar", "registros": [datos]})
+
+    def eliminar(self, clave: str) -> None:
+        """
+        Da de baja un registro
+
+        Args:
+            clave: Valor del campo clave del registro
+        """
+        if self._registros is not None:
+            self._registros.pop(clave, None)
+        self._anexar({"op": "eliminar", "claves": [clave]})
+
+    @contextmanager
+    def lote(self):
+        """Agrupa los cambios hechos dentro del bloque en una sola escritura al diario"""
+        if self._pendientes is not None:
+            # Lote anidado: se integra al exterior
+            yield
+            return
+        self._pendientes = []
+        try:
+            yield
+        finally:
+            pendientes, self._pendientes = self._pendientes, None
+            if pendientes:
+                self._escribir_diario(pendientes)
+
+    def compactar(self) -> None:
+        """Escribe el catálogo completo y vacía el diario"""
+        registros = self._obtener_registros()
+        try:
+            _escribir_json(self.archivo, list(registros.values()))
+            with open(self.archivo_diario, 'w', encoding='utf-8'):
+                pass
+        except Exception as e:
+            print(f"Error al compactar {self.archivo}: {str(e)}")
+            return
+        self.entradas_diario = 0
+
+    def _obtener_registros(self) -> Dict[str, dict]:
+        if self._registros is None:
+            registros = {}
+            for datos in AlmacenamientoJSON(self.archivo).cargar():
+                registros[datos.get(self.clave)] = datos
+            for entrada in self._leer_diario():
+                self._aplicar(registros, entrada)
+            # Cambios de un lote en curso que aún no llegan al diario
+            for entrada in self._pendientes or ():
+                self._aplicar(registros, entrada)
+            self._registros = registros
+        return self._registros
+
+    def _anexar(self, entrada: dict) -> None:
+        if self._pendientes is not None:
+            self._pendientes.append(entrada)
+        else:
+            self._escribir_diario([entrada])
+
+    def _escribir_diario(self, entradas: List[dict]) -> None:
+        try:
+            with open(self.archivo_diario, 'a', encoding='utf-8') as f:
+                f.write("".join(json.dumps(e, ensure_ascii=False, separators=(',', ':')) + "\n"
+                                for e in entradas))
+        except Exception:
+            # Los registros en memoria ya incluyen los cambios: se descartan
+            # para volver a leerlos del disco y el error llega a quien hizo el cambio
+            self._registros = None
+            raise
+
+        self.entradas_diario += len(entradas)
+        if self.entradas_diario >= self.umbral_compactacion:
+            self.compactar()
+
+    def _leer_diario(self):
+        try:
+            with open(self.archivo_diario, 'r', encoding='utf-8') as f:
+                for linea in f:
+                    linea = linea.strip()
+                    if not linea:
+                        continue
+                    try:
+                        yield json.loads(linea)
+                    except json.JSONDecodeError:
+                        print("Entrada del diario dañada, se ignora")
+        except FileNotFoundError:
+            return
+
+    def _contar_entradas(self) -> int:
+        try:
+            with open(self.archivo_diario, 'rb') as f:
+                return sum(1 for linea in f if linea.strip())
+        except FileNotFoundError:
+            return 0
+
+    def _aplicar(self, registros: dict, entrada: dict) -> None:
+        if entrada.get("op") == "guardar":
+            for datos in entrada.get("registros", []):
+                registros[datos.get(self.clave)] = datos
+        elif entrada.get("op") == "eliminar":
+            for clave in entrada.get("claves", []):
+                registros.pop(clave, None)
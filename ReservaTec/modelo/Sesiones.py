@@ -0,0 +1,132 @@
+import secrets
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Dict, Optional
+
+
+class Sesion:
+    """Sesión iniciada de un usuario"""
+    __slots__ = ("token", "usuario", "inicio", "ultimo_acceso")
+
+    def __init__(self, token: str, usuario, inicio: float):
+        self.token = token
+        self.usuario = usuario
+        self.inicio = inicio
+        self.ultimo_acceso = inicio
+
+
+class GestorSesiones:
+    """
+    Sesiones de varios usuarios sobre un mismo conjunto de datos cargado.
+
+    Cada inicio de sesión emite un token aleatorio asociado al usuario. Los
+    usuarios se buscan en un diccionario por ID y las sesiones en otro por
+    token, así que iniciar sesión y resolver un token son O(1). Una sesión
+    expira tras ``inactividad`` segundos sin usarse; las sesiones se guardan
+    en orden de último acceso, de modo que purgar las expiradas solo recorre
+    las que efectivamente expiraron.
+    """
+
+    def __init__(self, usuarios_por_id: Dict[str, object], inactividad: float = 30 * 60):
+        """
+        Args:
+            usuarios_por_id: Diccionario ID -> Usuario (se comparte, no se copia)
+            inactividad: Segundos sin uso tras los que expira una sesión
+        """
+        self.usuarios_por_id = usuarios_por_id
+        self.inactividad = inactividad
+        self._sesiones: "OrderedDict[str, Sesion]" = OrderedDict()
+        self._cerrojo = threading.Lock()
+
+    def iniciar(self, id_usuario: str, tipo_usuario: str = None) -> tuple:
+        """
+        Inicia una sesión
+
+        Args:
+            id_usuario: Identificador del usuario
+            tipo_usuario: Tipo de usuario (opcional)
+
+        Returns:
+            tuple: (éxito, mensaje, token); el token es None si no se inició
+        """
+        usuario = self.usuarios_por_id.get(id_usuario)
+        if usuario is None:
+            return False, "Usuario no encontrado", None
+        if tipo_usuario and usuario.rol != tipo_usuario:
+            return False, "El tipo de usuario no coincide", None
+
+        token = secrets.token_urlsafe(32)
+        with self._cerrojo:
+            ahora = monotonic()
+            self._purgar(ahora)
+            self._sesiones[token] = Sesion(token, usuario, ahora)
+        return True, f"Sesión iniciada como {usuario.rol}: {usuario.nombre}", token
+
+    def obtener(self, token: str):
+        """
+        Resuelve un token y renueva su vigencia
+
+        Returns:
+            Usuario de la sesión, o None si el token no existe o expiró
+        """
+        with self._cerrojo:
+            sesion = self._sesiones.get(token)
+            if sesion is None:
+                return None
+            ahora = monotonic()
+            if ahora - sesion.ultimo_acceso > self.inactividad:
+                del self._sesiones[token]
+                return None
+            sesion.ultimo_acceso = ahora
+            self._sesiones.move_to_end(token)
+            return sesion.usuario
+
+    def cerrar(self, token: str) -> bool:
+        """
+        Cierra una sesión
+
+        Returns:
+            bool: True si la sesión existía
+        """
+        with self._cerrojo:
+            return self._sesiones.pop(token, None) is not None
+
+    def cerrar_de_usuario(self, id_usuario: str) -> int:
+        """
+        Cierra todas las sesiones de un usuario (p. ej. al eliminarlo)
+
+        Returns:
+            int: Sesiones cerradas
+        """
+        with self._cerrojo:
+            tokens = [t for t, s in self._sesiones.items() if s.usuario.id == id_usuario]
+            for token in tokens:
+                del self._sesiones[token]
+            return len(tokens)
+
+    def purgar_expiradas(self) -> int:
+        """
+        Elimina las sesiones expiradas
+
+        Returns:
+            int: Sesiones eliminadas
+        """
+        with self._cerrojo:
+            return self._purgar(monotonic())
+
+    def activas(self) -> int:
+        """Número de sesiones vigentes"""
+        with self._cerrojo:
+            self._purgar(monotonic())
+            return len(self._sesiones)
+
+    def _purgar(self, ahora: float) -> int:
+        eliminadas = 0
+        while self._sesiones:
+            token, sesion = next(iter(self._sesiones.items()))
+            if ahora - sesion.ultimo_acceso <= self.inactividad:
+                break
+            del self._sesiones[token]
+            eliminadas += 1
+        return eliminadas
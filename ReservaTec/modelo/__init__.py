@@ -1,13 +1,37 @@
-from .Espacios import Espacio, Salon, Laboratorio, SalaJuntas, Auditorio
-from .Usuarios import Usuario, Estudiante, Profesor, Administrativo, ResponsableArea
-from .Horarios import Horario
-from .Reservaciones import Reservacion
-from .GestorReservaciones1 import GestorReservaciones
-
-__all__ = [
-    'Espacio', 'Salon', 'Laboratorio', 'SalaJuntas', 'Auditorio',
-    'Usuario', 'Estudiante', 'Profesor', 'Administrativo', 'ResponsableArea',
-    'Horario',
-    'Reservacion',
-    'GestorReservaciones'
+from .Espacios import Espacio, Salon, Laboratorio, SalaJuntas, Auditorio
+from .Usuarios import Usuario, Estudiante, Profesor, Administrativo, ResponsableArea
+from .Horarios import Horario
+from .Reservaciones import Reservacion
+from .Recurrencia import ReglaRecurrencia
+from .Importacion import ImportadorReservaciones
+from .GestorReservaciones1 import GestorReservaciones
+from .Disponibilidad import MatrizOcupacion, CacheDisponibilidad
+from .Hidratacion import ColeccionPerezosa
+from .Cache import CacheArranque
+from .Repositorio import RepositorioCatalogo
+from .EscrituraDiferida import EscritorDiferido
+from .Concurrencia import CerrojoLectoresEscritores, CerrojosPorClave
+from .Sesiones import GestorSesiones
+from .Coalescencia import ColaReservaciones
+from .Almacenamiento import (AlmacenamientoJSON, AlmacenamientoDiario, AlmacenamientoParticionado,
+                             AlmacenamientoSQLite, crear_almacenamiento)
+
+__all__ = [
+    'Espacio', 'Salon', 'Laboratorio', 'SalaJuntas', 'Auditorio',
+    'Usuario', 'Estudiante', 'Profesor', 'Administrativo', 'ResponsableArea',
+    'Horario',
+    'Reservacion',
+    'ReglaRecurrencia',
+    'ImportadorReservaciones',
+    'GestorReservaciones',
+    'MatrizOcupacion', 'CacheDisponibilidad',
+    'ColeccionPerezosa',
+    'CacheArranque',
+    'RepositorioCatalogo',
+    'EscritorDiferido',
+    'CerrojoLectoresEscritores', 'CerrojosPorClave',
+    'GestorSesiones',
+    'ColaReservaciones',
+    'AlmacenamientoJSON', 'AlmacenamientoDiario', 'AlmacenamientoParticionado', 'AlmacenamientoSQLite',
+    'crear_almacenamiento'
 ]
\ No newline at end of file
@@ -0,0 +1,2 @@
+from .servidor_http import ServidorReservaciones
+__all__ = ['ServidorReservaciones']
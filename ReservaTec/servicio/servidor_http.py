@@ -0,0 +1,376 @@
+"""
+Servicio HTTP/JSON de ReservaTec
+--------------------------------
+Servidor asyncio (solo biblioteca estándar) sobre un ControladorTec en modo
+concurrente. Las conexiones son persistentes (keep-alive) y cada operación
+del controlador, que puede leer o escribir archivos, se ejecuta en un pool
+de hilos para no detener el ciclo de eventos.
+
+Rutas:
+    POST   /sesiones                       {"id_usuario", "tipo_usuario"?} -> {"token"}
+    DELETE /sesiones                       cierra la sesión del encabezado
+    GET    /espacios                       ?tipo&capacidad&fecha&hora_inicio&hora_fin&limite
+    GET    /disponibilidad                 ?espacio&fecha
+    GET    /reservaciones                  reservaciones del usuario de la sesión
+    POST   /reservaciones                  {"espacio", "fecha", "hora_inicio", "hora_fin",
+                                            "tipo_evento", "descripcion"?}
+    POST   /reservaciones/aprobar          {"ids": [...]}
+    POST   /reservaciones/<id>/aprobar
+    POST   /reservaciones/<id>/cancelar
+
+Las rutas que actúan como un usuario requieren el encabezado
+``Authorization: Bearer <token>``.
+
+Uso (desde el directorio ReservaTec):
+    python -m servicio.servidor_http [--host 127.0.0.1] [--puerto 8080]
+"""
+
+import argparse
+import asyncio
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from controlador.controlador_tec import ControladorTec
+
+# Límites de cada solicitud
+MAX_ENCABEZADOS = 100
+MAX_CUERPO = 1 << 20
+
+
+class ErrorSolicitud(Exception):
+    """Solicitud inválida; se responde con el estado indicado"""
+
+    def __init__(self, estado: HTTPStatus, mensaje: str):
+        super().__init__(mensaje)
+        self.estado = estado
+        self.mensaje = mensaje
+
+
+class ServidorReservaciones:
+    """
+    Servidor HTTP/JSON asyncio sobre un ControladorTec
+    """
+
+    def __init__(self, controlador: ControladorTec, host: str = "127.0.0.1", puerto: int = 8080,
+                 hilos: int = 8, inactividad_conexion: float = 30):
+        """
+        Args:
+            controlador: Controlador compartido; debe crearse con concurrente=True
+            host: Dirección en la que se escucha
+            puerto: Puerto (0 para elegir uno libre)
+            hilos: Hilos del pool que ejecuta las operaciones del controlador
+            inactividad_conexion: Segundos que se mantiene abierta una conexión sin solicitudes
+        """
+        self.controlador = controlador
+        self.host = host
+        self.puerto = puerto
+        self.inactividad_conexion = inactividad_conexion
+        self._ejecutor = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="ReservaTec")
+        self._servidor = None
+        self._rutas = [
+            ("POST", re.compile(r"/sesiones"), self._abrir_sesion),
+            ("DELETE", re.compile(r"/sesiones"), self._cerrar_sesion),
+            ("GET", re.compile(r"/espacios"), self._buscar_espacios),
+            ("GET", re.compile(r"/disponibilidad"), self._disponibilidad),
+            ("GET", re.compile(r"/reservaciones"), self._reservaciones_usuario),
+            ("POST", re.compile(r"/reservaciones"), self._crear_reservacion),
+            ("POST", re.compile(r"/reservaciones/aprobar"), self._aprobar_reservaciones),
+            ("POST", re.compile(r"/reservaciones/(?P<id>[^/]+)/aprobar"), self._aprobar_reservacion),
+            ("POST", re.compile(r"/reservaciones/(?P<id>[^/]+)/cancelar"), self._cancelar_reservacion),
+        ]
+
+    async def iniciar(self) -> None:
+        """Comienza a aceptar conexiones; si se pidió el puerto 0, ``puerto`` toma el asignado"""
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.puerto)
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+
+    async def servir(self) -> None:
+        """Inicia el servidor y atiende hasta que se cancele"""
+        if self._servidor is None:
+            await self.iniciar()
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def detener(self) -> None:
+        """Deja de aceptar conexiones y espera a las operaciones en curso"""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+        self._ejecutor.shutdown(wait=True)
+
+    # ------------------------------------------------------------------
+    # Protocolo HTTP/1.1
+    # ------------------------------------------------------------------
+
+    async def _atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    solicitud = await asyncio.wait_for(self._leer_solicitud(lector),
+                                                       self.inactividad_conexion)
+                except asyncio.TimeoutError:
+                    break
+                except ErrorSolicitud as e:
+                    self._escribir_respuesta(escritor, e.estado, {"exito": False, "mensaje": e.mensaje}, False)
+                    await escritor.drain()
+                    break
+                if solicitud is None:
+                    break
+
+                metodo, objetivo, version, encabezados, cuerpo = solicitud
+                estado, datos = await self._despachar(metodo, objetivo, encabezados, cuerpo)
+                mantener = self._mantener_conexion(version, encabezados)
+                self._escribir_respuesta(escritor, estado, datos, mantener)
+                await escritor.drain()
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _leer_solicitud(self, lector: asyncio.StreamReader) -> Optional[tuple]:
+        """
+        Lee una solicitud completa
+
+        Returns:
+            Optional[tuple]: (método, objetivo, versión, encabezados, cuerpo), o None
+                si el cliente cerró la conexión
+        """
+        linea = await self._leer_linea(lector)
+        if not linea.strip():
+            return None
+        try:
+            metodo, objetivo, version = linea.decode("latin-1").split()
+        except ValueError:
+            raise ErrorSolicitud(HTTPStatus.BAD_REQUEST, "Línea de solicitud inválida")
+
+        encabezados = {}
+        while True:
+            linea = await self._leer_linea(lector)
+            if linea in (b"\r\n", b"\n", b""):
+                break
+            if len(encabezados) >= MAX_ENCABEZADOS:
+                raise ErrorSolicitud(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Demasiados encabezados")
+            nombre, _, valor = linea.decode("latin-1").partition(":")
+            encabezados[nombre.strip().lower()] = valor.strip()
+
+        if "transfer-encoding" in encabezados:
+            # El cuerpo por fragmentos no se interpreta: se leería como la siguiente solicitud
+            raise ErrorSolicitud(HTTPStatus.NOT_IMPLEMENTED, "Transfer-Encoding no soportado")
+        try:
+            longitud = int(encabezados.get("content-length", 0))
+        except ValueError:
+            raise ErrorSolicitud(HTTPStatus.BAD_REQUEST, "Content-Length inválido")
+        if longitud < 0:
+            raise ErrorSolicitud(HTTPStatus.BAD_REQUEST, "Content-Length inválido")
+        if longitud > MAX_CUERPO:
+            raise ErrorSolicitud(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Cuerpo demasiado grande")
+        cuerpo = await lector.readexactly(longitud) if longitud else b""
+        return metodo.upper(), objetivo, version.upper(), encabezados, cuerpo
+
+    @staticmethod
+    async def _leer_linea(lector: asyncio.StreamReader) -> bytes:
+        # readline convierte el exceso del límite del lector en ValueError
+        try:
+            return await lector.readline()
+        except ValueError:
+            raise ErrorSolicitud(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Línea de solicitud o encabezado demasiado larga")
+
+    @staticmethod
+    def _mantener_conexion(version: str, encabezados: dict) -> bool:
+        conexion = encabezados.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            return conexion == "keep-alive"
+        return conexion != "close"
+
+    @staticmethod
+    def _escribir_respuesta(escritor: asyncio.StreamWriter, estado: HTTPStatus, datos, mantener: bool) -> None:
+        cuerpo = json.dumps(datos, ensure_ascii=False, default=str).encode("utf-8")
+        encabezados = (
+            f"HTTP/1.1 {estado.value} {estado.phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(cuerpo)}\r\n"
+            f"Connection: {'keep-alive' if mantener else 'close'}\r\n\r\n"
+        )
+        escritor.write(encabezados.encode("latin-1") + cuerpo)
+
+    async def _despachar(self, metodo: str, objetivo: str, encabezados: dict, cuerpo: bytes) -> tuple:
+        """
+        Ejecuta la ruta correspondiente en el pool de hilos
+
+        Returns:
+            tuple: (estado HTTP, datos JSON)
+        """
+        partes = urlsplit(objetivo)
+        ruta = unquote(partes.path).rstrip("/") or "/"
+        metodos_ruta = []
+        for metodo_ruta, patron, manejador in self._rutas:
+            coincidencia = patron.fullmatch(ruta)
+            if not coincidencia:
+                continue
+            metodos_ruta.append(metodo_ruta)
+            if metodo_ruta != metodo:
+                continue
+            try:
+                solicitud = {
+                    "ruta": coincidencia.groupdict(),
+                    "consulta": {k: v[-1] for k, v in parse_qs(partes.query).items()},
+                    "cuerpo": self._leer_json(cuerpo),
+                    "token": self._token(encabezados),
+                }
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._ejecutor, manejador, solicitud)
+            except ErrorSolicitud as e:
+                return e.estado, {"exito": False, "mensaje": e.mensaje}
+            except ValueError as e:
+                return HTTPStatus.BAD_REQUEST, {"exito": False, "mensaje": str(e)}
+            except Exception as e:
+                print(f"Error al atender {metodo} {ruta}: {str(e)}")
+                return HTTPStatus.INTERNAL_SERVER_ERROR, {"exito": False, "mensaje": "Error interno"}
+        if metodos_ruta:
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"exito": False, "mensaje": "Método no permitido"}
+        return HTTPStatus.NOT_FOUND, {"exito": False, "mensaje": "Ruta no encontrada"}
+
+    @staticmethod
+    def _leer_json(cuerpo: bytes):
+        if not cuerpo:
+            return {}
+        try:
+            datos = json.loads(cuerpo)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise ErrorSolicitud(HTTPStatus.BAD_REQUEST, "El cuerpo no es JSON válido")
+        if not isinstance(datos, dict):
+            raise ErrorSolicitud(HTTPStatus.BAD_REQUEST, "El cuerpo debe ser un objeto JSON")
+        return datos
+
+    @staticmethod
+    def _token(encabezados: dict) -> Optional[str]:
+        tipo, _, token = encabezados.get("authorization", "").partition(" ")
+        return token.strip() if tipo.lower() == "bearer" and token.strip() else None
+
+    # ------------------------------------------------------------------
+    # Rutas (se ejecutan en el pool de hilos)
+    # ------------------------------------------------------------------
+
+    def _sesion(self, solicitud: dict) -> str:
+        """Token de la solicitud; falla si no hay sesión vigente"""
+        token = solicitud["token"]
+        if not token or self.controlador.sesiones.obtener(token) is None:
+            raise ErrorSolicitud(HTTPStatus.UNAUTHORIZED, "Sesión no válida o expirada")
+        return token
+
+    @staticmethod
+    def _campo(datos: dict, nombre: str, tipo: type = str):
+        valor = datos.get(nombre)
+        if valor in (None, ""):
+            raise ErrorSolicitud(HTTPStatus.BAD_REQUEST, f"Falta el campo '{nombre}'")
+        if not isinstance(valor, tipo):
+            raise ErrorSolicitud(HTTPStatus.BAD_REQUEST, f"El campo '{nombre}' no tiene el tipo esperado")
+        return valor
+
+    @staticmethod
+    def _resultado(exito: bool, mensaje: str, estado_exito=HTTPStatus.OK,
+                   estado_fallo=HTTPStatus.CONFLICT) -> tuple:
+        return (estado_exito if exito else estado_fallo), {"exito": exito, "mensaje": mensaje}
+
+    def _abrir_sesion(self, solicitud: dict) -> tuple:
+        cuerpo = solicitud["cuerpo"]
+        exito, mensaje, token = self.controlador.abrir_sesion(
+            self._campo(cuerpo, "id_usuario"), cuerpo.get("tipo_usuario")
+        )
+        if not exito:
+            return HTTPStatus.UNAUTHORIZED, {"exito": False, "mensaje": mensaje}
+        return HTTPStatus.CREATED, {"exito": True, "mensaje": mensaje, "token": token}
+
+    def _cerrar_sesion(self, solicitud: dict) -> tuple:
+        self.controlador.cerrar_sesion(self._sesion(solicitud))
+        return HTTPStatus.OK, {"exito": True, "mensaje": "Sesión cerrada"}
+
+    def _buscar_espacios(self, solicitud: dict) -> tuple:
+        consulta = solicitud["consulta"]
+        espacios = self.controlador.buscar_espacios(
+            tipo=consulta.get("tipo"),
+            capacidad_minima=int(consulta.get("capacidad", 0)),
+            fecha=consulta.get("fecha"),
+            hora_inicio=consulta.get("hora_inicio"),
+            hora_fin=consulta.get("hora_fin"),
+            limite=int(consulta["limite"]) if "limite" in consulta else None,
+        )
+        return HTTPStatus.OK, [e.to_dict() for e in espacios]
+
+    def _disponibilidad(self, solicitud: dict) -> tuple:
+        consulta = solicitud["consulta"]
+        franjas = self.controlador.obtener_disponibilidad(self._campo(consulta, "espacio"),
+                                                          self._campo(consulta, "fecha"))
+        if franjas is None:
+            raise ErrorSolicitud(HTTPStatus.NOT_FOUND, "Espacio no encontrado")
+        return HTTPStatus.OK, franjas
+
+    def _reservaciones_usuario(self, solicitud: dict) -> tuple:
+        reservaciones = self.controlador.obtener_reservaciones_usuario(sesion=self._sesion(solicitud))
+        return HTTPStatus.OK, [r.to_dict() for r in reservaciones]
+
+    def _crear_reservacion(self, solicitud: dict) -> tuple:
+        token = self._sesion(solicitud)
+        cuerpo = solicitud["cuerpo"]
+        exito, mensaje = self.controlador.crear_reservacion(
+            self._campo(cuerpo, "espacio"), self._campo(cuerpo, "fecha"),
+            self._campo(cuerpo, "hora_inicio"), self._campo(cuerpo, "hora_fin"),
+            self._campo(cuerpo, "tipo_evento"), cuerpo.get("descripcion", ""), sesion=token
+        )
+        return self._resultado(exito, mensaje, HTTPStatus.CREATED)
+
+    def _aprobar(self, token: str, ids) -> tuple:
+        resultados = self.controlador.aprobar_reservaciones(ids, sesion=token)
+        return HTTPStatus.OK, [{"id": i, "exito": exito, "mensaje": mensaje}
+                               for i, exito, mensaje in resultados]
+
+    def _aprobar_reservaciones(self, solicitud: dict) -> tuple:
+        ids = self._campo(solicitud["cuerpo"], "ids", list)
+        if not all(isinstance(id_reservacion, str) for id_reservacion in ids):
+            raise ErrorSolicitud(HTTPStatus.BAD_REQUEST, "'ids' debe ser una lista de textos")
+        return self._aprobar(self._sesion(solicitud), ids)
+
+    def _aprobar_reservacion(self, solicitud: dict) -> tuple:
+        _, [resultado] = self._aprobar(self._sesion(solicitud), [solicitud["ruta"]["id"]])
+        return self._resultado(resultado["exito"], resultado["mensaje"])
+
+    def _cancelar_reservacion(self, solicitud: dict) -> tuple:
+        exito, mensaje = self.controlador.cancelar_reservacion(
+            solicitud["ruta"]["id"], sesion=self._sesion(solicitud)
+        )
+        return self._resultado(exito, mensaje)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servicio HTTP/JSON de ReservaTec")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8080)
+    parser.add_argument("--hilos", type=int, default=8)
+    parser.add_argument("--modo", default="json", help="Modo de almacenamiento de las reservaciones")
+    argumentos = parser.parse_args()
+
+    controlador = ControladorTec(modo_almacenamiento=argumentos.modo, concurrente=True)
+    servidor = ServidorReservaciones(controlador, argumentos.host, argumentos.puerto, argumentos.hilos)
+
+    async def ejecutar():
+        await servidor.iniciar()
+        print(f"Servicio ReservaTec en http://{servidor.host}:{servidor.puerto}")
+        try:
+            await servidor.servir()
+        finally:
+            await servidor.detener()
+
+    try:
+        asyncio.run(ejecutar())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
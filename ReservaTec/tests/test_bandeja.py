@@ -0,0 +1,59 @@
+"""
+Pruebas de la bandeja de aprobaciones
+-------------------------------------
+Los nombres de espacio no distinguen mayúsculas: una reservación guardada
+como "a101" pertenece al espacio A101 del catálogo y a la bandeja de su
+responsable.
+
+Uso:
+    python -m unittest discover -s tests
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelo.Espacios import Salon
+from modelo.GestorReservaciones1 import GestorReservaciones
+from modelo.Horarios import Horario
+from modelo.Reservaciones import Reservacion
+from modelo.Usuarios import Profesor, ResponsableArea
+
+
+class PruebaBandejaMayusculas(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.archivo = os.path.join(self.directorio, "reservas.json")
+        self.salon = Salon("A101", 30)
+        self.salon.unidad_academica = "FI"
+        self.responsable = ResponsableArea("Responsable", "FI", areas_responsable=["A101"])
+        self.responsable.id = "RESP001"
+        profesor = Profesor("Profesor", "FI")
+        profesor.id = "PROF001"
+        # Registro guardado con el nombre del espacio en minúsculas
+        registro = Reservacion(profesor, Salon("a101", 30), Horario("2030-03-04", "10:00", "11:00"), "clase")
+        with open(self.archivo, "w", encoding="utf-8") as f:
+            json.dump([registro.to_dict()], f)
+        self.id_reservacion = registro.id
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_pendiente_en_minusculas_llega_al_responsable(self):
+        gestor = GestorReservaciones(self.archivo, espacios=[self.salon])
+        gestor.configurar_responsables([self.responsable], [self.salon])
+        self.assertEqual([r.id for r in gestor.obtener_bandeja("RESP001")], [self.id_reservacion])
+
+        [(_, exito, _)] = gestor.aprobar_reservaciones([self.id_reservacion], self.responsable)
+        self.assertTrue(exito)
+        self.assertEqual(gestor.obtener_bandeja("RESP001"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
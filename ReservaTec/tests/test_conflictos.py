@@ -0,0 +1,90 @@
+"""
+Pruebas de la detección de conflictos
+-------------------------------------
+Los datos cargados pueden traer reservaciones activas traslapadas; la
+verificación de conflictos debe seguir encontrando la más larga aunque otra
+más corta empiece después de ella.
+
+Uso:
+    python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelo.Espacios import Salon
+from modelo.GestorReservaciones1 import GestorReservaciones
+from modelo.Horarios import Horario
+from modelo.Indices import IndiceIntervalos
+from modelo.Reservaciones import Reservacion
+from modelo.Usuarios import Profesor
+
+
+def _minutos(hora: str) -> int:
+    horas, minutos = hora.split(":")
+    return int(horas) * 60 + int(minutos)
+
+
+class PruebaIndiceIntervalos(unittest.TestCase):
+
+    def test_intervalo_largo_detras_de_uno_corto(self):
+        indice = IndiceIntervalos()
+        indice.agregar("A101", 1, _minutos("08:00"), _minutos("20:00"), "largo")
+        indice.agregar("A101", 1, _minutos("09:00"), _minutos("09:30"), "corto")
+        self.assertEqual(indice.buscar_conflicto("A101", 1, _minutos("15:00"), _minutos("16:00")), "largo")
+        self.assertIsNotNone(indice.buscar_conflicto("a101", 1, _minutos("09:15"), _minutos("09:20")))
+        self.assertIsNone(indice.buscar_conflicto("A101", 1, _minutos("20:00"), _minutos("21:00")))
+
+    def test_quitar_el_intervalo_largo(self):
+        indice = IndiceIntervalos()
+        indice.agregar("A101", 1, _minutos("08:00"), _minutos("20:00"), "largo")
+        indice.agregar("A101", 1, _minutos("09:00"), _minutos("09:30"), "corto")
+        indice.quitar("A101", 1, _minutos("08:00"), _minutos("20:00"), "largo")
+        self.assertIsNone(indice.buscar_conflicto("A101", 1, _minutos("15:00"), _minutos("16:00")))
+        self.assertEqual(indice.buscar_conflicto("A101", 1, _minutos("09:00"), _minutos("10:00")), "corto")
+
+
+class PruebaGestorTraslapes(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.archivo = os.path.join(self.directorio, "reservas.json")
+        self.profesor = Profesor("Profesor", "FI")
+        self.profesor.id = "PROF001"
+        self.salon = Salon("A101", 30)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def _reservacion(self, hora_inicio: str, hora_fin: str) -> Reservacion:
+        reservacion = Reservacion(self.profesor, self.salon, Horario("2030-03-03", hora_inicio, hora_fin), "clase")
+        reservacion.estado = "aprobada"
+        return reservacion
+
+    def test_no_acepta_reservacion_dentro_de_un_traslape_cargado(self):
+        # Dos reservaciones activas traslapadas escritas directamente en los datos
+        registros = [self._reservacion("08:00", "20:00").to_dict(), self._reservacion("09:00", "09:30").to_dict()]
+        with open(self.archivo, "w", encoding="utf-8") as f:
+            json.dump(registros, f)
+
+        salida = io.StringIO()
+        with contextlib.redirect_stdout(salida):
+            gestor = GestorReservaciones(self.archivo)
+            aceptada = gestor.agregar_reservacion(
+                Reservacion(self.profesor, self.salon, Horario("2030-03-03", "15:00", "16:00"), "clase")
+            )
+        self.assertFalse(aceptada)
+        self.assertIn("se traslapan", salida.getvalue())
+        self.assertFalse(gestor.esta_disponible("A101", Horario("2030-03-03", "15:00", "16:00")))
+
+
+if __name__ == "__main__":
+    unittest.main()